@@ -0,0 +1,444 @@
+"""Benchmarks for book-sbd.
+
+startup: time-to-first-output for each CLI subcommand. Every sample runs in
+a fresh interpreter, so import cost (stage modules, NLTK, the Punkt model)
+is included exactly as a user would see it.
+
+extract: XHTML-to-text throughput of each text extractor (stdlib
+html.parser vs lxml) over the spine documents of a directory of EPUBs,
+both converting whole documents and running chapter extraction as ingest
+does. Spine documents are read before timing starts, so only extraction is
+measured, and every extractor's output is checked to be identical.
+
+pipeline: per-stage wall time of process_book over a directory of EPUBs
+(run as `book-sbd bench`), read from its observer events, so the numbers
+are the real pipeline's. Each book runs in a fresh worker process, so its
+peak RSS is its own, and each stage reports its best time over the
+repeats. Results can be checked against a stored baseline.
+
+  python -m book_sbd.bench startup [--repeat N] [--epub <epub>] [--json <out>]
+  python -m book_sbd.bench extract <epub-dir> [--repeat N] [--json <out>]
+  book-sbd bench <epub-dir> [--repeat N] [--json <out>] [--baseline <json>]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Subcommand name -> CLI argv. Each is timed until its first byte of stdout.
+STARTUP_COMMANDS: dict[str, list[str]] = {
+    "help": ["--help"],
+    "run": ["run", "--help"],
+    "batch": ["batch", "--help"],
+    "eval": ["eval", "--help"],
+    "cache": ["cache", "stats", "{tmpdir}"],
+}
+
+
+def _cli_env() -> dict:
+    """Environment for child CLIs with this package importable."""
+    env = dict(os.environ)
+    # Pipes are block-buffered; match the line-buffered terminal behaviour
+    env["PYTHONUNBUFFERED"] = "1"
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (src_dir, env.get("PYTHONPATH")) if p
+    )
+    return env
+
+
+def time_to_first_output(argv: list[str], env: dict | None = None) -> float:
+    """Seconds from process spawn until the CLI writes its first stdout byte."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "book_sbd.cli", *argv],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env or _cli_env(),
+    )
+    proc.stdout.read(1)
+    elapsed = time.perf_counter() - start
+    proc.stdout.read()
+    proc.wait()
+    return elapsed
+
+
+def measure_startup(
+    commands: dict[str, list[str]] | None = None,
+    repeat: int = 5,
+) -> dict[str, dict]:
+    """Time-to-first-output per subcommand: min/median/max over repeat runs."""
+    commands = commands if commands is not None else STARTUP_COMMANDS
+    env = _cli_env()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, argv in commands.items():
+            argv = [a.replace("{tmpdir}", tmpdir) for a in argv]
+            samples = [time_to_first_output(argv, env) for _ in range(repeat)]
+            results[name] = {
+                "argv": argv,
+                "min_s": min(samples),
+                "median_s": statistics.median(samples),
+                "max_s": max(samples),
+            }
+    return results
+
+
+def _cmd_startup(args) -> None:
+    commands = dict(STARTUP_COMMANDS)
+    if args.epub:
+        # A real run: first output is "Processing: ..." before any heavy stage
+        commands["run-epub"] = ["run", args.epub, "--output-dir", "{tmpdir}"]
+
+    results = measure_startup(commands, repeat=args.repeat)
+    print(f"{'command':12s} {'min':>9s} {'median':>9s} {'max':>9s}")
+    for name, r in results.items():
+        print(
+            f"{name:12s} {r['min_s'] * 1000:7.1f}ms {r['median_s'] * 1000:7.1f}ms "
+            f"{r['max_s'] * 1000:7.1f}ms"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+def _best_of(repeat: int, fn) -> tuple[float, object]:
+    """(fastest wall time, result of the last call) over repeat calls."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure_extract(epub_paths: list[str], repeat: int = 3) -> dict[str, dict]:
+    """Best-of-repeat XHTML-to-text timings per text extractor.
+
+    "documents" converts every spine document whole; "chapters" runs
+    extract_chapters() as ingest does (fragment slicing, boilerplate and
+    heading stripping included). Returns {extractor: {"documents_s",
+    "chapters_s", "chars", "chars_per_s", "chapters"}}, where chars counts
+    the XHTML characters of every spine document and chars_per_s is the
+    whole-document rate. Raises ValueError if the extractors disagree.
+    """
+    from .ingest.epub_parser import parse_epub
+    from .ingest.lxml_text import XhtmlText
+    from .ingest.structure import TEXT_EXTRACTORS, extract_chapters, html_to_text
+
+    books = []
+    for path in epub_paths:
+        with parse_epub(path) as epub_data:
+            for item in epub_data.spine_items:
+                item.content  # read and decode now, outside the timed region
+        books.append((os.path.basename(path).replace(".epub", ""), epub_data))
+    documents = [item.content for _slug, e in books for item in e.spine_items]
+    chars = sum(len(html) for html in documents)
+    convert = {
+        "stdlib": html_to_text,
+        "lxml": lambda html: XhtmlText(html).text(),
+    }
+
+    results = {}
+    reference = None
+    for extractor in TEXT_EXTRACTORS:
+        documents_s, texts = _best_of(
+            repeat, lambda: [convert[extractor](html) for html in documents],
+        )
+        chapters_s, chapters = _best_of(repeat, lambda: [
+            [(ch.label, ch.text) for ch in extract_chapters(e, slug=slug, extractor=extractor)]
+            for slug, e in books
+        ])
+        if reference is None:
+            reference = (texts, chapters)
+        elif (texts, chapters) != reference:
+            raise ValueError(f"{extractor} extractor output differs from {TEXT_EXTRACTORS[0]}")
+        results[extractor] = {
+            "documents_s": documents_s,
+            "chapters_s": chapters_s,
+            "chars": chars,
+            "chars_per_s": chars / documents_s if documents_s else 0.0,
+            "chapters": sum(len(book) for book in chapters),
+        }
+    return results
+
+
+def _cmd_extract(args) -> None:
+    import glob
+
+    epubs = sorted(glob.glob(os.path.join(args.epub_dir, "*.epub")))
+    if not epubs:
+        sys.exit(f"No EPUBs in {args.epub_dir}")
+    results = measure_extract(epubs, repeat=args.repeat)
+    base = results["stdlib"]
+    print(f"{len(epubs)} books, {base['chars'] / 1e6:.1f}M XHTML chars, {base['chapters']} chapters")
+    print(f"{'extractor':10s} {'documents':>10s} {'Mchars/s':>9s} {'chapters':>10s} {'speedup':>8s}")
+    for name, r in results.items():
+        speedup = base["chapters_s"] / r["chapters_s"] if r["chapters_s"] else 0.0
+        print(
+            f"{name:10s} {r['documents_s'] * 1000:8.1f}ms {r['chars_per_s'] / 1e6:9.2f} "
+            f"{r['chapters_s'] * 1000:8.1f}ms {speedup:7.2f}x"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+# Pipeline stages in run order, as timed by measure_book from process_book's
+# observer events (see observe.py): the setup, ingest and export stages, and
+# the steps of the segment stage. "canonicalize" includes text modes;
+# "number" builds, types and numbers the sentence dicts.
+PIPELINE_STAGES = (
+    "setup", "ingest", "canonicalize", "segment", "patch", "number", "export",
+)
+_SEGMENT_STEPS = ("canonicalize", "segment", "patch", "number")
+
+
+def _peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB (None if unavailable)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _timed_run(
+    epub_path: str,
+    meta_path: str,
+    segmenter,
+    extractor: str,
+    output_dir: str,
+) -> tuple[dict[str, float], float, dict]:
+    """One pass of process_book: ({stage: seconds}, total seconds, book_data).
+
+    Runs the real pipeline (no stage cache, so every stage runs) and reads
+    the timings from its observer events.
+    """
+    from .cli import process_book
+    from .observe import MemoryObserver
+
+    observer = MemoryObserver()
+    book_data = process_book(
+        epub_path, meta_path, output_dir=output_dir, segmenter=segmenter,
+        extractor=extractor, observer=observer,
+    )
+    times = {
+        stage: observer.stage_seconds.get(stage, 0.0)
+        for stage in ("setup", "ingest", "export")
+    }
+    for step in _SEGMENT_STEPS:
+        times[step] = observer.step_seconds.get(step, 0.0)
+    total = observer.books[book_data["slug"]]["seconds"]
+    return {stage: times[stage] for stage in PIPELINE_STAGES}, total, book_data
+
+
+def measure_book(job: tuple[str, str, int, str, str]) -> dict:
+    """Benchmark one book: best-of-repeat seconds per stage and throughput.
+
+    job is (epub_path, meta_path, repeat, backend, extractor). Meant to run
+    in its own process (see measure_pipeline) so peak_rss_kb covers only
+    this book, the interpreter and the segmenter model.
+    """
+    from .segment.base import get_segmenter
+
+    epub_path, meta_path, repeat, backend, extractor = job
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    segmenter = get_segmenter(backend)
+    # Load the model outside the timed region, as batch workers do
+    segmenter.segment_many(["Warm up."])
+
+    best = dict.fromkeys(PIPELINE_STAGES, float("inf"))
+    best_total = float("inf")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for _ in range(repeat):
+            times, total, book_data = _timed_run(
+                epub_path, meta_path, segmenter, extractor, output_dir,
+            )
+            for stage, seconds in times.items():
+                best[stage] = min(best[stage], seconds)
+            best_total = min(best_total, total)
+
+    chapters = book_data["processed_chapters"]
+    chars = sum(len(ch["canonical_text"]) for ch in chapters)
+    sentences = sum(len(ch["sentences"]) for ch in chapters)
+    return {
+        "slug": book_data["slug"],
+        "chapters": len(chapters),
+        "chars": chars,
+        "sentences": sentences,
+        "stages_s": best,
+        "total_s": best_total,
+        "chars_per_s": chars / best_total if best_total else 0.0,
+        "sentences_per_s": sentences / best_total if best_total else 0.0,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def measure_pipeline(
+    epub_paths: list[str],
+    repeat: int = 3,
+    backend: str = "punkt",
+    extractor: str = "stdlib",
+) -> dict:
+    """Per-stage pipeline benchmark over books with a {slug}_meta.json.
+
+    Books run one at a time, each in a fresh process
+    (Pool(maxtasksperchild=1)), so timings don't contend and peak RSS is
+    per book. Returns {"config", "books": {slug: measure_book record},
+    "totals"}, where totals sums stage times and sizes over all books and
+    takes the largest peak RSS.
+    """
+    from multiprocessing import Pool
+
+    from . import __version__
+
+    jobs = []
+    for path in epub_paths:
+        meta_path = path[:-len(".epub")] + "_meta.json"
+        if os.path.exists(meta_path):
+            jobs.append((path, meta_path, repeat, backend, extractor))
+
+    with Pool(processes=1, maxtasksperchild=1) as pool:
+        records = pool.map(measure_book, jobs, chunksize=1)
+
+    stages = {
+        stage: sum(r["stages_s"][stage] for r in records) for stage in PIPELINE_STAGES
+    }
+    chars = sum(r["chars"] for r in records)
+    sentences = sum(r["sentences"] for r in records)
+    total = sum(r["total_s"] for r in records)
+    peaks = [r["peak_rss_kb"] for r in records if r["peak_rss_kb"] is not None]
+    return {
+        "config": {
+            "pipeline_version": __version__,
+            "backend": backend,
+            "extractor": extractor,
+            "repeat": repeat,
+        },
+        "books": {r["slug"]: r for r in records},
+        "totals": {
+            "books": len(records),
+            "chars": chars,
+            "sentences": sentences,
+            "stages_s": stages,
+            "total_s": total,
+            "chars_per_s": chars / total if total else 0.0,
+            "sentences_per_s": sentences / total if total else 0.0,
+            "peak_rss_kb": max(peaks) if peaks else None,
+        },
+    }
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float = 0.10) -> list[str]:
+    """Regressions of results against a stored measure_pipeline result.
+
+    A time (per stage or in total, corpus-wide and per book present in
+    both) or a peak RSS regresses when it exceeds the baseline by more than
+    threshold (0.10 = 10%). Returns one message per regression.
+    """
+    regressions = []
+
+    def check(label: str, new, old, scale: float, unit: str) -> None:
+        if new is None or not old:
+            return
+        if new > old * (1 + threshold):
+            regressions.append(
+                f"{label}: {new * scale:.1f}{unit} vs baseline {old * scale:.1f}{unit} "
+                f"(+{(new / old - 1) * 100:.1f}%)"
+            )
+
+    def check_record(prefix: str, new: dict, old: dict) -> None:
+        for stage in PIPELINE_STAGES:
+            check(f"{prefix}{stage}", new["stages_s"].get(stage),
+                  old.get("stages_s", {}).get(stage), 1000, "ms")
+        check(f"{prefix}total", new["total_s"], old.get("total_s"), 1000, "ms")
+        check(f"{prefix}peak_rss", new["peak_rss_kb"], old.get("peak_rss_kb"), 1 / 1024, "MB")
+
+    check_record("", results["totals"], baseline.get("totals", {}))
+    for slug, record in results["books"].items():
+        if slug in baseline.get("books", {}):
+            check_record(f"{slug}: ", record, baseline["books"][slug])
+    return regressions
+
+
+def run_pipeline_bench(args) -> None:
+    """`book-sbd bench`: measure, print, write JSON, compare to a baseline."""
+    import glob
+
+    epubs = sorted(glob.glob(os.path.join(args.epub_dir, "*.epub")))
+    if not epubs:
+        sys.exit(f"No EPUBs in {args.epub_dir}")
+    results = measure_pipeline(
+        epubs, repeat=args.repeat, backend=args.backend, extractor=args.extractor,
+    )
+
+    print(f"{'book':30s} {'total':>9s} {'kchars/s':>9s} {'sents/s':>9s} {'peak RSS':>10s}")
+    rows = list(results["books"].items()) + [("TOTAL", results["totals"])]
+    for slug, r in rows:
+        rss = f"{r['peak_rss_kb'] / 1024:8.1f}MB" if r["peak_rss_kb"] is not None else "         -"
+        print(
+            f"{slug:30s} {r['total_s'] * 1000:7.1f}ms {r['chars_per_s'] / 1000:9.1f} "
+            f"{r['sentences_per_s']:9.0f} {rss}"
+        )
+    total = results["totals"]["total_s"]
+    print("\nPer stage (all books, best of each):")
+    for stage, seconds in results["totals"]["stages_s"].items():
+        share = seconds / total * 100 if total else 0.0
+        print(f"  {stage:14s} {seconds * 1000:9.1f}ms {share:5.1f}%")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    from .cli import _positive_int
+
+    parser = argparse.ArgumentParser(prog="python -m book_sbd.bench")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p_startup = sub.add_parser("startup", help="Time-to-first-output per subcommand")
+    p_startup.add_argument("--repeat", type=_positive_int, default=5, help="Samples per command")
+    p_startup.add_argument("--epub", help="Also time a real `run` on this EPUB")
+    p_startup.add_argument("--json", help="Write results to this JSON file")
+
+    p_extract = sub.add_parser("extract", help="XHTML text extraction throughput per extractor")
+    p_extract.add_argument("epub_dir", help="Directory containing EPUB files")
+    p_extract.add_argument("--repeat", type=_positive_int, default=3, help="Samples per extractor")
+    p_extract.add_argument("--json", help="Write results to this JSON file")
+
+    args = parser.parse_args(argv)
+    if args.bench == "startup":
+        _cmd_startup(args)
+    elif args.bench == "extract":
+        _cmd_extract(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Content-addressed on-disk cache for pipeline stage outputs.
+
+Entries are keyed on (EPUB sha256, stage name, pipeline version, stage
+fingerprint), so an unchanged book re-run with unchanged code and settings
+reads every stage from disk instead of recomputing it. Fingerprints chain
+through upstream stages (see pipeline.stage_fingerprints), so a change only
+invalidates the stages at and after the one it touches.
+
+Layout:
+  <root>/objects/<key[:2]>/<key>.<stage>.json
+
+Each entry is a small JSON envelope around the stage value. Reads refresh
+the entry's mtime, and the cache is kept under a byte budget by evicting the
+least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+from . import __version__
+
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+# Fraction of max_bytes a put-triggered prune evicts down to
+PRUNE_TARGET = 0.9
+
+_SIZE_SUFFIXES = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def config_hash(config: Any) -> str:
+    """Stable hash of a JSON-able stage config (sets/tuples/patterns allowed)."""
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if hasattr(obj, "pattern"):  # compiled regex
+        return [obj.pattern, obj.flags]
+    return repr(obj)
+
+
+def parse_size(value: str) -> int:
+    """Parse a byte size such as '1048576', '500M' or '2G'."""
+    value = value.strip().upper().removesuffix("B")
+    if value and value[-1] in _SIZE_SUFFIXES:
+        return int(float(value[:-1]) * _SIZE_SUFFIXES[value[-1]])
+    return int(value)
+
+
+class StageCache:
+    """Size-bounded LRU cache of stage outputs on disk."""
+
+    def __init__(self, root: str, max_bytes: int | None = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._objects = os.path.join(root, "objects")
+        # Running total of entry sizes, from one scan on the first put and
+        # then adjusted per write; rescanned by every prune. Other processes
+        # writing the same cache are only seen at the next prune.
+        self._bytes: int | None = None
+
+    def key(self, epub_sha: str, stage: str, stage_config_hash: str) -> str:
+        """Content address for one stage output of one book."""
+        raw = "\0".join([epub_sha, stage, __version__, stage_config_hash])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, stage: str) -> str:
+        return os.path.join(self._objects, key[:2], f"{key}.{stage}.json")
+
+    def get(self, epub_sha: str, stage: str, stage_config_hash: str) -> Any | None:
+        """Return the cached value, or None on a miss."""
+        path = self._path(self.key(epub_sha, stage, stage_config_hash), stage)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    def put(self, epub_sha: str, stage: str, stage_config_hash: str, value: Any) -> None:
+        """Store a stage value, then evict old entries if over budget.
+
+        The budget check uses the running size total, so a put only walks
+        the cache when it pushes the total over max_bytes. Eviction then
+        goes down to PRUNE_TARGET of the budget, so the puts that follow
+        don't each trigger another walk.
+        """
+        path = self._path(self.key(epub_sha, stage, stage_config_hash), stage)
+        entry = {
+            "epub_sha256": epub_sha,
+            "stage": stage,
+            "pipeline_version": __version__,
+            "config_hash": stage_config_hash,
+            "value": value,
+        }
+        if self.max_bytes is not None and self._bytes is None:
+            self._bytes = sum(size for _m, size, _s, _p in self._entries())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so concurrent batch workers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            if self._bytes is not None:
+                self._bytes += os.path.getsize(tmp_path)
+                if os.path.exists(path):
+                    self._bytes -= os.path.getsize(path)  # rewritten entry
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        if self.max_bytes is not None and self._bytes > self.max_bytes:
+            self.prune(int(self.max_bytes * PRUNE_TARGET))
+
+    def _entries(self) -> list[tuple[float, int, str, str]]:
+        """List (mtime, size, stage, path) for every entry."""
+        entries = []
+        if not os.path.isdir(self._objects):
+            return entries
+        for dirpath, _dirnames, filenames in os.walk(self._objects):
+            for name in filenames:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue  # evicted by another process
+                stage = name[:-len(".json")].split(".", 1)[-1]
+                entries.append((st.st_mtime, st.st_size, stage, path))
+        return entries
+
+    def stats(self) -> dict:
+        """Summarize entry counts and sizes, overall and per stage."""
+        entries = self._entries()
+        per_stage: dict[str, dict] = {}
+        for _mtime, size, stage, _path in entries:
+            s = per_stage.setdefault(stage, {"entries": 0, "bytes": 0})
+            s["entries"] += 1
+            s["bytes"] += size
+        return {
+            "root": self.root,
+            "entries": len(entries),
+            "bytes": sum(size for _m, size, _s, _p in entries),
+            "max_bytes": self.max_bytes,
+            "stages": dict(sorted(per_stage.items())),
+        }
+
+    def prune(self, max_bytes: int) -> tuple[int, int]:
+        """Evict least recently used entries until total size <= max_bytes.
+
+        Returns (entries_removed, bytes_freed).
+        """
+        entries = self._entries()
+        total = sum(size for _m, size, _s, _p in entries)
+        self._bytes = total
+        if total <= max_bytes:
+            return 0, 0
+
+        removed = 0
+        freed = 0
+        for _mtime, size, _stage, path in sorted(entries):
+            if total - freed <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            removed += 1
+            freed += size
+        self._bytes = total - freed
+        return removed, freed
+
+
+class BookStages:
+    """One book's view of a StageCache.
+
+    Binds the EPUB hash and per-stage fingerprints, and records whether each
+    stage was served from the cache or recomputed. With cache=None every
+    lookup misses and stores are dropped, so callers need no special casing.
+    """
+
+    def __init__(
+        self,
+        cache: StageCache | None,
+        epub_sha: str | None = None,
+        fingerprints: dict[str, str] | None = None,
+    ):
+        self.cache = cache
+        self.epub_sha = epub_sha
+        self.fingerprints = fingerprints or {}
+        self.status: dict[str, str] = {}
+
+    def get(self, stage: str) -> Any | None:
+        if self.cache is None:
+            return None
+        value = self.cache.get(self.epub_sha, stage, self.fingerprints[stage])
+        if value is not None:
+            self.status[stage] = "cached"
+        return value
+
+    def put(self, stage: str, value: Any) -> None:
+        self.status[stage] = "run"
+        if self.cache is not None:
+            self.cache.put(self.epub_sha, stage, self.fingerprints[stage], value)
+
+    def summary(self) -> str:
+        """e.g. 'ingest=cached canonical=cached baseline=cached spans=run'."""
+        return " ".join(f"{stage}={state}" for stage, state in self.status.items())
@@ -9,7 +9,9 @@ Rules (applied in order):
 6. Normalize 3+ consecutive blank lines to exactly 2
 7. Strip leading/trailing whitespace from overall text
 
-Canonicalization is idempotent: canon(canon(x)) == canon(x).
+Canonicalization is idempotent: canon(canon(x)) == canon(x). Text that is
+already canonical (is_canonical) is returned as is, after a few scans that
+never rebuild the string.
 """
 
 from __future__ import annotations
@@ -18,8 +20,39 @@ import re
 import unicodedata
 
 
+# Runs of 2+ spaces, after tabs have become spaces: together the same as
+# collapsing every [ \t]+ run to one space, but with a literal prefix the
+# regex engine can scan for instead of stopping at every single space.
+_SPACE_RUN_RE = re.compile(r"  +")
+_BLANK_LINES_RE = re.compile(r"\n\n\n+")
+
+
+def _lines_are_rstripped(lines: list[str]) -> bool:
+    # str.rstrip() returns the line itself when there is nothing to strip,
+    # so the list comparison is an identity check per line
+    return list(map(str.rstrip, lines)) == lines
+
+
+def is_canonical(text: str) -> bool:
+    """True if canonicalize(text) would return text unchanged."""
+    return (
+        "\r" not in text
+        and "\ufeff" not in text
+        and "\t" not in text
+        and "  " not in text
+        and "\n\n\n" not in text
+        and text == text.strip()
+        and unicodedata.is_normalized("NFC", text)
+        and _lines_are_rstripped(text.split("\n"))
+    )
+
+
 def canonicalize(text: str) -> str:
     """Apply all canonicalization rules to text."""
+    # Canonicalization is idempotent, so canonical input is returned as is
+    if is_canonical(text):
+        return text
+
     # 1. Normalize newlines
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
@@ -27,23 +60,18 @@ def canonicalize(text: str) -> str:
     text = text.replace("\ufeff", "")
 
     # 3. Unicode NFC normalization
-    text = unicodedata.normalize("NFC", text)
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
 
-    # 4+5. Per-line: trim trailing whitespace, collapse internal spaces/tabs
+    # 4+5. Collapse internal spaces/tabs, then trim trailing whitespace per
+    # line (str.rstrip, so any Unicode whitespace, as before)
+    text = _SPACE_RUN_RE.sub(" ", text.replace("\t", " "))
     lines = text.split("\n")
-    processed = []
-    for line in lines:
-        # Collapse internal whitespace runs to single space
-        line = re.sub(r"[ \t]+", " ", line)
-        # Trim trailing whitespace (and leading for consistency)
-        line = line.rstrip()
-        processed.append(line)
-    text = "\n".join(processed)
+    if not _lines_are_rstripped(lines):
+        text = "\n".join(map(str.rstrip, lines))
 
     # 6. Normalize 3+ consecutive blank lines to exactly 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     # 7. Strip leading/trailing whitespace from overall text
-    text = text.strip()
-
-    return text
+    return text.strip()
@@ -1,9 +1,19 @@
 """CLI entry points for book-sbd.
 
 Commands:
-  book-sbd run <epub> [--meta <meta.json>] [--output-dir <dir>]
-  book-sbd batch <epub-dir> [--output-dir <dir>]
-  book-sbd eval <gold-dir> [--epub-dir <dir>]
+  book-sbd run <epub> [--meta <meta.json>] [--output-dir <dir>] [--chapter-jobs N]
+               [--cache-dir <dir>] [--format <fmt> ...] [--extractor stdlib|lxml]
+               [--backend punkt|regex] [--events <log.jsonl>]
+  book-sbd batch <epub-dir> [--output-dir <dir>] [--jobs N] [--cache-dir <dir>]
+                 [--format <fmt> ...] [--extractor stdlib|lxml] [--backend punkt|regex]
+                 [--events <log.jsonl>]
+  book-sbd eval <gold-dir> [--epub-dir <dir>] [--backend punkt|regex ...] [--jobs N]
+                [--cache-dir <dir>] [--extractor stdlib|lxml] [--tolerance N]
+                [--metrics-json <out>]
+  book-sbd cache stats|prune <cache-dir>
+  book-sbd inspect <epub>
+  book-sbd validate <output-dir> [--jobs N]
+  book-sbd bench <epub-dir> [--repeat N] [--json <out>] [--baseline <json>] [--threshold F]
 """
 
 from __future__ import annotations
@@ -15,16 +25,15 @@ import os
 import sys
 import time
 
-from .canonicalize import canonicalize
-from .export import export_book
-from .ingest.epub_parser import parse_epub
-from .ingest.structure import extract_chapters
-from .invariants import validate_book
-from .numbering import number_chapters, number_sentences
-from .pipeline import ingest_book, write_chapter_units_json, check_license_leakage
-from .segment.punkt_backend import PunktSegmenter
-from .segment.patch_rules import apply_patch_rules
-from .segment.text_modes import apply_text_modes, get_sentence_type
+from typing import TYPE_CHECKING
+
+# Stage modules (and NLTK behind the Punkt backend) are imported inside the
+# functions that need them, so `book-sbd --help` and light subcommands start
+# without paying for them.
+if TYPE_CHECKING:
+    from .cache import StageCache
+    from .observe import Observer
+    from .segment.base import Segmenter
 
 
 def process_book(
@@ -33,18 +42,89 @@ def process_book(
     build_dir: str | None = None,
     output_dir: str | None = None,
     verbose: bool = False,
+    segmenter: Segmenter | None = None,
+    chapter_jobs: int = 1,
+    cache: StageCache | None = None,
+    formats: tuple[str, ...] = ("json",),
+    extractor: str = "stdlib",
+    backend: str = "punkt",
+    observer: Observer | None = None,
 ) -> dict:
     """Run the full pipeline on a single book.
 
+    A pre-built segmenter may be passed in so callers processing many books
+    (e.g. batch workers) load the tokenizer once. With chapter_jobs > 1,
+    chapters are segmented in a process pool and reassembled in order.
+    With a cache, each stage whose fingerprint is unchanged is read from
+    disk, and only the invalidated stages downstream of it are re-run.
+    formats selects the files written to output_dir ("json", "jsonl",
+    "compact", "store", "parquet"); JSONL
+    records are appended chapter by chapter as segmentation proceeds.
+    extractor picks the XHTML-to-text implementation used at ingest
+    ("stdlib" or "lxml"; both produce the same text). backend names the
+    segmenter to build when none is passed in ("punkt" or "regex").
+    observer receives structured timing and counter events (see observe.py);
+    with None, no events are built.
+
     Returns the processed book data dict.
     """
+    from .cache import BookStages
+    from .export import export_book, open_sentences_jsonl, write_chapter_jsonl
+    from .numbering import number_chapters, number_sentences
+    from .pipeline import (
+        build_sentences,
+        chapters_from_json,
+        chapters_to_json,
+        ingest_book,
+        iter_chapter_spans,
+        sha256_file,
+        stage_fingerprints,
+        write_chapter_units_json,
+    )
+
     slug = os.path.basename(epub_path).replace(".epub", "")
     if verbose:
         print(f"Processing: {slug}")
+    if observer is not None:
+        book_t0 = time.perf_counter()
+        observer.event("book_start", slug=slug, bytes_in=os.path.getsize(epub_path))
+        observer.event("stage_start", slug=slug, stage="setup")
+
+    if segmenter is None:
+        from .segment.base import get_segmenter
+        segmenter = get_segmenter(backend)
+
+    stages = BookStages(None)
+    if cache is not None:
+        stages = BookStages(
+            cache, sha256_file(epub_path), stage_fingerprints(slug, segmenter, extractor),
+        )
+
+    if observer is not None:
+        ingest_t0 = time.perf_counter()
+        observer.event("stage_end", slug=slug, stage="setup", seconds=ingest_t0 - book_t0)
+        observer.event("stage_start", slug=slug, stage="ingest")
 
     # Stage 1: Ingest
-    book_data = ingest_book(epub_path, meta_path)
+    cached = stages.get("ingest")
+    if cached is not None:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        book_data = {
+            "slug": slug,
+            "meta": meta,
+            "chapters": chapters_from_json(cached),
+        }
+    else:
+        book_data = ingest_book(epub_path, meta_path, extractor=extractor)
+        stages.put("ingest", chapters_to_json(book_data["chapters"]))
     chapters = book_data["chapters"]
+    if observer is not None:
+        observer.event(
+            "stage_end", slug=slug, stage="ingest",
+            seconds=time.perf_counter() - ingest_t0, chapters=len(chapters),
+            chars_out=sum(len(ch.text) for ch in chapters),
+        )
 
     if verbose:
         print(f"  Chapters: {len(chapters)}")
@@ -53,58 +133,148 @@ def process_book(
     if build_dir:
         write_chapter_units_json(book_data, build_dir)
 
-    # Stage 2+3+5: Canonicalize -> Segment -> Patch
-    segmenter = PunktSegmenter()
-    processed_chapters = []
+    # Stage 2+3+5: Canonicalize -> Segment -> Patch, resuming after the
+    # last stage whose cached output is still valid
+    rule_counts = step_seconds = None
+    if observer is not None:
+        rule_counts = {}
+        step_seconds = {}
+        segment_t0 = time.perf_counter()
+        observer.event("stage_start", slug=slug, stage="segment")
+    # Lazy: each chapter is patched only when the loop below reaches it
+    chapter_spans = iter_chapter_spans(
+        chapters, stages, segmenter, rule_counts, step_seconds, chapter_jobs,
+    )
+
+    jsonl = None
+    if output_dir and "jsonl" in formats:
+        jsonl = open_sentences_jsonl(output_dir, slug)
 
-    for ch in chapters:
-        canonical = canonicalize(ch.text)
-
-        # Apply text mode classification and normalization
-        processed_text, block_metadata = apply_text_modes(canonical)
-
-        # Segment the mode-normalized text
-        spans = segmenter.segment(processed_text)
-        spans = apply_patch_rules(processed_text, spans, block_metadata)
-
-        sentences = []
-        for i, (start, end) in enumerate(spans):
-            sent_type = get_sentence_type(start, end, block_metadata)
-            sentences.append({
-                "number": i + 1,
-                "start": start,
-                "end": end,
-                "text": processed_text[start:end],
-                "type": sent_type,
+    # Stage 6: Number. Chapters are numbered 1..N in order, so each one can
+    # be finalized (and streamed to JSONL) as soon as it is segmented.
+    processed_chapters = []
+    try:
+        chapter_t0 = time.perf_counter() if observer is not None else 0.0
+        for number, (ch, processed_text, block_metadata, spans) in enumerate(
+            chapter_spans, start=1,
+        ):
+            if observer is not None:
+                number_t0 = time.perf_counter()
+            sentences = build_sentences(processed_text, spans, block_metadata)
+            number_sentences(sentences)
+            if observer is not None:
+                step_seconds["number"] = (
+                    step_seconds.get("number", 0.0) + time.perf_counter() - number_t0
+                )
+            processed_chapters.append({
+                "number": number,
+                "label": ch.label,
+                "canonical_text": processed_text,
+                "sentences": sentences,
             })
+            if jsonl is not None:
+                write_chapter_jsonl(jsonl, slug, number, ch.label, sentences)
+            if observer is not None:
+                now = time.perf_counter()
+                observer.event(
+                    "chapter", slug=slug, number=number, chars=len(processed_text),
+                    sentences=len(sentences), seconds=now - chapter_t0,
+                )
+                chapter_t0 = now
+    finally:
+        if jsonl is not None:
+            jsonl.close()
+    number_chapters(processed_chapters)
+    total_sents = sum(len(ch["sentences"]) for ch in processed_chapters)
 
-        processed_chapters.append({
-            "number": ch.number,
-            "label": ch.label,
-            "canonical_text": processed_text,
-            "sentences": sentences,
-        })
+    if observer is not None:
+        observer.event(
+            "stage_end", slug=slug, stage="segment",
+            seconds=time.perf_counter() - segment_t0,
+            chapters=len(processed_chapters), sentences=total_sents, steps=step_seconds,
+        )
+        if rule_counts:
+            observer.event("patch_rules", slug=slug, merges=rule_counts)
+        if cache is not None:
+            for stage, state in stages.status.items():
+                observer.event("cache", slug=slug, stage=stage, hit=state == "cached")
 
-    # Stage 6: Number
-    number_chapters(processed_chapters)
-    for ch in processed_chapters:
-        number_sentences(ch["sentences"])
+    if verbose and cache is not None:
+        print(f"  Stages: {stages.summary()}")
 
     book_data["processed_chapters"] = processed_chapters
 
     # Export
-    if output_dir:
-        export_book(book_data, output_dir)
+    if observer is not None:
+        export_t0 = time.perf_counter()
+        observer.event("stage_start", slug=slug, stage="export")
+    written = []
+    if output_dir and "json" in formats:
+        written.append(export_book(book_data, output_dir))
+    if output_dir and "compact" in formats:
+        from .compact import export_compact
+        written.append(export_compact(book_data, output_dir))
+    if output_dir and "store" in formats:
+        from .store import export_store
+        written.append(export_store(book_data, output_dir))
+    if output_dir and "parquet" in formats:
+        from .columnar import export_parquet
+        written.extend(export_parquet(book_data, output_dir))
 
     if verbose:
-        total_sents = sum(len(ch["sentences"]) for ch in processed_chapters)
         print(f"  Sentences: {total_sents}")
+    if observer is not None:
+        if jsonl is not None:
+            written.append(jsonl.name)
+        now = time.perf_counter()
+        observer.event(
+            "stage_end", slug=slug, stage="export", seconds=now - export_t0,
+            formats=list(formats) if output_dir else [],
+            bytes_out=sum(os.path.getsize(path) for path in written),
+        )
+        observer.event(
+            "book_end", slug=slug, seconds=now - book_t0,
+            chapters=len(processed_chapters), sentences=total_sents,
+        )
 
     return book_data
 
 
+def _open_cache(args) -> StageCache | None:
+    """Build a StageCache from --cache-dir/--cache-max-size, if given."""
+    from .cache import StageCache, parse_size
+
+    if not getattr(args, "cache_dir", None):
+        return None
+    return StageCache(args.cache_dir, max_bytes=parse_size(args.cache_max_size))
+
+
+def _open_observer(args):
+    """A JSON-lines event log appending to --events, if given."""
+    from .observe import JsonLinesObserver
+
+    if not getattr(args, "events", None):
+        return None
+    return JsonLinesObserver(args.events)
+
+
+def _output_formats(args) -> tuple[str, ...]:
+    """--format values in first-seen order; JSON only when none given."""
+    formats = tuple(dict.fromkeys(args.format or ["json"]))
+    if "parquet" in formats:
+        # Fail before processing anything rather than after the first book
+        from .columnar import require_pyarrow
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            sys.exit(f"book-sbd: error: {e}")
+    return formats
+
+
 def cmd_run(args):
     """Run pipeline on a single book."""
+    from .parallel import resolve_jobs
+
     epub_path = args.epub
     meta_path = args.meta
     if not meta_path:
@@ -119,11 +289,19 @@ def cmd_run(args):
         build_dir=build_dir,
         output_dir=output_dir,
         verbose=True,
+        chapter_jobs=resolve_jobs(args.chapter_jobs),
+        cache=_open_cache(args),
+        formats=_output_formats(args),
+        extractor=args.extractor,
+        backend=args.backend,
+        observer=_open_observer(args),
     )
 
 
 def cmd_batch(args):
     """Run pipeline on all EPUBs in a directory."""
+    from .parallel import resolve_jobs
+
     epub_dir = args.epub_dir
     base_dir = args.output_dir or os.path.dirname(epub_dir)
     build_dir = os.path.join(base_dir, "build")
@@ -132,66 +310,256 @@ def cmd_batch(args):
     epubs = sorted(glob.glob(os.path.join(epub_dir, "*.epub")))
     print(f"Found {len(epubs)} EPUBs")
 
+    jobs = resolve_jobs(args.jobs)
+    options = {
+        "build_dir": build_dir,
+        "output_dir": output_dir,
+        "verbose": True,
+        "cache": _open_cache(args),
+        "formats": _output_formats(args),
+        "extractor": args.extractor,
+        "backend": args.backend,
+        "observer": _open_observer(args),
+    }
+
     start = time.time()
+    if jobs > 1:
+        _batch_parallel(epubs, epub_dir, options, jobs)
+    else:
+        from .segment.base import get_segmenter
+
+        segmenter = get_segmenter(args.backend)
+        for epub_path in epubs:
+            slug = os.path.basename(epub_path).replace(".epub", "")
+            meta_path = os.path.join(epub_dir, f"{slug}_meta.json")
+            if not os.path.exists(meta_path):
+                print(f"  SKIP {slug}: no meta.json")
+                continue
+
+            process_book(epub_path, meta_path, segmenter=segmenter, **options)
+
+    elapsed = time.time() - start
+    print(f"\nBatch complete: {len(epubs)} books in {elapsed:.1f}s")
+
+
+def _batch_parallel(
+    epubs: list[str],
+    epub_dir: str,
+    options: dict,
+    jobs: int,
+) -> None:
+    """Fan books out to a process pool, printing output in serial order."""
+    from .parallel import run_books
+
+    book_jobs = []
+    for epub_path in epubs:
+        slug = os.path.basename(epub_path).replace(".epub", "")
+        meta_path = os.path.join(epub_dir, f"{slug}_meta.json")
+        if os.path.exists(meta_path):
+            book_jobs.append((epub_path, meta_path, options))
+
+    # Results arrive in submission order; interleave SKIP lines where the
+    # serial loop would have printed them.
+    results = run_books(book_jobs, jobs, backend=options["backend"])
     for epub_path in epubs:
         slug = os.path.basename(epub_path).replace(".epub", "")
         meta_path = os.path.join(epub_dir, f"{slug}_meta.json")
         if not os.path.exists(meta_path):
             print(f"  SKIP {slug}: no meta.json")
             continue
+        sys.stdout.write(next(results))
+    sys.stdout.flush()
+
+
+def cmd_cache(args):
+    """Inspect or prune the stage cache."""
+    from .cache import StageCache, parse_size
+
+    cache = StageCache(args.cache_dir, max_bytes=None)
+
+    if args.cache_command == "stats":
+        stats = cache.stats()
+        print(f"Cache: {stats['root']}")
+        print(f"  Entries: {stats['entries']}")
+        print(f"  Size: {stats['bytes']} bytes")
+        for stage, s in stats["stages"].items():
+            print(f"  {stage:10s} {s['entries']:6d} entries  {s['bytes']:12d} bytes")
+    elif args.cache_command == "prune":
+        removed, freed = cache.prune(parse_size(args.max_size))
+        print(f"Pruned {removed} entries ({freed} bytes)")
+
+
+def cmd_inspect(args):
+    """Show an EPUB's spine/nav structure without reading document bodies."""
+    from .ingest.epub_parser import parse_epub
+    from .ingest.structure import chapter_nav_entries
+
+    slug = os.path.basename(args.epub).replace(".epub", "")
+    with parse_epub(args.epub) as epub_data:
+        resolved = chapter_nav_entries(epub_data, slug)
+        chapters_per_doc: dict[int, int] = {}
+        for _entry, spine_idx in resolved:
+            chapters_per_doc[spine_idx] = chapters_per_doc.get(spine_idx, 0) + 1
+        content_hrefs = {entry.href for entry, _idx in resolved}
+
+        print(f"EPUB: {args.epub}")
+        print(f"  Slug: {slug}")
+        print(f"  OPF dir: {epub_data.opf_dir or '.'}")
+        print(f"  Spine: {len(epub_data.spine_items)} documents")
+        for i, item in enumerate(epub_data.spine_items):
+            size = epub_data.archive.member_size(item.path)
+            size_str = f"{size:>9d} B" if size is not None else "  missing"
+            n = chapters_per_doc.get(i, 0)
+            chapters_str = f"  chapters={n}" if n else ""
+            print(f"    {i + 1:4d}  {size_str}  {item.href}{chapters_str}")
+        print(f"  Nav: {len(epub_data.nav_entries)} entries")
+        for entry in epub_data.nav_entries:
+            mark = "*" if entry.href in content_hrefs else " "
+            print(f"    {mark} {entry.label}  ->  {entry.href}")
+
+        if resolved:
+            print(f"  Chapters: {len(resolved)} (from nav; * marks chapter entries)")
+        else:
+            print(f"  Chapters: no chapter nav entries; spine fallback "
+                  f"(up to {len(epub_data.spine_items)})")
+
+
+def cmd_validate(args):
+    """Check every exported book in an output directory against the invariants."""
+    from .invariants import validate_export
+    from .parallel import imap_ordered, resolve_jobs
+
+    paths = sorted(
+        path for path in glob.glob(os.path.join(args.output_dir, "*.json"))
+        if not path.endswith(".compact.json")
+    )
+    print(f"Validating {len(paths)} books")
+
+    failed = 0
+    results = imap_ordered(validate_export, paths, resolve_jobs(args.jobs))
+    for path, errors in zip(paths, results):
+        slug = os.path.basename(path)[:-len(".json")]
+        if not errors:
+            print(f"  {slug:45s} OK")
+            continue
+        failed += 1
+        print(f"  {slug:45s} {len(errors)} errors")
+        for error in errors[:args.max_errors]:
+            print(f"    {error}")
+        if len(errors) > args.max_errors:
+            print(f"    ... {len(errors) - args.max_errors} more")
+
+    print(f"\n{len(paths) - failed} of {len(paths)} books valid")
+    if failed:
+        sys.exit(1)
 
-        process_book(
-            epub_path, meta_path,
-            build_dir=build_dir,
-            output_dir=output_dir,
-            verbose=True,
-        )
 
-    elapsed = time.time() - start
-    print(f"\nBatch complete: {len(epubs)} books in {elapsed:.1f}s")
+def cmd_eval(args):
+    """Run evaluation against gold fixtures.
 
+    Each gold book goes through process_book, the same path as run/batch
+    (reading cached stages with --cache-dir), across --jobs workers. With
+    several --backend values every backend is evaluated in turn, followed
+    by a summary of pipeline throughput and overall P/R/F1 per backend.
+    --metrics-json writes per-book and per-chapter metrics with timings.
+    """
+    from dataclasses import asdict
 
-def cmd_eval(args):
-    """Run evaluation against gold fixtures."""
-    from .eval import evaluate_book, load_gold
+    from . import __version__
+    from .eval import EvalMetrics, combine_metrics
+    from .parallel import eval_books, resolve_jobs
 
     gold_dir = args.gold_dir
     epub_dir = args.epub_dir
+    backends = list(dict.fromkeys(args.backend or ["punkt"]))
+    compare = len(backends) > 1
+    jobs = resolve_jobs(args.jobs)
+    cache = _open_cache(args)
 
-    segmenter = PunktSegmenter()
     gold_files = sorted(glob.glob(os.path.join(gold_dir, "*.json")))
 
     print(f"Evaluating against {len(gold_files)} gold files\n")
 
+    book_jobs = []
     for gold_path in gold_files:
-        gold = load_gold(gold_path)
-        slug = gold["slug"]
+        with open(gold_path, "r", encoding="utf-8") as f:
+            slug = json.load(f)["slug"]
         epub_path = os.path.join(epub_dir, f"{slug}.epub")
         meta_path = os.path.join(epub_dir, f"{slug}_meta.json")
 
         if not os.path.exists(epub_path):
             print(f"  SKIP {slug}: epub not found")
             continue
+        book_jobs.append((gold_path, epub_path, meta_path))
+
+    report = {}
+    for name in backends:
+        options = {"cache": cache, "extractor": args.extractor, "backend": name}
+        records = []
+        for record in eval_books(
+            [(*paths, options) for paths in book_jobs], jobs, backend=name,
+            tolerance=args.tolerance,
+        ):
+            records.append(record)
+            agg = record["aggregate"]
+            label = f"{record['slug']} [{name}]" if compare else record["slug"]
+            print(
+                f"{label:45s}  P={agg['precision']:.4f}  R={agg['recall']:.4f}  "
+                f"F1={agg['f1']:.4f}"
+            )
+
+        chars = sum(r["chars"] for r in records)
+        seconds = sum(r["seconds"] for r in records)
+        total = combine_metrics([EvalMetrics(**r["aggregate"]) for r in records])
+        report[name] = {
+            "chars": chars,
+            "seconds": seconds,
+            "chars_per_sec": chars / seconds if seconds else 0.0,
+            "aggregate": asdict(total),
+            "books": records,
+        }
+
+    if compare:
+        print(f"\n{'backend':10s} {'chars/s':>12s}  {'P':>6s}  {'R':>6s}  {'F1':>6s}")
+        for name, summary in report.items():
+            total = summary["aggregate"]
+            print(
+                f"{name:10s} {summary['chars_per_sec']:12,.0f}  {total['precision']:.4f}  "
+                f"{total['recall']:.4f}  {total['f1']:.4f}"
+            )
+
+    if args.metrics_json:
+        with open(args.metrics_json, "w", encoding="utf-8") as f:
+            json.dump({
+                "pipeline_version": __version__,
+                "tolerance": args.tolerance,
+                "extractor": args.extractor,
+                "cache_dir": args.cache_dir,
+                "backends": report,
+            }, f, indent=2)
+            f.write("\n")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for worker counts, where 0 means one per CPU."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def main(argv: list[str] | None = None):
+    from .constants import EVAL_TOLERANCE, OUTPUT_FORMATS, TEXT_EXTRACTORS
+    from .segment.base import SEGMENTER_BACKENDS
 
-        book_data = ingest_book(epub_path, meta_path)
-
-        pred_spans = {}
-        for ch in book_data["chapters"]:
-            ct = canonicalize(ch.text)
-            processed_text, _ = apply_text_modes(ct)
-            spans = segmenter.segment(processed_text)
-            spans = apply_patch_rules(processed_text, spans)
-            pred_spans[ch.number] = spans
-
-        result = evaluate_book(pred_spans, gold)
-        agg = result["aggregate"]
-        print(
-            f"{slug:45s}  P={agg.precision:.4f}  R={agg.recall:.4f}  "
-            f"F1={agg.f1:.4f}"
-        )
-
-
-def main():
     parser = argparse.ArgumentParser(prog="book-sbd", description="Sentence Boundary Detection for books")
     subparsers = parser.add_subparsers(dest="command")
 
@@ -200,18 +568,139 @@ def main():
     p_run.add_argument("epub", help="Path to EPUB file")
     p_run.add_argument("--meta", help="Path to meta.json (default: {epub}_meta.json)")
     p_run.add_argument("--output-dir", help="Output directory")
+    p_run.add_argument(
+        "--chapter-jobs", type=_non_negative_int, default=1,
+        help="Segment chapters in N worker processes (0 = one per CPU)",
+    )
+    p_run.add_argument(
+        "--format", action="append", choices=OUTPUT_FORMATS,
+        help="Output format; repeat for several (default: json)",
+    )
+    p_run.add_argument(
+        "--extractor", choices=TEXT_EXTRACTORS, default="stdlib",
+        help="XHTML text extractor (default: stdlib; lxml is faster, same output)",
+    )
+    p_run.add_argument(
+        "--backend", choices=SEGMENTER_BACKENDS, default="punkt",
+        help="Sentence segmenter (default: punkt; regex is faster, less accurate)",
+    )
+    p_run.add_argument("--events", help="Append pipeline timing/counter events (JSON lines) here")
+    p_run.add_argument("--cache-dir", help="Stage cache directory (enables caching)")
+    p_run.add_argument(
+        "--cache-max-size", default="2G",
+        help="Evict least recently used cache entries above this size (default: 2G)",
+    )
 
     # batch
     p_batch = subparsers.add_parser("batch", help="Process all EPUBs in a directory")
     p_batch.add_argument("epub_dir", help="Directory containing EPUB files")
     p_batch.add_argument("--output-dir", help="Output directory")
+    p_batch.add_argument(
+        "--jobs", "-j", type=_non_negative_int, default=1,
+        help="Worker processes (default: 1 = serial, 0 = one per CPU)",
+    )
+    p_batch.add_argument(
+        "--format", action="append", choices=OUTPUT_FORMATS,
+        help="Output format; repeat for several (default: json)",
+    )
+    p_batch.add_argument(
+        "--extractor", choices=TEXT_EXTRACTORS, default="stdlib",
+        help="XHTML text extractor (default: stdlib; lxml is faster, same output)",
+    )
+    p_batch.add_argument(
+        "--backend", choices=SEGMENTER_BACKENDS, default="punkt",
+        help="Sentence segmenter (default: punkt; regex is faster, less accurate)",
+    )
+    p_batch.add_argument("--events", help="Append pipeline timing/counter events (JSON lines) here")
+    p_batch.add_argument("--cache-dir", help="Stage cache directory (enables caching)")
+    p_batch.add_argument(
+        "--cache-max-size", default="2G",
+        help="Evict least recently used cache entries above this size (default: 2G)",
+    )
+
+    # cache
+    p_cache = subparsers.add_parser("cache", help="Inspect or prune the stage cache")
+    cache_sub = p_cache.add_subparsers(dest="cache_command", required=True)
+    p_cache_stats = cache_sub.add_parser("stats", help="Show cache size per stage")
+    p_cache_stats.add_argument("cache_dir", help="Stage cache directory")
+    p_cache_prune = cache_sub.add_parser("prune", help="Evict LRU entries down to a size")
+    p_cache_prune.add_argument("cache_dir", help="Stage cache directory")
+    p_cache_prune.add_argument(
+        "--max-size", default="0",
+        help="Target size, e.g. 500M (default: 0 = clear everything)",
+    )
+
+    # inspect
+    p_inspect = subparsers.add_parser(
+        "inspect", help="List an EPUB's spine/nav structure and chapter count",
+    )
+    p_inspect.add_argument("epub", help="Path to EPUB file")
+
+    # validate
+    p_validate = subparsers.add_parser(
+        "validate", help="Check exported books against the output invariants",
+    )
+    p_validate.add_argument("output_dir", help="Directory with exported {slug}.json files")
+    p_validate.add_argument(
+        "--jobs", "-j", type=_non_negative_int, default=1,
+        help="Validate books in N worker processes (0 = one per CPU)",
+    )
+    p_validate.add_argument(
+        "--max-errors", type=int, default=10,
+        help="Errors to print per book (default: 10)",
+    )
+
+    # bench
+    p_bench = subparsers.add_parser(
+        "bench", help="Per-stage timing, throughput and peak RSS over a corpus",
+    )
+    p_bench.add_argument("epub_dir", help="Directory containing EPUB files")
+    p_bench.add_argument(
+        "--repeat", type=_positive_int, default=3, help="Runs per book (best is kept)",
+    )
+    p_bench.add_argument(
+        "--backend", choices=SEGMENTER_BACKENDS, default="punkt",
+        help="Sentence segmenter (default: punkt)",
+    )
+    p_bench.add_argument(
+        "--extractor", choices=TEXT_EXTRACTORS, default="stdlib",
+        help="XHTML text extractor (default: stdlib)",
+    )
+    p_bench.add_argument("--json", help="Write results to this JSON file")
+    p_bench.add_argument("--baseline", help="Compare against a stored --json result")
+    p_bench.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Fractional slowdown counted as a regression (default: 0.10)",
+    )
 
     # eval
     p_eval = subparsers.add_parser("eval", help="Evaluate against gold annotations")
     p_eval.add_argument("gold_dir", help="Directory with gold JSON files")
     p_eval.add_argument("--epub-dir", required=True, help="Directory with EPUB files")
+    p_eval.add_argument(
+        "--backend", action="append", choices=SEGMENTER_BACKENDS,
+        help="Segmenter to evaluate; repeat to compare several (default: punkt)",
+    )
+    p_eval.add_argument(
+        "--jobs", "-j", type=_non_negative_int, default=1,
+        help="Evaluate books in N worker processes (0 = one per CPU)",
+    )
+    p_eval.add_argument(
+        "--extractor", choices=TEXT_EXTRACTORS, default="stdlib",
+        help="XHTML text extractor (default: stdlib; lxml is faster, same output)",
+    )
+    p_eval.add_argument(
+        "--tolerance", type=int, default=EVAL_TOLERANCE,
+        help=f"Boundary match tolerance in characters (default: {EVAL_TOLERANCE})",
+    )
+    p_eval.add_argument("--cache-dir", help="Stage cache directory (reuses cached spans)")
+    p_eval.add_argument(
+        "--cache-max-size", default="2G",
+        help="Evict least recently used cache entries above this size (default: 2G)",
+    )
+    p_eval.add_argument("--metrics-json", help="Write per-book/per-chapter metrics JSON here")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "run":
         cmd_run(args)
@@ -219,6 +708,15 @@ def main():
         cmd_batch(args)
     elif args.command == "eval":
         cmd_eval(args)
+    elif args.command == "cache":
+        cmd_cache(args)
+    elif args.command == "inspect":
+        cmd_inspect(args)
+    elif args.command == "validate":
+        cmd_validate(args)
+    elif args.command == "bench":
+        from .bench import run_pipeline_bench
+        run_pipeline_bench(args)
     else:
         parser.print_help()
         sys.exit(1)
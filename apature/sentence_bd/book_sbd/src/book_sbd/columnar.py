@@ -0,0 +1,190 @@
+"""Columnar (Parquet) export of sentence spans for corpus-level analytics.
+
+Each book writes two Parquet files under {output_dir}/parquet/:
+
+  sentences/{slug}.parquet  one row per sentence
+      slug      dictionary<int32, string>
+      chapter   int32
+      number    int32
+      start     int32
+      end       int32
+      char_len  int32
+      type      dictionary<int8, string>   ("prose" | "verse")
+
+  chapters/{slug}.parquet   one row per chapter
+      slug      dictionary<int32, string>
+      chapter   int32
+      label     string (nullable)
+      text      string   processed chapter text; sentences are text[start:end]
+
+Sentence text is not repeated per row: it lives once per chapter, and
+sentence_texts() slices it back out on demand. The loaders read the whole
+corpus as one dataset and only materialize the requested columns.
+
+pyarrow is an optional dependency (pip install "book-sbd[parquet]").
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def require_pyarrow():
+    """Import pyarrow (and pyarrow.parquet) or explain how to get it."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            'Parquet output needs pyarrow: pip install "book-sbd[parquet]"'
+        ) from e
+    return pyarrow
+
+
+def _schemas():
+    pa = require_pyarrow()
+    sentences = pa.schema([
+        ("slug", pa.dictionary(pa.int32(), pa.string())),
+        ("chapter", pa.int32()),
+        ("number", pa.int32()),
+        ("start", pa.int32()),
+        ("end", pa.int32()),
+        ("char_len", pa.int32()),
+        ("type", pa.dictionary(pa.int8(), pa.string())),
+    ])
+    chapters = pa.schema([
+        ("slug", pa.dictionary(pa.int32(), pa.string())),
+        ("chapter", pa.int32()),
+        ("label", pa.string()),
+        ("text", pa.string()),
+    ])
+    return sentences, chapters
+
+
+def book_tables(book_data: dict) -> tuple[pa.Table, pa.Table]:
+    """Build the (sentences, chapters) Arrow tables for one processed book."""
+    pa = require_pyarrow()
+    sentence_schema, chapter_schema = _schemas()
+    slug = book_data["slug"]
+
+    chapter_col, number, start, end, char_len, types = [], [], [], [], [], []
+    ch_numbers, labels, texts = [], [], []
+    for ch in book_data["processed_chapters"]:
+        ch_numbers.append(ch["number"])
+        labels.append(ch.get("label"))
+        texts.append(ch["canonical_text"])
+        for s in ch["sentences"]:
+            chapter_col.append(ch["number"])
+            number.append(s["number"])
+            start.append(s["start"])
+            end.append(s["end"])
+            char_len.append(s["end"] - s["start"])
+            types.append(s.get("type", "prose"))
+
+    n = len(number)
+    sentences = pa.Table.from_arrays([
+        pa.DictionaryArray.from_arrays(pa.array([0] * n, pa.int32()), pa.array([slug])),
+        pa.array(chapter_col, pa.int32()),
+        pa.array(number, pa.int32()),
+        pa.array(start, pa.int32()),
+        pa.array(end, pa.int32()),
+        pa.array(char_len, pa.int32()),
+        pa.array(types, pa.string()).dictionary_encode().cast(sentence_schema.field("type").type),
+    ], schema=sentence_schema)
+
+    chapters = pa.Table.from_arrays([
+        pa.DictionaryArray.from_arrays(
+            pa.array([0] * len(ch_numbers), pa.int32()), pa.array([slug]),
+        ),
+        pa.array(ch_numbers, pa.int32()),
+        pa.array(labels, pa.string()),
+        pa.array(texts, pa.string()),
+    ], schema=chapter_schema)
+    return sentences, chapters
+
+
+def export_parquet(book_data: dict, output_dir: str) -> tuple[str, str]:
+    """Write the book's sentence and chapter tables as Parquet.
+
+    Returns (sentences_path, chapters_path).
+    """
+    require_pyarrow()
+    import pyarrow.parquet as pq
+
+    slug = book_data["slug"]
+    sentences, chapters = book_tables(book_data)
+    paths = []
+    for kind, table in (("sentences", sentences), ("chapters", chapters)):
+        out_dir = os.path.join(output_dir, "parquet", kind)
+        os.makedirs(out_dir, exist_ok=True)
+        path = os.path.join(out_dir, f"{slug}.parquet")
+        pq.write_table(table, path, compression="zstd")
+        paths.append(path)
+    return paths[0], paths[1]
+
+
+def _load(output_dir: str, kind: str, columns, slugs) -> pa.Table:
+    require_pyarrow()
+    import pyarrow.dataset as ds
+
+    base = os.path.join(output_dir, "parquet", kind)
+    if slugs is None:
+        files = sorted(
+            os.path.join(base, name) for name in os.listdir(base)
+            if name.endswith(".parquet")
+        )
+    else:
+        files = [os.path.join(base, f"{slug}.parquet") for slug in slugs]
+    schema = _schemas()[0 if kind == "sentences" else 1]
+    dataset = ds.dataset(files, schema=schema, format="parquet")
+    return dataset.to_table(columns=list(columns) if columns is not None else None)
+
+
+def load_sentences(
+    output_dir: str,
+    columns: Iterable[str] | None = None,
+    slugs: Iterable[str] | None = None,
+) -> pa.Table:
+    """Load sentence rows for the corpus (or the given slugs).
+
+    Only the requested columns are read from disk.
+    """
+    return _load(output_dir, "sentences", columns, slugs)
+
+
+def load_chapters(
+    output_dir: str,
+    columns: Iterable[str] | None = None,
+    slugs: Iterable[str] | None = None,
+) -> pa.Table:
+    """Load chapter rows (label, processed text) for the corpus or given slugs."""
+    return _load(output_dir, "chapters", columns, slugs)
+
+
+def sentence_texts(sentences: pa.Table, chapters: pa.Table) -> list[str]:
+    """Slice each sentence's text out of its chapter's processed text.
+
+    sentences needs slug, chapter, start and end; chapters needs slug,
+    chapter and text.
+    """
+    text_by_chapter = {
+        (slug, number): text
+        for slug, number, text in zip(
+            chapters.column("slug").to_pylist(),
+            chapters.column("chapter").to_pylist(),
+            chapters.column("text").to_pylist(),
+        )
+    }
+    return [
+        text_by_chapter[(slug, number)][start:end]
+        for slug, number, start, end in zip(
+            sentences.column("slug").to_pylist(),
+            sentences.column("chapter").to_pylist(),
+            sentences.column("start").to_pylist(),
+            sentences.column("end").to_pylist(),
+        )
+    ]
@@ -0,0 +1,202 @@
+"""Compact offsets-only export and its reader.
+
+{slug}.compact.json stores each chapter's processed text once, next to
+parallel arrays of sentence offsets, instead of repeating every sentence's
+text the way the v1.1.0 document does. Sentence strings are recovered on
+demand as text[start:end], and consumers can check offsets against the text
+without re-running the pipeline.
+
+Schema (compact 1.0):
+{
+  "schema": "book-sbd-compact/1.0",
+  "pipeline_version": str,
+  "slug": str, "title": str, "author": str,
+  "gutenberg_id": str, "source_url": str, "format": str,
+  "sentence_types": ["prose", "verse"],
+  "chapters": [
+    {"number": int, "label": str | null, "text": str,
+     "starts": [int], "ends": [int], "types": [int]}   # types index sentence_types
+  ],
+  "stats": {"chapter_count": int, "total_sentences": int, "total_chars": int}
+}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Iterator, TextIO
+
+from . import __version__
+
+
+COMPACT_SCHEMA = "book-sbd-compact/1.0"
+SENTENCE_TYPES = ("prose", "verse")
+
+_META_KEYS = ("title", "author", "gutenberg_id", "source_url", "format")
+
+
+def _dump(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_compact_json(book_data: dict, f: TextIO) -> dict:
+    """Stream the compact document to f one chapter at a time.
+
+    Returns the stats written in the trailing "stats" field.
+    """
+    meta = book_data["meta"]
+    type_codes = {name: i for i, name in enumerate(SENTENCE_TYPES)}
+
+    f.write("{")
+    f.write(f'"schema":{_dump(COMPACT_SCHEMA)},')
+    f.write(f'"pipeline_version":{_dump(__version__)},')
+    f.write(f'"slug":{_dump(book_data["slug"])},')
+    for key in _META_KEYS:
+        f.write(f'{_dump(key)}:{_dump(meta.get(key, ""))},')
+    f.write(f'"sentence_types":{_dump(list(SENTENCE_TYPES))},')
+    f.write('"chapters":[')
+
+    chapter_count = 0
+    total_sentences = 0
+    total_chars = 0
+    for ch in book_data["processed_chapters"]:
+        sentences = ch["sentences"]
+        starts = [s["start"] for s in sentences]
+        ends = [s["end"] for s in sentences]
+        types = [type_codes[s.get("type", "prose")] for s in sentences]
+        if chapter_count:
+            f.write(",")
+        f.write(_dump({
+            "number": ch["number"],
+            "label": ch.get("label"),
+            "text": ch["canonical_text"],
+            "starts": starts,
+            "ends": ends,
+            "types": types,
+        }))
+        chapter_count += 1
+        total_sentences += len(sentences)
+        total_chars += sum(ends) - sum(starts)
+
+    stats = {
+        "chapter_count": chapter_count,
+        "total_sentences": total_sentences,
+        "total_chars": total_chars,
+    }
+    f.write(f'],"stats":{_dump(stats)}}}\n')
+    return stats
+
+
+def export_compact(book_data: dict, output_dir: str) -> str:
+    """Write {output_dir}/{slug}.compact.json. Returns the file path."""
+    os.makedirs(output_dir, exist_ok=True)
+    out_path = os.path.join(output_dir, f"{book_data['slug']}.compact.json")
+    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
+        write_compact_json(book_data, f)
+    return out_path
+
+
+@dataclass
+class CompactChapter:
+    """One chapter of a compact document. Sentences are numbered from 1."""
+    number: int
+    label: str | None
+    text: str
+    starts: list[int]
+    ends: list[int]
+    types: list[int]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def span(self, number: int) -> tuple[int, int]:
+        """(start, end) of sentence `number` within self.text."""
+        i = self._index(number)
+        return self.starts[i], self.ends[i]
+
+    def sentence(self, number: int) -> str:
+        """Text of sentence `number`."""
+        i = self._index(number)
+        return self.text[self.starts[i]:self.ends[i]]
+
+    def sentence_type(self, number: int) -> str:
+        return SENTENCE_TYPES[self.types[self._index(number)]]
+
+    def sentences(self) -> Iterator[str]:
+        """Sentence strings in order."""
+        text = self.text
+        for start, end in zip(self.starts, self.ends):
+            yield text[start:end]
+
+    def _index(self, number: int) -> int:
+        if not 1 <= number <= len(self.starts):
+            raise IndexError(
+                f"chapter {self.number} has no sentence {number} "
+                f"(1..{len(self.starts)})"
+            )
+        return number - 1
+
+
+@dataclass
+class CompactBook:
+    """Reader for {slug}.compact.json."""
+    slug: str
+    meta: dict
+    pipeline_version: str
+    chapters: list[CompactChapter]
+    stats: dict
+
+    @classmethod
+    def load(cls, path: str) -> CompactBook:
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CompactBook:
+        if data.get("schema") != COMPACT_SCHEMA:
+            raise ValueError(f"Not a {COMPACT_SCHEMA} document: {data.get('schema')!r}")
+        type_names = data["sentence_types"]
+        remap = [SENTENCE_TYPES.index(name) for name in type_names]
+        chapters = [
+            CompactChapter(
+                number=ch["number"],
+                label=ch["label"],
+                text=ch["text"],
+                starts=ch["starts"],
+                ends=ch["ends"],
+                types=[remap[t] for t in ch["types"]],
+            )
+            for ch in data["chapters"]
+        ]
+        return cls(
+            slug=data["slug"],
+            meta={key: data.get(key, "") for key in _META_KEYS},
+            pipeline_version=data["pipeline_version"],
+            chapters=chapters,
+            stats=data["stats"],
+        )
+
+    def chapter(self, number: int) -> CompactChapter:
+        """Chapter by its 1-based number."""
+        if not 1 <= number <= len(self.chapters):
+            raise IndexError(f"{self.slug} has no chapter {number} (1..{len(self.chapters)})")
+        return self.chapters[number - 1]
+
+    def sentence(self, chapter: int, number: int) -> str:
+        return self.chapter(chapter).sentence(number)
+
+    def iter_sentences(self) -> Iterator[dict]:
+        """Sentence dicts shaped like the v1.1.0 document's, in order."""
+        for ch in self.chapters:
+            for i, (start, end) in enumerate(zip(ch.starts, ch.ends)):
+                yield {
+                    "chapter": ch.number,
+                    "number": i + 1,
+                    "text": ch.text[start:end],
+                    "type": SENTENCE_TYPES[ch.types[i]],
+                    "start": start,
+                    "end": end,
+                    "char_len": end - start,
+                }
@@ -0,0 +1,16 @@
+"""Option values shared by the CLI and the stage modules.
+
+Kept free of imports so the CLI can build its argument parser (choices=...)
+without loading the stage modules the values belong to.
+"""
+
+# Text extractors selectable for chapter extraction (see ingest/structure.py).
+# Both give identical text; "lxml" parses each spine document once in C
+# (see lxml_text.py).
+TEXT_EXTRACTORS = ("stdlib", "lxml")
+
+# Files process_book can write to an output directory (see export.py).
+OUTPUT_FORMATS = ("json", "jsonl", "compact", "store", "parquet")
+
+# Default eval boundary-matching tolerance in characters (see eval.py)
+EVAL_TOLERANCE = 3
@@ -17,7 +17,9 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+
+from .constants import EVAL_TOLERANCE
 
 
 @dataclass
@@ -36,12 +38,13 @@ class EvalMetrics:
 def evaluate_boundaries(
     predicted_starts: list[int],
     gold_starts: list[int],
-    tolerance: int = 3,
+    tolerance: int = EVAL_TOLERANCE,
 ) -> EvalMetrics:
     """Evaluate predicted sentence boundaries against gold standard.
 
     A predicted boundary is a true positive if it's within `tolerance`
-    characters of a gold boundary.
+    characters of a gold boundary. Predictions are matched greedily in
+    ascending order, each to the lowest unmatched gold boundary in range.
 
     Args:
         predicted_starts: List of predicted sentence start offsets.
@@ -51,26 +54,54 @@ def evaluate_boundaries(
     Returns:
         EvalMetrics with precision, recall, F1.
     """
-    pred_set = set(predicted_starts)
-    gold_set = set(gold_starts)
-
-    tp = 0
-    matched_gold = set()
-
-    for p in sorted(pred_set):
-        for g in sorted(gold_set):
-            if g in matched_gold:
-                continue
-            if abs(p - g) <= tolerance:
-                tp += 1
-                matched_gold.add(g)
-                break
-
-    fp = len(pred_set) - tp
-    fn = len(gold_set) - len(matched_gold)
-
-    precision = tp / len(pred_set) if pred_set else 0.0
-    recall = tp / len(gold_set) if gold_set else 0.0
+    return evaluate_boundaries_multi(predicted_starts, gold_starts, (tolerance,))[tolerance]
+
+
+def evaluate_boundaries_multi(
+    predicted_starts: list[int],
+    gold_starts: list[int],
+    tolerances: tuple[int, ...],
+) -> dict[int, EvalMetrics]:
+    """Evaluate at several tolerances at once: tolerance -> EvalMetrics.
+
+    Both offset lists are deduplicated and sorted once; one pass over the
+    predictions then advances a gold pointer per tolerance, so the cost is
+    O((P + G) log(P + G)) plus O(P + G) per tolerance.
+
+    Gives the same matches as the greedy rule in evaluate_boundaries. Gold
+    boundaries below pointer k are already matched or more than
+    tolerances[k] below the current prediction, and so out of range for
+    every later (larger) prediction too. The pointer therefore always sits
+    on the lowest unmatched gold boundary that could still match.
+    """
+    pred = sorted(set(predicted_starts))
+    gold = sorted(set(gold_starts))
+    tolerances = tuple(dict.fromkeys(tolerances))
+
+    n_gold = len(gold)
+    pointers = [0] * len(tolerances)
+    tps = [0] * len(tolerances)
+    for p in pred:
+        for k, tolerance in enumerate(tolerances):
+            j = pointers[k]
+            low = p - tolerance
+            while j < n_gold and gold[j] < low:
+                j += 1
+            if j < n_gold and gold[j] <= p + tolerance:
+                tps[k] += 1
+                j += 1
+            pointers[k] = j
+
+    return {
+        tolerance: _metrics(tp, len(pred), n_gold)
+        for tolerance, tp in zip(tolerances, tps)
+    }
+
+
+def _metrics(tp: int, total_predicted: int, total_gold: int) -> EvalMetrics:
+    """EvalMetrics from a true-positive count and the two totals."""
+    precision = tp / total_predicted if total_predicted else 0.0
+    recall = tp / total_gold if total_gold else 0.0
     f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) > 0 else 0.0
 
     return EvalMetrics(
@@ -78,10 +109,19 @@ def evaluate_boundaries(
         recall=recall,
         f1=f1,
         true_positives=tp,
-        false_positives=fp,
-        false_negatives=fn,
-        total_predicted=len(pred_set),
-        total_gold=len(gold_set),
+        false_positives=total_predicted - tp,
+        false_negatives=total_gold - tp,
+        total_predicted=total_predicted,
+        total_gold=total_gold,
+    )
+
+
+def combine_metrics(metrics: list[EvalMetrics]) -> EvalMetrics:
+    """Micro-average several results: sum the counts, then recompute P/R/F1."""
+    return _metrics(
+        sum(m.true_positives for m in metrics),
+        sum(m.total_predicted for m in metrics),
+        sum(m.total_gold for m in metrics),
     )
 
 
@@ -94,7 +134,7 @@ def load_gold(gold_path: str) -> dict:
 def evaluate_book(
     predicted_spans: dict[int, list[tuple[int, int]]],
     gold_data: dict,
-    tolerance: int = 3,
+    tolerance: int = EVAL_TOLERANCE,
 ) -> dict:
     """Evaluate a full book against gold annotations.
 
@@ -128,3 +168,45 @@ def evaluate_book(
         "per_chapter": chapter_metrics,
         "chapter_count_expected": gold_data.get("expected_chapter_count"),
     }
+
+
+def predicted_spans(book_data: dict) -> dict[int, list[tuple[int, int]]]:
+    """Chapter number -> final sentence spans, from process_book output."""
+    return {
+        ch["number"]: [(s["start"], s["end"]) for s in ch["sentences"]]
+        for ch in book_data["processed_chapters"]
+    }
+
+
+def book_metrics_record(
+    book_data: dict,
+    gold_data: dict,
+    seconds: float,
+    tolerance: int = EVAL_TOLERANCE,
+) -> dict:
+    """Evaluate processed book data and return a JSON-ready metrics record.
+
+    The record holds the book's aggregate metrics, wall time and character
+    count, and one entry per gold chapter with its metrics and size.
+    """
+    result = evaluate_book(predicted_spans(book_data), gold_data, tolerance)
+    chapters = {ch["number"]: ch for ch in book_data["processed_chapters"]}
+
+    chapter_records = []
+    for number, metrics in result["per_chapter"].items():
+        ch = chapters.get(number)
+        chapter_records.append({
+            "number": number,
+            "label": ch["label"] if ch else None,
+            "chars": len(ch["canonical_text"]) if ch else 0,
+            "sentences": len(ch["sentences"]) if ch else 0,
+            **asdict(metrics),
+        })
+
+    return {
+        "slug": gold_data["slug"],
+        "seconds": seconds,
+        "chars": sum(len(ch["canonical_text"]) for ch in chapters.values()),
+        "aggregate": asdict(result["aggregate"]),
+        "chapters": chapter_records,
+    }
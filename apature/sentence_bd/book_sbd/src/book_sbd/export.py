@@ -1,14 +1,30 @@
 """Export pipeline results to JSON.
 
-Single output mode with metadata, chapter labels, sentence spans, and stats.
+Output formats:
+  json     {slug}.json          nested book document (schema v1.1.0) with
+                                metadata, chapter labels, sentence spans, stats
+  jsonl    {slug}.jsonl         one sentence record per line, written chapter
+                                by chapter while the pipeline runs
+  compact  {slug}.compact.json  chapter text once plus offset arrays
+                                (see compact.py)
+  store    store/{slug}.sbd     mmap-able binary sentence store
+                                (see store.py)
+  parquet  parquet/...          columnar sentence/chapter tables
+                                (see columnar.py)
+
+The JSON document is streamed to disk sentence by sentence rather than encoded as
+one string, so memory stays bounded by the pipeline data, not the output. It
+is streamed into a temp file that replaces {slug}.json only once complete.
 """
 
 from __future__ import annotations
 
 import json
 import os
+from typing import TextIO
 
 from . import __version__
+from .constants import OUTPUT_FORMATS  # noqa: F401
 
 
 def export_book(book_data: dict, output_dir: str) -> str:
@@ -42,55 +58,131 @@ def export_book(book_data: dict, output_dir: str) -> str:
     }
     """
     slug = book_data["slug"]
+    os.makedirs(output_dir, exist_ok=True)
+    out_path = os.path.join(output_dir, f"{slug}.json")
+
+    # Stream into a temp file and rename it into place, so a failure part
+    # way through never leaves a truncated {slug}.json behind. (Not mkstemp:
+    # its 0600 mode would carry over to the output.)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            write_book_json(book_data, f)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return out_path
+
+
+def _dump(value) -> str:
+    """Encode one scalar exactly as json.dumps(indent=2) would inline it."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_book_json(book_data: dict, f: TextIO) -> dict:
+    """Stream the v1.1.0 document to f, one sentence at a time.
+
+    Produces the same bytes as json.dumps(output, ensure_ascii=False,
+    indent=2) + "\n" over the assembled dict, without ever holding that dict
+    or the encoded document in memory. Keys follow the v1.1.0 insertion
+    order that json.dumps produced (it never sorted them): book and chapter
+    keys happen to be alphabetical, so stats (computed along the way) fall
+    after chapters, while sentence keys run number, text, type, start, end,
+    char_len. Returns the stats.
+    """
     meta = book_data["meta"]
+    write = f.write
+
+    write("{\n")
+    write(f'  "author": {_dump(meta.get("author", ""))},\n')
+    write('  "chapters": [')
 
+    chapter_count = 0
     total_sentences = 0
     total_chars = 0
-
-    chapters_out = []
     for ch in book_data["processed_chapters"]:
-        sentences_out = []
-        for s in ch["sentences"]:
+        write(",\n    {\n" if chapter_count else "\n    {\n")
+        chapter_count += 1
+        sentences = ch["sentences"]
+        write(f'      "label": {_dump(ch.get("label"))},\n')
+        write(f'      "number": {_dump(ch["number"])},\n')
+        write(f'      "sentence_count": {len(sentences)},\n')
+        write('      "sentences": [')
+        for i, s in enumerate(sentences):
             # Logical key order: number, text, type, start, end, char_len
-            sentences_out.append({
-                "number": s["number"],
-                "text": s["text"],
-                "type": s.get("type", "prose"),
-                "start": s["start"],
-                "end": s["end"],
-                "char_len": s["end"] - s["start"],
-            })
-        total_sentences += len(sentences_out)
-        total_chars += sum(s["char_len"] for s in sentences_out)
-
-        chapters_out.append({
-            "label": ch.get("label"),
-            "number": ch["number"],
-            "sentence_count": len(sentences_out),
-            "sentences": sentences_out,
-        })
-
-    output = {
-        "author": meta.get("author", ""),
-        "chapters": chapters_out,
-        "format": meta.get("format", ""),
-        "gutenberg_id": meta.get("gutenberg_id", ""),
-        "pipeline_version": __version__,
-        "slug": slug,
-        "source_url": meta.get("source_url", ""),
-        "stats": {
-            "chapter_count": len(chapters_out),
-            "total_chars": total_chars,
-            "total_sentences": total_sentences,
-        },
-        "title": meta.get("title", ""),
+            char_len = s["end"] - s["start"]
+            write(
+                (",\n        {\n" if i else "\n        {\n")
+                + f'          "number": {_dump(s["number"])},\n'
+                + f'          "text": {_dump(s["text"])},\n'
+                + f'          "type": {_dump(s.get("type", "prose"))},\n'
+                + f'          "start": {_dump(s["start"])},\n'
+                + f'          "end": {_dump(s["end"])},\n'
+                + f'          "char_len": {_dump(char_len)}\n'
+                + "        }"
+            )
+            total_chars += char_len
+        total_sentences += len(sentences)
+        write("\n      ]\n    }" if sentences else "]\n    }")
+    write("\n  ],\n" if chapter_count else "],\n")
+
+    stats = {
+        "chapter_count": chapter_count,
+        "total_chars": total_chars,
+        "total_sentences": total_sentences,
     }
+    write(f'  "format": {_dump(meta.get("format", ""))},\n')
+    write(f'  "gutenberg_id": {_dump(meta.get("gutenberg_id", ""))},\n')
+    write(f'  "pipeline_version": {_dump(__version__)},\n')
+    write(f'  "slug": {_dump(book_data["slug"])},\n')
+    write(f'  "source_url": {_dump(meta.get("source_url", ""))},\n')
+    write('  "stats": {\n')
+    write(f'    "chapter_count": {chapter_count},\n')
+    write(f'    "total_chars": {total_chars},\n')
+    write(f'    "total_sentences": {total_sentences}\n')
+    write("  },\n")
+    write(f'  "title": {_dump(meta.get("title", ""))}\n')
+    write("}\n")
+    return stats
+
 
+def open_sentences_jsonl(output_dir: str, slug: str) -> TextIO:
+    """Open {output_dir}/{slug}.jsonl for incremental sentence records."""
     os.makedirs(output_dir, exist_ok=True)
-    out_path = os.path.join(output_dir, f"{slug}.json")
+    out_path = os.path.join(output_dir, f"{slug}.jsonl")
+    return open(out_path, "w", encoding="utf-8", newline="\n")
 
-    content = json.dumps(output, sort_keys=False, ensure_ascii=False, indent=2) + "\n"
-    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(content)
 
-    return out_path
+def write_chapter_jsonl(
+    f: TextIO,
+    slug: str,
+    chapter_number: int,
+    chapter_label: str | None,
+    sentences: list[dict],
+) -> int:
+    """Append one JSON Lines record per sentence of a chapter, then flush.
+
+    Record keys: slug, chapter, chapter_label, number, type, start, end,
+    char_len, text. Flushing per chapter lets readers tail the file while
+    the rest of the book is still being segmented. Returns records written.
+    """
+    lines = []
+    for s in sentences:
+        record = {
+            "slug": slug,
+            "chapter": chapter_number,
+            "chapter_label": chapter_label,
+            "number": s["number"],
+            "type": s.get("type", "prose"),
+            "start": s["start"],
+            "end": s["end"],
+            "char_len": s["end"] - s["start"],
+            "text": s["text"],
+        }
+        lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    f.write("".join(lines))
+    f.flush()
+    return len(lines)
@@ -1,6 +1,13 @@
 """EPUB parser: OPF/spine/nav extraction.
 
 Supports both EPUB2 (toc.ncx) and EPUB3 (nav.xhtml) formats.
+
+Only container.xml, the OPF and the NCX/nav document are read up front.
+Spine documents are read and decoded from the still-open archive the first
+time their content is accessed, so covers, license pages and documents no
+nav entry points at are never decoded. Use the returned EpubData as a
+context manager (or close() it) so the archive is released as soon as
+extraction is done; an unclosed archive is only closed when collected.
 """
 
 from __future__ import annotations
@@ -29,12 +36,63 @@ class NavEntry:
     order: int = 0
 
 
+class EpubArchive:
+    """Open EPUB zip that spine items read their documents from."""
+
+    def __init__(self, epub_path: str):
+        self.path = epub_path
+        self._zf = zipfile.ZipFile(epub_path, "r")
+        self.reads = 0  # spine documents decoded so far
+
+    def read_text(self, name: str) -> str:
+        """Read and decode one member; missing members read as ""."""
+        if self._zf is None:
+            raise ValueError(f"{self.path}: archive is closed")
+        try:
+            data = self._zf.read(name)
+        except KeyError:
+            return ""
+        self.reads += 1
+        return data.decode("utf-8", errors="replace")
+
+    def member_size(self, name: str) -> int | None:
+        """Uncompressed size of a member, without reading it."""
+        try:
+            return self._zf.getinfo(name).file_size
+        except KeyError:
+            return None
+
+    def close(self) -> None:
+        if self._zf is not None:
+            self._zf.close()
+            self._zf = None
+
+    def __del__(self) -> None:
+        # Safety net for an EpubData dropped without close(); the file
+        # handle is released when the archive is garbage-collected
+        if getattr(self, "_zf", None) is not None:
+            self.close()
+
+
 @dataclass
 class SpineItem:
-    """A single spine item with its content."""
+    """A single spine item. Its content is read on first access."""
     idref: str
     href: str  # relative to OPF directory
-    content: str = ""  # raw XHTML/HTML string
+    path: str = ""  # full path inside the EPUB archive
+    archive: EpubArchive | None = field(default=None, repr=False, compare=False)
+    _content: str | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def content(self) -> str:
+        """Raw XHTML/HTML string."""
+        if self._content is None:
+            self._content = self.archive.read_text(self.path) if self.archive else ""
+        return self._content
+
+    @property
+    def loaded(self) -> bool:
+        return self._content is not None
 
 
 @dataclass
@@ -43,63 +101,85 @@ class EpubData:
     spine_items: list[SpineItem] = field(default_factory=list)
     nav_entries: list[NavEntry] = field(default_factory=list)
     opf_dir: str = ""
+    archive: EpubArchive | None = field(default=None, repr=False, compare=False)
+
+    def close(self) -> None:
+        """Release the archive; content already read stays available."""
+        if self.archive is not None:
+            self.archive.close()
+
+    def __enter__(self) -> EpubData:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def parse_epub(epub_path: str) -> EpubData:
-    """Parse an EPUB file and extract spine items and nav entries."""
-    with zipfile.ZipFile(epub_path, "r") as zf:
-        # Step 1: Find OPF path from container.xml
-        container_xml = zf.read("META-INF/container.xml")
-        container = ET.fromstring(container_xml)
-        rootfile = container.find(
-            ".//container:rootfile", NS
-        )
-        opf_path = rootfile.attrib["full-path"]
-        opf_dir = str(PurePosixPath(opf_path).parent)
-        if opf_dir == ".":
-            opf_dir = ""
-
-        # Step 2: Parse OPF
-        opf_xml = zf.read(opf_path)
-        opf = ET.fromstring(opf_xml)
-
-        # Build manifest map: id -> href
-        manifest = {}
-        for item in opf.findall(".//opf:manifest/opf:item", NS):
-            manifest[item.attrib["id"]] = item.attrib["href"]
-
-        # Build manifest map by href for media-type lookup
-        manifest_items = {}
-        for item in opf.findall(".//opf:manifest/opf:item", NS):
-            manifest_items[item.attrib["id"]] = {
-                "href": item.attrib["href"],
-                "media-type": item.attrib.get("media-type", ""),
-                "properties": item.attrib.get("properties", ""),
-            }
-
-        # Step 3: Extract spine items
-        spine_items = []
-        for itemref in opf.findall(".//opf:spine/opf:itemref", NS):
-            idref = itemref.attrib["idref"]
-            if idref in manifest:
-                href = manifest[idref]
-                full_path = f"{opf_dir}/{href}" if opf_dir else href
-                try:
-                    content = zf.read(full_path).decode("utf-8", errors="replace")
-                except KeyError:
-                    content = ""
-                spine_items.append(SpineItem(idref=idref, href=href, content=content))
-
-        # Step 4: Extract nav entries (try NCX first, then EPUB3 nav)
-        nav_entries = _parse_ncx(zf, opf, opf_dir, manifest_items)
-        if not nav_entries:
-            nav_entries = _parse_epub3_nav(zf, opf, opf_dir, manifest_items)
-
-        return EpubData(
-            spine_items=spine_items,
-            nav_entries=nav_entries,
-            opf_dir=opf_dir,
-        )
+    """Parse an EPUB file's OPF/spine/nav; spine content loads lazily."""
+    archive = EpubArchive(epub_path)
+    try:
+        return _parse_structure(archive)
+    except BaseException:
+        archive.close()
+        raise
+
+
+def _parse_structure(archive: EpubArchive) -> EpubData:
+    """Read container.xml, the OPF and the TOC; spine items stay unread."""
+    zf = archive._zf
+
+    # Step 1: Find OPF path from container.xml
+    container_xml = zf.read("META-INF/container.xml")
+    container = ET.fromstring(container_xml)
+    rootfile = container.find(
+        ".//container:rootfile", NS
+    )
+    opf_path = rootfile.attrib["full-path"]
+    opf_dir = str(PurePosixPath(opf_path).parent)
+    if opf_dir == ".":
+        opf_dir = ""
+
+    # Step 2: Parse OPF
+    opf_xml = zf.read(opf_path)
+    opf = ET.fromstring(opf_xml)
+
+    # Build manifest map: id -> href
+    manifest = {}
+    for item in opf.findall(".//opf:manifest/opf:item", NS):
+        manifest[item.attrib["id"]] = item.attrib["href"]
+
+    # Build manifest map by href for media-type lookup
+    manifest_items = {}
+    for item in opf.findall(".//opf:manifest/opf:item", NS):
+        manifest_items[item.attrib["id"]] = {
+            "href": item.attrib["href"],
+            "media-type": item.attrib.get("media-type", ""),
+            "properties": item.attrib.get("properties", ""),
+        }
+
+    # Step 3: Extract spine items
+    spine_items = []
+    for itemref in opf.findall(".//opf:spine/opf:itemref", NS):
+        idref = itemref.attrib["idref"]
+        if idref in manifest:
+            href = manifest[idref]
+            full_path = f"{opf_dir}/{href}" if opf_dir else href
+            spine_items.append(SpineItem(
+                idref=idref, href=href, path=full_path, archive=archive,
+            ))
+
+    # Step 4: Extract nav entries (try NCX first, then EPUB3 nav)
+    nav_entries = _parse_ncx(zf, opf, opf_dir, manifest_items)
+    if not nav_entries:
+        nav_entries = _parse_epub3_nav(zf, opf, opf_dir, manifest_items)
+
+    return EpubData(
+        spine_items=spine_items,
+        nav_entries=nav_entries,
+        opf_dir=opf_dir,
+        archive=archive,
+    )
 
 
 def _parse_ncx(
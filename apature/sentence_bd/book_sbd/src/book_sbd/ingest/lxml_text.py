@@ -0,0 +1,257 @@
+"""lxml-backed text extraction that matches structure.html_to_text exactly.
+
+The stdlib extractor (structure._TextExtractor) runs html.parser, which
+tokenizes in Python. Here libxml2 parses and entity-decodes the document
+in C, and the same block-newline / skip-tag state machine is replayed over
+a walk of the tree. EPUB spine documents are XHTML, so they are almost
+always well-formed XML.
+
+The walk is flattened once per document into a list of operations (start
+tag, end tag, text run), with each text run exactly as html.parser would
+report it: an element's .text or a node's .tail, with any entity reference
+libxml2 left undecoded merged back in. Chapter slices html[start:end]
+begin and end at element start tags, and the k-th "<letter" in the source
+is the k-th element of the tree, so one regex scan maps a slice bound to
+its operation index. Text html.parser reports outside the root element
+(prolog/epilog whitespace) is read from the source directly.
+
+Anything outside that model falls back to the stdlib extractor:
+non-well-formed input, carriage returns (XML normalizes them), CDATA
+sections, prefixed or non-ASCII tag names, elements inside script/style,
+numeric character references html.unescape remaps, a "<letter" inside a
+comment or PI, and slice bounds that are not element start tags.
+"""
+
+from __future__ import annotations
+
+import html as html_lib
+import re
+from html.parser import HTMLParser
+
+from lxml import etree
+
+
+_START, _END, _TEXT = 0, 1, 2
+
+_BLOCK_TAGS = frozenset({
+    "p", "div", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "li", "tr", "br", "hr",
+})
+_SKIP_TAGS = frozenset({"script", "style", "head"})
+_REPLAY_TAGS = _BLOCK_TAGS | _SKIP_TAGS
+# Elements whose content html.parser reads as raw text, never as markup
+_RAWTEXT_TAGS = frozenset(HTMLParser.CDATA_CONTENT_ELEMENTS) | frozenset(
+    getattr(HTMLParser, "RCDATA_CONTENT_ELEMENTS", ())
+)
+
+# Where html.parser (and libxml2) start an element
+_ELEMENT_START_RE = re.compile(r"<[A-Za-z]")
+_START_TAG_RE = re.compile(r"""<[^\s/>]+(?:[^>"']|"[^"]*"|'[^']*')*?(/?)>""")
+# Markup after the last element start: end tags, comments and PIs; and, in
+# the prolog, the XML declaration and DOCTYPE
+_OUTER_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<\?.*?\?>|<!DOCTYPE(?:[^>\[]|\[[^\]]*\])*>|</[^>]*>",
+    re.S | re.I,
+)
+# Tag names html.parser and libxml2 both read as the same element: an ASCII
+# letter, then ASCII name characters. (A stray '<' that html.parser would
+# keep as text is not well-formed XML, so libxml2 already rejects it.)
+_PLAIN_TAG_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9._-]*")
+_CHARREF_RE = re.compile(r"&#[xX]?[0-9a-fA-F]+;")
+
+
+class _Unsupported(Exception):
+    """Input outside what this extractor reproduces exactly."""
+
+
+def _charrefs_are_plain(html: str) -> bool:
+    """True if every numeric reference decodes the same in XML and html.unescape."""
+    for ref in set(_CHARREF_RE.findall(html)):
+        digits = ref[2:-1]
+        try:
+            cp = int(digits[1:], 16) if digits[0] in "xX" else int(digits)
+        except ValueError:
+            continue  # "&#1a;": not a reference, and not well-formed XML
+        if (
+            cp < 0x20 and cp not in (0x09, 0x0A, 0x0D)
+            or 0x7F <= cp <= 0x9F
+            or 0xD800 <= cp <= 0xDFFF
+            or 0xFDD0 <= cp <= 0xFDEF
+            or (cp & 0xFFFE) == 0xFFFE
+            or cp > 0x10FFFF
+        ):
+            return False
+    return True
+
+
+def _outer_text_ops(html: str, start: int, end: int) -> list[tuple[int, str]]:
+    """Text runs html.parser reports between the markup of html[start:end]."""
+    ops = []
+    pos = start
+    for m in _OUTER_TOKEN_RE.finditer(html, start, end):
+        if m.start() > pos:
+            ops.append((_TEXT, html_lib.unescape(html[pos:m.start()])))
+        pos = m.end()
+    if end > pos:
+        ops.append((_TEXT, html_lib.unescape(html[pos:end])))
+    return ops
+
+
+class XhtmlText:
+    """One spine document parsed once, extractable whole or by slice."""
+
+    def __init__(self, html: str):
+        self.html = html
+        self._ops: list[tuple[int, str]] | None = None
+        self._op_at: dict[int, int] = {}
+        try:
+            self._parse()
+        except (_Unsupported, etree.XMLSyntaxError, ValueError):
+            self._ops = None
+
+    @property
+    def supported(self) -> bool:
+        return self._ops is not None
+
+    def _parse(self) -> None:
+        html = self.html
+        # XML normalizes carriage returns and reads CDATA sections as text;
+        # html.parser does neither
+        if "\r" in html or "<![CDATA[" in html or not _charrefs_are_plain(html):
+            raise _Unsupported("input outside the exact-match subset")
+
+        parser = etree.XMLParser(
+            encoding="utf-8", resolve_entities=False, no_network=True,
+            huge_tree=True, remove_comments=False, remove_pis=False,
+        )
+        root = etree.fromstring(html.encode("utf-8"), parser)
+
+        element_starts = [m.start() for m in _ELEMENT_START_RE.finditer(html)]
+        if not element_starts:
+            raise _Unsupported("no elements")
+
+        ops = _outer_text_ops(html, 0, element_starts[0])
+        element_ops: list[int] = []
+        names: dict = {}
+        last = root
+        rawtext_depth = 0
+        # True while ops[-1] is the text run running up to the current node
+        in_run = False
+        for event, node in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            if event == "start":
+                tag = node.tag
+                name = names.get(tag)
+                if name is None:
+                    if not isinstance(tag, str):
+                        # An entity libxml2 left undecoded (no DTD loaded);
+                        # html.parser decodes it as part of the surrounding run
+                        run = html_lib.unescape(node.text) + (node.tail or "")
+                        if in_run:
+                            ops[-1] = (_TEXT, ops[-1][1] + run)
+                        else:
+                            ops.append((_TEXT, run))
+                            in_run = True
+                        continue
+                    local = tag.rpartition("}")[2]
+                    if node.prefix is not None or not _PLAIN_TAG_NAME_RE.fullmatch(local):
+                        raise _Unsupported("tag name outside the exact-match subset")
+                    name = names[tag] = local.lower()
+                if rawtext_depth:
+                    # html.parser would read this element as script/style text
+                    raise _Unsupported("element inside script/style")
+                if name in _RAWTEXT_TAGS:
+                    rawtext_depth += 1
+                # Tags the replay ignores get an index but no operation
+                element_ops.append(len(ops))
+                if name in _REPLAY_TAGS:
+                    ops.append((_START, name))
+                last = node
+                text = node.text
+            elif event == "end":
+                name = names.get(node.tag)
+                if name is None:
+                    continue  # entity
+                if name in _RAWTEXT_TAGS:
+                    rawtext_depth -= 1
+                if name in _REPLAY_TAGS:
+                    ops.append((_END, name))
+                text = node.tail
+            else:
+                # Comment or PI: only the text after it is visible
+                text = node.tail
+            if text:
+                ops.append((_TEXT, text))
+                in_run = True
+            else:
+                in_run = False
+
+        # Each "<letter" in the source must be an element libxml2 saw, in
+        # order; one inside a comment or PI would shift every position
+        if len(element_starts) != len(element_ops):
+            raise _Unsupported("element starts misaligned")
+
+        # Epilog: skip the end tags still open at the last element start
+        # to reach the root's end tag, then report the text after it
+        m = _START_TAG_RE.match(html, element_starts[-1])
+        if m is None:
+            raise _Unsupported("unreadable start tag")
+        open_tags = 1 + sum(1 for _ in last.iterancestors()) - (1 if m.group(1) else 0)
+        pos = m.end()
+        while open_tags:
+            m = _OUTER_TOKEN_RE.search(html, pos)
+            if m is None:
+                raise _Unsupported("root end tag not found")
+            if m.group().startswith("</"):
+                open_tags -= 1
+            pos = m.end()
+        ops.extend(_outer_text_ops(html, pos, len(html)))
+
+        self._op_at = dict(zip(element_starts, element_ops))
+        self._ops = ops
+
+    def text(self, start: int = 0, end: int | None = None) -> str:
+        """Text of html[start:end], as structure.html_to_text would give it."""
+        html = self.html
+        if end is None:
+            end = len(html)
+        ops = self._ops
+        if ops is None:
+            return _stdlib_html_to_text(html[start:end])
+
+        first = 0 if start == 0 else self._op_at.get(start)
+        stop = len(ops) if end == len(html) else self._op_at.get(end)
+        if first is None or stop is None or stop < first:
+            return _stdlib_html_to_text(html[start:end])
+
+        # Slices end at a start tag, so the last text run always ends
+        # before markup and html.parser never holds it back waiting for
+        # the rest of a character reference
+        pieces: list[str] = []
+        skip_depth = 0
+        for kind, value in ops[first:stop]:
+            if kind == _TEXT:
+                if skip_depth == 0:
+                    pieces.append(value)
+            elif kind == _START:
+                if value in _SKIP_TAGS:
+                    skip_depth += 1
+                if value in _BLOCK_TAGS and pieces and pieces[-1] != "\n":
+                    pieces.append("\n")
+                if value == "br":
+                    pieces.append("\n")
+            else:
+                if value in _SKIP_TAGS:
+                    skip_depth = max(0, skip_depth - 1)
+                if value in _BLOCK_TAGS and pieces and pieces[-1] != "\n":
+                    pieces.append("\n")
+        return "".join(pieces)
+
+
+def _stdlib_html_to_text(html: str) -> str:
+    from .structure import html_to_text
+    return html_to_text(html)
+
+
+def html_to_text_lxml(html: str) -> str:
+    """Drop-in replacement for structure.html_to_text using lxml."""
+    return XhtmlText(html).text()
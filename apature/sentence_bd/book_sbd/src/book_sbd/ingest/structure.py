@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from html.parser import HTMLParser
 from urllib.parse import urldefrag
 
+from ..constants import TEXT_EXTRACTORS
 from .epub_parser import EpubData, NavEntry, SpineItem
 from .boilerplate import is_boilerplate_spine_doc, strip_gutenberg_text
 
@@ -67,6 +68,26 @@ def html_to_text(html: str) -> str:
     return extractor.get_text()
 
 
+class _StdlibText:
+    """Spine document text via html_to_text, re-parsing each slice."""
+
+    def __init__(self, html: str):
+        self.html = html
+
+    def text(self, start: int = 0, end: int | None = None) -> str:
+        if start == 0 and end is None:
+            return html_to_text(self.html)
+        return html_to_text(self.html[start:end])
+
+
+def _document_text(html: str, extractor: str):
+    """Text source for one spine document: .text(start, end) of any slice."""
+    if extractor == "lxml":
+        from .lxml_text import XhtmlText
+        return XhtmlText(html)
+    return _StdlibText(html)
+
+
 # Patterns for entries to always SKIP (front/back matter, non-content)
 _SKIP_PATTERNS = [
     re.compile(r"(?i)^\s*contents?\s*$"),
@@ -190,20 +211,25 @@ def _get_spine_href_map(epub_data: EpubData) -> dict[str, int]:
     return href_map
 
 
-def extract_chapters(epub_data: EpubData, slug: str = "") -> list[ChapterUnit]:
+def extract_chapters(
+    epub_data: EpubData, slug: str = "", extractor: str = "stdlib",
+) -> list[ChapterUnit]:
     """Extract chapter units from parsed EPUB data.
 
     Args:
         epub_data: Parsed EPUB data.
         slug: Book slug for per-book overrides.
+        extractor: HTML-to-text implementation, one of TEXT_EXTRACTORS.
     """
+    if extractor not in TEXT_EXTRACTORS:
+        raise ValueError(f"Unknown text extractor {extractor!r} (expected one of {TEXT_EXTRACTORS})")
     href_map = _get_spine_href_map(epub_data)
     content_entries = _filter_content_entries(epub_data.nav_entries, slug)
 
     if not content_entries:
-        return _fallback_spine_chapters(epub_data)
+        return _fallback_spine_chapters(epub_data, extractor)
 
-    chapters = _nav_to_chapters(content_entries, epub_data, href_map)
+    chapters = _nav_to_chapters(content_entries, epub_data, href_map, extractor)
 
     for i, ch in enumerate(chapters):
         ch.number = i + 1
@@ -211,6 +237,23 @@ def extract_chapters(epub_data: EpubData, slug: str = "") -> list[ChapterUnit]:
     return chapters
 
 
+def chapter_nav_entries(epub_data: EpubData, slug: str = "") -> list[tuple[NavEntry, int]]:
+    """Content nav entries that resolve to a spine document, with its index.
+
+    Uses only the nav/spine structure, never document bodies, so it is an
+    upper bound on extract_chapters(): entries whose text turns out to be
+    boilerplate or empty are dropped there. An empty list means
+    extract_chapters() falls back to one chapter per spine document.
+    """
+    href_map = _get_spine_href_map(epub_data)
+    resolved = []
+    for entry in _filter_content_entries(epub_data.nav_entries, slug):
+        spine_idx = href_map.get(urldefrag(entry.href)[0])
+        if spine_idx is not None:
+            resolved.append((entry, spine_idx))
+    return resolved
+
+
 def _filter_content_entries(entries: list[NavEntry], slug: str) -> list[NavEntry]:
     """Filter nav entries to only content chapters."""
     override = BOOK_OVERRIDES.get(slug)
@@ -258,10 +301,13 @@ def _nav_to_chapters(
     entries: list[NavEntry],
     epub_data: EpubData,
     href_map: dict[str, int],
+    extractor: str = "stdlib",
 ) -> list[ChapterUnit]:
     """Convert nav entries to chapter units with extracted text."""
     chapters = []
     spine_items = epub_data.spine_items
+    anchor_indexes: dict[int, _AnchorIndex] = {}
+    documents: dict[int, object] = {}
 
     for i, entry in enumerate(entries):
         base_href, fragment = urldefrag(entry.href)
@@ -282,20 +328,27 @@ def _nav_to_chapters(
         next_base_href = urldefrag(next_entry.href)[0] if next_entry else None
         same_file_next = next_base_href == base_href if next_base_href else False
 
+        anchors = anchor_indexes.get(spine_idx)
+        if anchors is None and (fragment or same_file_next):
+            anchors = anchor_indexes[spine_idx] = _AnchorIndex(item.content)
+        doc = documents.get(spine_idx)
+        if doc is None:
+            doc = documents[spine_idx] = _document_text(item.content, extractor)
+
         if fragment and same_file_next:
             next_fragment = urldefrag(next_entry.href)[1]
-            text = _extract_between_fragments(item.content, fragment, next_fragment)
+            text = _extract_between_fragments(anchors, doc, fragment, next_fragment)
         elif fragment:
-            text = _extract_from_fragment(item.content, fragment)
+            text = _extract_from_fragment(anchors, doc, fragment)
         else:
             if same_file_next:
                 next_fragment = urldefrag(next_entry.href)[1]
                 if next_fragment:
-                    text = _extract_until_fragment(item.content, next_fragment)
+                    text = _extract_until_fragment(anchors, doc, next_fragment)
                 else:
-                    text = html_to_text(item.content)
+                    text = doc.text()
             else:
-                text = html_to_text(item.content)
+                text = doc.text()
 
         # Always strip gutenberg markers if present
         if _has_gutenberg_markers(text):
@@ -385,31 +438,36 @@ def _has_gutenberg_markers(text: str) -> bool:
     )
 
 
-def _extract_between_fragments(html: str, frag_start: str, frag_end: str) -> str:
-    start_pos = _find_fragment_pos(html, frag_start)
-    end_pos = _find_fragment_pos(html, frag_end)
+def _extract_between_fragments(anchors: _AnchorIndex, doc, frag_start: str, frag_end: str) -> str:
+    start_pos = anchors.find(frag_start)
+    end_pos = anchors.find(frag_end)
     if start_pos is None:
         return ""
     if end_pos is None:
-        return html_to_text(html[start_pos:])
-    return html_to_text(html[start_pos:end_pos])
+        return doc.text(start_pos)
+    return doc.text(start_pos, end_pos)
 
 
-def _extract_from_fragment(html: str, fragment: str) -> str:
-    pos = _find_fragment_pos(html, fragment)
+def _extract_from_fragment(anchors: _AnchorIndex, doc, fragment: str) -> str:
+    pos = anchors.find(fragment)
     if pos is None:
-        return html_to_text(html)
-    return html_to_text(html[pos:])
+        return doc.text()
+    return doc.text(pos)
 
 
-def _extract_until_fragment(html: str, fragment: str) -> str:
-    pos = _find_fragment_pos(html, fragment)
+def _extract_until_fragment(anchors: _AnchorIndex, doc, fragment: str) -> str:
+    pos = anchors.find(fragment)
     if pos is None:
-        return html_to_text(html)
-    return html_to_text(html[:pos])
+        return doc.text()
+    return doc.text(0, pos)
 
 
 def _find_fragment_pos(html: str, fragment: str) -> int | None:
+    """Locate the tag carrying id/name == fragment by scanning the whole document.
+
+    Reference lookup; _AnchorIndex.find() gives the same answer from its
+    index and only falls back to this for values it cannot key exactly.
+    """
     if not fragment:
         return None
     patterns = [
@@ -426,14 +484,61 @@ def _find_fragment_pos(html: str, fragment: str) -> int | None:
     return None
 
 
-def _fallback_spine_chapters(epub_data: EpubData) -> list[ChapterUnit]:
+# Every id=/name= attribute with a quoted value. Zero-width so overlapping
+# candidates (e.g. an id="..." inside another attribute's value) are all
+# seen, exactly as separate re.search() calls would see them.
+_ANCHOR_ATTR_RE = re.compile(
+    r"""(?=(id|name)\s*=\s*(?:"([^"]*)"|'([^']*)'))""", re.IGNORECASE,
+)
+
+
+class _AnchorIndex:
+    """First position of every id/name anchor in one spine document.
+
+    Built with one scan, so looking up each nav fragment of a document that
+    holds many chapters is a dict lookup rather than four case-insensitive
+    searches of the whole document. Lookups follow _find_fragment_pos()'s
+    priority: id="", id='', name="", name=''.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        # One table per (attribute, quote style), in lookup priority order
+        self._tables: tuple[dict[str, int], ...] = ({}, {}, {}, {})
+        # Values are keyed by str.lower(), which equals re.IGNORECASE
+        # matching only for ASCII; anything else takes the slow path
+        self._ascii = True
+        for m in _ANCHOR_ATTR_RE.finditer(html):
+            attr, double, single = m.groups()
+            value = double if double is not None else single
+            if not value.isascii():
+                self._ascii = False
+            kind = (0 if len(attr) == 2 else 2) + (0 if double is not None else 1)
+            self._tables[kind].setdefault(value.lower(), m.start())
+
+    def find(self, fragment: str) -> int | None:
+        """Start of the tag whose id/name is fragment, or None."""
+        if not fragment:
+            return None
+        if not (self._ascii and fragment.isascii()) or '"' in fragment or "'" in fragment:
+            return _find_fragment_pos(self.html, fragment)
+        key = fragment.lower()
+        for table in self._tables:
+            pos = table.get(key)
+            if pos is not None:
+                tag_start = self.html.rfind("<", 0, pos)
+                return tag_start if tag_start >= 0 else pos
+        return None
+
+
+def _fallback_spine_chapters(epub_data: EpubData, extractor: str = "stdlib") -> list[ChapterUnit]:
     """Fallback: use non-boilerplate spine docs as chapters."""
     chapters = []
     num = 1
     for item in epub_data.spine_items:
         if is_boilerplate_spine_doc(item.content):
             continue
-        text = html_to_text(item.content)
+        text = _document_text(item.content, extractor).text()
         text = strip_gutenberg_text(text) if _has_gutenberg_markers(text) else text
         text = text.strip()
         if text and len(text) >= 10:
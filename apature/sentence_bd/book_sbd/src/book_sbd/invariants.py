@@ -10,7 +10,7 @@ v1.1.0 additions:
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, Iterator
 
 
 def check_chapter_numbers_contiguous(chapters: list[dict]) -> list[str]:
@@ -136,33 +136,57 @@ def check_no_separator_sentences(chapter: dict) -> list[str]:
     return errors
 
 
+_NON_WHITESPACE_RE = re.compile(r"\S")
+
+
+def _uncovered_gaps(sentences: list[dict], length: int) -> Iterator[tuple[int, int]]:
+    """(start, end) ranges of [0, length) that no sentence span covers.
+
+    Spans are sorted by start (a no-op for well-formed chapters) and swept
+    once, so the cost is O(S log S) in the number of sentences whatever the
+    chapter length. Overlapping, unsorted and empty spans are handled.
+    """
+    spans = sorted(
+        (s.get("start", 0), s.get("end", 0)) for s in sentences
+    )
+    covered = 0  # everything before this offset is covered or already yielded
+    for start, end in spans:
+        if end <= start:
+            continue
+        if start > covered:
+            yield covered, min(start, length)
+            if start >= length:
+                return
+        covered = max(covered, end)
+    if covered < length:
+        yield covered, length
+
+
 def check_coverage(chapter: dict, segmentation_text: str) -> list[str]:
     """All non-whitespace chars in segmentation_text must belong to a span.
 
     Scope: applies to post-normalization text only (after boilerplate removal,
     heading stripping, separator removal). Front/back matter and dropped
     separator lines are excluded by design.
+
+    Only the gaps between spans are searched for non-whitespace, so memory
+    is O(sentences) rather than O(chapter length).
     """
     errors = []
-    sentences = chapter.get("sentences", [])
-
-    # Build set of all covered character positions
-    covered = set()
-    for s in sentences:
-        for i in range(s.get("start", 0), s.get("end", 0)):
-            covered.add(i)
-
-    # Check every non-whitespace char is covered
-    uncovered = []
-    for i, ch in enumerate(segmentation_text):
-        if not ch.isspace() and i not in covered:
-            uncovered.append(i)
+    uncovered = 0
+    sample = []
+    for gap_start, gap_end in _uncovered_gaps(
+        chapter.get("sentences", []), len(segmentation_text),
+    ):
+        for m in _NON_WHITESPACE_RE.finditer(segmentation_text, gap_start, gap_end):
+            uncovered += 1
+            if len(sample) < 5:
+                sample.append(m.start())
 
     if uncovered:
-        sample = uncovered[:5]
         chars = [f"pos {i}: {segmentation_text[i]!r}" for i in sample]
         errors.append(
-            f"Chapter {chapter.get('number')}: {len(uncovered)} uncovered "
+            f"Chapter {chapter.get('number')}: {uncovered} uncovered "
             f"non-whitespace chars (first: {', '.join(chars)})"
         )
 
@@ -198,3 +222,29 @@ def validate_book(book: dict, canonical_texts: dict[int, str] | None = None) ->
             errors.extend(check_coverage(ch, ct))
 
     return errors
+
+
+def validate_export(json_path: str) -> list[str]:
+    """Run validate_book on an exported {slug}.json.
+
+    Span, text and coverage checks need the canonical chapter texts, which
+    the v1.1.0 document does not carry; they run when the book's
+    {slug}.compact.json export sits next to it.
+    """
+    import json
+    import os
+
+    from .compact import CompactBook
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        book = json.load(f)
+
+    canonical_texts = None
+    compact_path = os.path.join(
+        os.path.dirname(json_path), f"{book.get('slug')}.compact.json",
+    )
+    if os.path.exists(compact_path):
+        compact = CompactBook.load(compact_path)
+        canonical_texts = {ch.number: ch.text for ch in compact.chapters}
+
+    return validate_book(book, canonical_texts)
@@ -0,0 +1,154 @@
+"""Pipeline instrumentation: structured events from process_book.
+
+process_book(observer=...) reports what each book did as events, each a
+name plus keyword fields (always including the book's slug):
+
+  book_start   bytes_in
+  stage_start  stage
+  stage_end    stage, seconds, plus per-stage fields:
+               setup (segmenter and stage-cache keys): none;
+               ingest: chapters, chars_out; segment: chapters, sentences,
+               steps ({step: seconds} for canonicalize, segment and patch
+               when computed serially, and number); export: formats, bytes_out
+  chapter      number, chars, sentences, seconds
+  patch_rules  merges ({rule name: spans merged}, summed over chapter
+               workers with --chapter-jobs; not sent when the spans are
+               read from the cache, since no rule runs)
+  cache        stage, hit (only with a stage cache)
+  book_end     seconds, chapters, sentences
+
+Every call site checks `observer is not None` first, so with no observer
+the pipeline does no extra work. Two sinks are built in: JsonLinesObserver
+appends one JSON object per event to a file, and MemoryObserver
+aggregates events in memory.
+
+Book pools (parallel.run_books / eval_books with jobs > 1) pickle the
+observer into each worker, so only observers with process_safe = True
+(JsonLinesObserver, which reopens its file there) are accepted; for a
+pooled run, aggregate afterwards with MemoryObserver.from_jsonl().
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from abc import ABC, abstractmethod
+
+
+class Observer(ABC):
+    """Abstract receiver of pipeline events."""
+
+    # True when copies pickled into pool workers still deliver every event
+    # to the same place
+    process_safe = False
+
+    @abstractmethod
+    def event(self, name: str, **fields) -> None:
+        """Handle one event (see the module docstring for names and fields)."""
+
+
+class JsonLinesObserver(Observer):
+    """Append each event to a JSON-lines file as {"event", "time", **fields}.
+
+    The file is opened in append mode on first use and each event is one
+    write, so batch workers can share a log. Pickles by path (the handle is
+    reopened in the receiving process).
+    """
+
+    process_safe = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+
+    def event(self, name: str, **fields) -> None:
+        if self._f is None:
+            self._f = open(self.path, "a", encoding="utf-8", newline="\n")
+        record = {"event": name, "time": time.time(), **fields}
+        self._f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._f.flush()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "_f": None}
+
+
+class MemoryObserver(Observer):
+    """Aggregate events in memory.
+
+    In-process only: a copy pickled into a pool worker would aggregate
+    there and its totals would be lost, so book pools reject it.
+
+    stage_seconds / stage_calls: total time and count per stage.
+    step_seconds: total time per step within the segment stage.
+    rule_merges: spans merged per patch rule, over all books.
+    cache_hits / cache_misses: per stage.
+    books: slug -> book_end fields (seconds, chapters, sentences).
+    counters: bytes_in, bytes_out, chapters, sentences.
+    """
+
+    def __init__(self):
+        self.stage_seconds: dict[str, float] = {}
+        self.stage_calls: dict[str, int] = {}
+        self.step_seconds: dict[str, float] = {}
+        self.rule_merges: dict[str, int] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.cache_misses: dict[str, int] = {}
+        self.books: dict[str, dict] = {}
+        self.counters = {"bytes_in": 0, "bytes_out": 0, "chapters": 0, "sentences": 0}
+
+    def event(self, name: str, **fields) -> None:
+        if name == "stage_end":
+            stage = fields["stage"]
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + fields["seconds"]
+            self.stage_calls[stage] = self.stage_calls.get(stage, 0) + 1
+            self.counters["bytes_out"] += fields.get("bytes_out", 0)
+            for step, seconds in fields.get("steps", {}).items():
+                self.step_seconds[step] = self.step_seconds.get(step, 0.0) + seconds
+        elif name == "patch_rules":
+            for rule, merged in fields["merges"].items():
+                self.rule_merges[rule] = self.rule_merges.get(rule, 0) + merged
+        elif name == "cache":
+            counts = self.cache_hits if fields["hit"] else self.cache_misses
+            counts[fields["stage"]] = counts.get(fields["stage"], 0) + 1
+        elif name == "book_start":
+            self.counters["bytes_in"] += fields["bytes_in"]
+        elif name == "book_end":
+            self.books[fields["slug"]] = {
+                key: fields[key] for key in ("seconds", "chapters", "sentences")
+            }
+            self.counters["chapters"] += fields["chapters"]
+            self.counters["sentences"] += fields["sentences"]
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> MemoryObserver:
+        """Aggregate a JsonLinesObserver log."""
+        observer = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                record.pop("time", None)
+                observer.event(record.pop("event"), **record)
+        return observer
+
+    def slowest_books(self, n: int = 5) -> list[tuple[str, float]]:
+        """(slug, seconds) of the n slowest books, slowest first."""
+        ranked = sorted(self.books.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        return [(slug, book["seconds"]) for slug, book in ranked[:n]]
+
+    def summary(self) -> dict:
+        return {
+            "books": len(self.books),
+            "counters": dict(self.counters),
+            "stage_seconds": dict(self.stage_seconds),
+            "stage_calls": dict(self.stage_calls),
+            "step_seconds": dict(self.step_seconds),
+            "rule_merges": dict(self.rule_merges),
+            "cache_hits": dict(self.cache_hits),
+            "cache_misses": dict(self.cache_misses),
+            "slowest_books": self.slowest_books(),
+        }
@@ -0,0 +1,229 @@
+"""Process-pool helpers for running the pipeline over many books or chapters.
+
+Book mode: workers build their segmenter once in the pool initializer and
+reuse it for every book they are handed. Console output from each book is
+captured in the worker and returned to the parent, which replays it in input
+order so a parallel batch prints exactly what a serial batch would. Eval
+workers return a metrics record per book instead.
+
+Chapter mode: all chapter texts of one book are packed into a single UTF-8
+shared-memory block. Workers attach to it once and receive only
+(byte_start, byte_end) pairs, so chapter text is never pickled on the way in.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, Iterator
+
+from .constants import EVAL_TOLERANCE
+
+# Per-worker segmenter, created once by the pool initializer
+_worker_segmenter = None
+
+# Per-worker handle on the shared chapter-text block (chapter mode)
+_worker_shm: shared_memory.SharedMemory | None = None
+# Whether chapter workers count patch rule merges (chapter mode)
+_worker_count_rules = False
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Normalize a --jobs value: None/1 -> serial, 0 -> one per CPU."""
+    if jobs is None:
+        return 1
+    if jobs < 0:
+        raise ValueError(f"jobs must be 0 or more, got {jobs}")
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def imap_ordered(
+    func: Callable,
+    items: Iterable,
+    jobs: int,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> Iterator:
+    """Map func over items in a process pool, yielding results in input order.
+
+    With jobs <= 1 the work runs in-process (initializer included), which
+    keeps serial and parallel runs on the same code path.
+    """
+    items = list(items)
+    if jobs <= 1 or len(items) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in items:
+            yield func(item)
+        return
+
+    workers = min(jobs, len(items))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs,
+    ) as executor:
+        yield from executor.map(func, items)
+
+
+def _init_book_worker(backend: str = "punkt") -> None:
+    """Pool initializer: build the segmenter (and load Punkt) once per worker."""
+    global _worker_segmenter
+    from .segment.base import get_segmenter
+    _worker_segmenter = get_segmenter(backend)
+    if backend == "punkt":
+        from .segment.punkt_backend import load_tokenizer
+        load_tokenizer()
+
+
+def _run_book(job: tuple[str, str, dict]) -> str:
+    """Process one book in a worker and return its captured console output."""
+    from .cli import process_book
+
+    epub_path, meta_path, options = job
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        process_book(
+            epub_path, meta_path,
+            segmenter=_worker_segmenter,
+            **options,
+        )
+    return buf.getvalue()
+
+
+def _check_observers(jobs_list: list[tuple], jobs: int) -> None:
+    """Reject observers whose events would be lost in pool workers."""
+    if jobs <= 1:
+        return
+    for job in jobs_list:
+        observer = job[-1].get("observer")
+        if observer is not None and not observer.process_safe:
+            raise ValueError(
+                f"{type(observer).__name__} cannot collect events from pool workers; "
+                "use a JsonLinesObserver and MemoryObserver.from_jsonl()"
+            )
+
+
+def run_books(
+    jobs_list: list[tuple[str, str, dict]],
+    jobs: int,
+    backend: str = "punkt",
+) -> Iterator[str]:
+    """Run process_book over (epub, meta, process_book kwargs) tuples.
+
+    Each worker builds one segmenter for the named backend. Yields each
+    book's console output in input order. With jobs > 1, an observer in
+    the kwargs must be process-safe (see observe.py).
+    """
+    _check_observers(jobs_list, jobs)
+    yield from imap_ordered(
+        _run_book, jobs_list, jobs,
+        initializer=_init_book_worker, initargs=(backend,),
+    )
+
+
+def _eval_book(job: tuple[str, str, str, dict], tolerance: int) -> dict:
+    """Process one gold book in a worker and return its metrics record."""
+    from .cli import process_book
+    from .eval import book_metrics_record, load_gold
+
+    gold_path, epub_path, meta_path, options = job
+    gold = load_gold(gold_path)
+    start = time.perf_counter()
+    book_data = process_book(
+        epub_path, meta_path,
+        segmenter=_worker_segmenter,
+        **options,
+    )
+    return book_metrics_record(book_data, gold, time.perf_counter() - start, tolerance)
+
+
+def eval_books(
+    jobs_list: list[tuple[str, str, str, dict]],
+    jobs: int,
+    backend: str = "punkt",
+    tolerance: int = EVAL_TOLERANCE,
+) -> Iterator[dict]:
+    """Evaluate (gold, epub, meta, process_book kwargs) tuples.
+
+    Books run through process_book exactly as in batch, so cached stages
+    are reused. Boundaries match within tolerance characters. Yields each
+    book's metrics record in input order.
+    """
+    _check_observers(jobs_list, jobs)
+    yield from imap_ordered(
+        partial(_eval_book, tolerance=tolerance), jobs_list, jobs,
+        initializer=_init_book_worker, initargs=(backend,),
+    )
+
+
+def _init_chapter_worker(shm_name: str, segmenter, count_rules: bool = False) -> None:
+    """Pool initializer: attach to the chapter block, keep the segmenter."""
+    global _worker_shm, _worker_segmenter, _worker_count_rules
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not add a second owner; the parent unlinks the block when done.
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_segmenter = segmenter
+    _worker_count_rules = count_rules
+
+
+def _run_chapter(byte_range: tuple[int, int]) -> tuple[tuple, dict[str, int] | None]:
+    """Decode one chapter from shared memory and run Stages 2-5 on it.
+
+    Returns (process_chapter result, patch rule merge counts or None).
+    """
+    from .pipeline import process_chapter
+
+    start, end = byte_range
+    text = bytes(_worker_shm.buf[start:end]).decode("utf-8")
+    counts = {} if _worker_count_rules else None
+    return process_chapter(text, _worker_segmenter, counts), counts
+
+
+def process_chapters_shared(
+    texts: list[str],
+    segmenter,
+    jobs: int,
+    rule_counts: dict[str, int] | None = None,
+) -> list[tuple[str, list[dict], list[tuple[int, int]], list[tuple[int, int]]]]:
+    """Run process_chapter over texts in a pool, results in chapter order.
+
+    Chapter texts are handed to workers through one shared-memory block.
+    rule_counts, if given, accumulates the patch rule merges of every
+    chapter (each worker counts its chapters and the totals are summed here).
+    """
+    encoded = [t.encode("utf-8") for t in texts]
+    ranges = []
+    offset = 0
+    for data in encoded:
+        ranges.append((offset, offset + len(data)))
+        offset += len(data)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for data, (start, end) in zip(encoded, ranges):
+            shm.buf[start:end] = data
+        del encoded
+
+        workers = min(jobs, len(texts))
+        # Small chunks keep long and short chapters balanced across workers
+        chunksize = max(1, len(ranges) // (workers * 8))
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chapter_worker,
+            initargs=(shm.name, segmenter, rule_counts is not None),
+        ) as executor:
+            for result, counts in executor.map(_run_chapter, ranges, chunksize=chunksize):
+                results.append(result)
+                for rule, merged in (counts or {}).items():
+                    rule_counts[rule] = rule_counts.get(rule, 0) + merged
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
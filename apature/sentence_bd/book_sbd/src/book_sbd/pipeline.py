@@ -8,11 +8,16 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .canonicalize import canonicalize
 from .ingest.epub_parser import parse_epub
 from .ingest.structure import extract_chapters, ChapterUnit
+from .segment.base import Segmenter
+from .segment.patch_rules import apply_patch_rules
+from .segment.text_modes import BlockIndex, apply_text_modes, as_block_index, get_sentence_type
 
 
 # Expected chapter counts (from plan, with actuals updated per-edition)
@@ -38,6 +43,11 @@ EXPECTED_CHAPTERS = {
     "war-and-peace": (365, 5),
 }
 
+# Stage outputs that can be served from a StageCache, in pipeline order:
+# chapter units, canonical/mode-normalized text + block metadata,
+# segmenter baseline spans, patched spans
+CACHE_STAGES = ("ingest", "canonical", "baseline", "spans")
+
 LICENSE_MARKERS = [
     "PROJECT GUTENBERG",
     "GUTENBERG LICENSE",
@@ -46,10 +56,11 @@ LICENSE_MARKERS = [
 ]
 
 
-def ingest_book(epub_path: str, meta_path: str) -> dict:
+def ingest_book(epub_path: str, meta_path: str, extractor: str = "stdlib") -> dict:
     """Stage 1: Parse EPUB and extract chapter units.
 
-    Returns dict with metadata and chapter units.
+    extractor selects the XHTML-to-text implementation (see
+    structure.TEXT_EXTRACTORS). Returns dict with metadata and chapter units.
     """
     slug = os.path.basename(epub_path).replace(".epub", "")
 
@@ -57,11 +68,10 @@ def ingest_book(epub_path: str, meta_path: str) -> dict:
     with open(meta_path, "r", encoding="utf-8") as f:
         meta = json.load(f)
 
-    # Parse EPUB
-    epub_data = parse_epub(epub_path)
-
-    # Extract chapters
-    chapters = extract_chapters(epub_data, slug=slug)
+    # Parse EPUB (spine documents are read as chapter extraction needs them)
+    with parse_epub(epub_path) as epub_data:
+        # Extract chapters
+        chapters = extract_chapters(epub_data, slug=slug, extractor=extractor)
 
     return {
         "slug": slug,
@@ -70,6 +80,163 @@ def ingest_book(epub_path: str, meta_path: str) -> dict:
     }
 
 
+def prepare_chapter(text: str) -> tuple[str, BlockIndex]:
+    """Stages 2 + text modes: canonicalize and mode-normalize one chapter.
+
+    Returns (processed_text, block_metadata).
+    """
+    canonical = canonicalize(text)
+    return apply_text_modes(canonical)
+
+
+def patch_chapter(
+    processed_text: str,
+    baseline: list[tuple[int, int]],
+    block_metadata: list[dict],
+    counts: dict[str, int] | None = None,
+) -> list[tuple[int, int]]:
+    """Stage 5: apply patch rules to a chapter's baseline spans.
+
+    counts, if given, accumulates merges per rule (see apply_patch_rules).
+    """
+    baseline = [tuple(span) for span in baseline]
+    return apply_patch_rules(processed_text, baseline, block_metadata, counts=counts)
+
+
+def build_sentences(
+    processed_text: str,
+    spans: list[tuple[int, int]],
+    block_metadata: list[dict],
+) -> list[dict]:
+    """Turn final spans into numbered, typed sentence dicts."""
+    block_metadata = as_block_index(block_metadata)
+    sentences = []
+    for i, (start, end) in enumerate(spans):
+        sent_type = get_sentence_type(start, end, block_metadata)
+        sentences.append({
+            "number": i + 1,
+            "start": start,
+            "end": end,
+            "text": processed_text[start:end],
+            "type": sent_type,
+        })
+    return sentences
+
+
+def process_chapter(
+    text: str, segmenter: Segmenter, counts: dict[str, int] | None = None,
+) -> tuple[str, list[dict], list[tuple[int, int]], list[tuple[int, int]]]:
+    """Run Stages 2-5 on one chapter's raw text.
+
+    Returns (processed_text, block_metadata, baseline_spans, spans).
+    counts, if given, accumulates patch rule merges (see patch_chapter).
+    """
+    processed_text, block_metadata = prepare_chapter(text)
+    baseline = segmenter.segment(processed_text)
+    spans = patch_chapter(processed_text, baseline, block_metadata, counts)
+    return processed_text, block_metadata, baseline, spans
+
+
+def iter_chapter_spans(
+    chapters: list[ChapterUnit],
+    stages,
+    segmenter: Segmenter,
+    rule_counts: dict[str, int] | None = None,
+    step_seconds: dict[str, float] | None = None,
+    chapter_jobs: int = 1,
+):
+    """Yield (chapter, processed_text, block_metadata, spans) in chapter order.
+
+    Each stage is read from the BookStages cache when its entry is valid and
+    otherwise computed. Baseline segmentation goes through one
+    segmenter.segment_many call over every chapter, so a backend can batch
+    or pool its work; patching still runs one chapter at a time as callers
+    consume (and write out) the results. Newly computed stage outputs are
+    stored once the generator is exhausted. rule_counts accumulates patch
+    rule merges for the chapters whose spans are computed here.
+    step_seconds, if given, accumulates the time spent computing each step
+    here: "canonicalize" (canonicalization and text modes), "segment" and
+    "patch"; steps read from the cache add nothing.
+
+    With chapter_jobs > 1 and no valid canonical entry, every chapter is
+    instead run through Stages 2-5 at once in a process pool (see
+    parallel.process_chapters_shared); step_seconds is then left untouched.
+    """
+    canonical = stages.get("canonical")
+    if canonical is None and chapter_jobs > 1 and len(chapters) > 1:
+        from .parallel import process_chapters_shared
+        results = process_chapters_shared(
+            [ch.text for ch in chapters], segmenter, chapter_jobs, rule_counts,
+        )
+        stages.put("canonical", [{"text": t, "blocks": b} for t, b, _bl, _s in results])
+        stages.put("baseline", [baseline for _t, _b, baseline, _s in results])
+        stages.put("spans", [spans for _t, _b, _baseline, spans in results])
+        for ch, (t, b, _bl, s) in zip(chapters, results):
+            yield ch, t, b, [tuple(span) for span in s]
+        return
+
+    all_spans = stages.get("spans")
+    baselines = stages.get("baseline") if all_spans is None else None
+    timed = step_seconds is not None
+
+    if canonical is not None:
+        prepared = ((c["text"], BlockIndex(c["blocks"])) for c in canonical)
+    else:
+        prepared = (prepare_chapter(ch.text) for ch in chapters)
+        if timed:
+            prepared = _timed(prepared, step_seconds, "canonicalize")
+
+    new_baselines = None
+    if all_spans is None and baselines is None:
+        prepared = list(prepared)
+        t0 = time.perf_counter()
+        baselines = new_baselines = segmenter.segment_many(
+            [processed_text for processed_text, _blocks in prepared]
+        )
+        if timed:
+            _add_seconds(step_seconds, "segment", t0)
+
+    new_canonical, new_spans = [], []
+    for i, (ch, (processed_text, block_metadata)) in enumerate(zip(chapters, prepared)):
+        if canonical is None:
+            new_canonical.append({"text": processed_text, "blocks": block_metadata})
+
+        if all_spans is not None:
+            spans = all_spans[i]
+        else:
+            t0 = time.perf_counter() if timed else 0.0
+            spans = patch_chapter(processed_text, baselines[i], block_metadata, rule_counts)
+            if timed:
+                _add_seconds(step_seconds, "patch", t0)
+            new_spans.append(spans)
+
+        yield ch, processed_text, block_metadata, [tuple(span) for span in spans]
+
+    if canonical is None:
+        stages.put("canonical", new_canonical)
+    if all_spans is None:
+        if new_baselines is not None:
+            stages.put("baseline", new_baselines)
+        stages.put("spans", new_spans)
+
+
+def _add_seconds(step_seconds: dict[str, float], step: str, t0: float) -> None:
+    step_seconds[step] = step_seconds.get(step, 0.0) + time.perf_counter() - t0
+
+
+def _timed(items, step_seconds: dict[str, float], step: str):
+    """Yield from items, adding the time spent producing each to step_seconds."""
+    items = iter(items)
+    while True:
+        t0 = time.perf_counter()
+        try:
+            item = next(items)
+        except StopIteration:
+            return
+        _add_seconds(step_seconds, step, t0)
+        yield item
+
+
 def write_chapter_units_json(book_data: dict, build_dir: str) -> str:
     """Write Stage 1 intermediate chapter units JSON.
 
@@ -120,3 +287,81 @@ def sha256_file(path: str) -> str:
         for chunk in iter(lambda: f.read(8192), b""):
             h.update(chunk)
     return h.hexdigest()
+
+
+def chapters_to_json(chapters: list[ChapterUnit]) -> list[dict]:
+    """Serialize chapter units for caching."""
+    return [
+        {"number": ch.number, "label": ch.label, "text": ch.text}
+        for ch in chapters
+    ]
+
+
+def chapters_from_json(data: list[dict]) -> list[ChapterUnit]:
+    """Rebuild chapter units from chapters_to_json() output."""
+    return [
+        ChapterUnit(number=d["number"], label=d["label"], text=d["text"])
+        for d in data
+    ]
+
+
+def _source_hash(*modules) -> str:
+    """Hash the source files of the given modules."""
+    h = hashlib.sha256()
+    for module in modules:
+        path = module.__file__
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def stage_fingerprints(
+    slug: str, segmenter: Segmenter, extractor: str = "stdlib",
+) -> dict[str, str]:
+    """Fingerprint per cacheable stage for one book.
+
+    A stage's fingerprint covers the source of the modules that implement
+    it, its settings, and its upstream stage's fingerprint. Editing
+    patch_rules.py therefore only invalidates "spans", while a text_modes
+    threshold change invalidates "canonical" and everything after it.
+    """
+    import sys
+
+    from .cache import config_hash
+    from . import canonicalize as canonicalize_mod
+    from .ingest import boilerplate, epub_parser, structure
+    from .segment import abbreviations, patch_rules, text_modes
+
+    ingest_modules = [epub_parser, structure, boilerplate]
+    if extractor == "lxml":
+        from .ingest import lxml_text
+        ingest_modules.append(lxml_text)
+    ingest = config_hash({
+        "source": _source_hash(*ingest_modules),
+        "override": structure.BOOK_OVERRIDES.get(slug),
+        "extractor": extractor,
+    })
+    canonical = config_hash({
+        "upstream": ingest,
+        "source": _source_hash(canonicalize_mod, text_modes),
+    })
+    segmenter_cls = type(segmenter)
+    baseline = config_hash({
+        "upstream": canonical,
+        "segmenter": [
+            segmenter_cls.__module__, segmenter_cls.__qualname__, segmenter.fingerprint(),
+        ],
+        "source": _source_hash(sys.modules[segmenter_cls.__module__]),
+    })
+    spans = config_hash({
+        "upstream": baseline,
+        "source": _source_hash(patch_rules, abbreviations),
+        "lexicon": patch_rules.ABBREVIATION_LEXICON.entries,
+    })
+    return {
+        "ingest": ingest,
+        "canonical": canonical,
+        "baseline": baseline,
+        "spans": spans,
+    }
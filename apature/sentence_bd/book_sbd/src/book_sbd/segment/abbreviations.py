@@ -0,0 +1,73 @@
+"""Abbreviation lexicon for the patch rules.
+
+The lexicon is a plain-text file, one abbreviation per line (see
+abbreviations.txt, shipped as package data). Entries are stored in a trie
+keyed on their characters in reverse, so testing whether a sentence ends
+with any abbreviation walks back over at most one entry's worth of
+characters, however large the lexicon grows.
+"""
+
+from __future__ import annotations
+
+import os
+from importlib import resources
+from typing import Iterable
+
+DEFAULT_LEXICON_FILE = "abbreviations.txt"
+
+# Trie key marking the end of an entry (never a single character)
+_END = ""
+
+
+def read_lexicon(path: str | os.PathLike | None = None) -> list[str]:
+    """Read abbreviations from a lexicon file (default: the packaged one).
+
+    Blank lines and lines starting with '#' are skipped; entries keep
+    their case as written.
+    """
+    if path is None:
+        text = resources.files(__package__).joinpath(DEFAULT_LEXICON_FILE).read_text(encoding="utf-8")
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    entries = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            entries.append(line)
+    return entries
+
+
+class AbbreviationLexicon:
+    """Case-insensitive abbreviation set with O(entry length) suffix tests."""
+
+    def __init__(self, abbreviations: Iterable[str]):
+        self.entries = frozenset(a.lower() for a in abbreviations if a)
+        self.max_len = max(map(len, self.entries), default=0)
+        self._trie: dict = {}
+        for entry in self.entries:
+            node = self._trie
+            for ch in reversed(entry):
+                node = node.setdefault(ch, {})
+            node[_END] = True
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike | None = None) -> "AbbreviationLexicon":
+        return cls(read_lexicon(path))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, abbreviation: str) -> bool:
+        return abbreviation.lower() in self.entries
+
+    def ends_with_entry(self, text: str) -> bool:
+        """True if text (already lowercased) ends with a lexicon entry."""
+        node = self._trie
+        for i in range(len(text) - 1, -1, -1):
+            node = node.get(text[i])
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class Segmenter(ABC):
@@ -24,3 +25,46 @@ class Segmenter(ABC):
             Spans are sorted, non-overlapping, and cover all non-whitespace.
         """
         ...
+
+    def segment_many(self, texts: Iterable[str]) -> list[list[tuple[int, int]]]:
+        """Segment several texts (e.g. every chapter of a book) in one call.
+
+        Returns one span list per text, in input order, each exactly what
+        segment() returns for that text. The default calls segment() on
+        each text in turn; backends override it to amortize setup or batch
+        work across texts.
+        """
+        return [self.segment(text) for text in texts]
+
+    def fingerprint(self) -> object:
+        """JSON-able description of everything besides source code that
+        determines this segmenter's spans (settings, model data).
+
+        Part of the "baseline" stage-cache fingerprint, together with the
+        backend module's source. The default is the instance's attributes;
+        backends that load a model override it to cover the model too.
+        """
+        return vars(self)
+
+
+# Backend name -> (module, class). Modules are imported on first use, so
+# picking one backend never loads another's dependencies (NLTK for punkt).
+_BACKENDS = {
+    "punkt": ("punkt_backend", "PunktSegmenter"),
+    "regex": ("regex_backend", "RegexSegmenter"),
+}
+SEGMENTER_BACKENDS = tuple(_BACKENDS)
+
+
+def get_segmenter(backend: str = "punkt", **kwargs) -> Segmenter:
+    """Build the segmenter for a backend name (see SEGMENTER_BACKENDS)."""
+    from importlib import import_module
+
+    try:
+        module_name, class_name = _BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"unknown segmenter backend {backend!r} (choose from {', '.join(_BACKENDS)})"
+        ) from None
+    module = import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)(**kwargs)
@@ -2,38 +2,131 @@
 
 Pipeline: baseline_spans -> apply_patch_rules(text, spans) -> final_spans
 
-Each rule is applied in order. Rules must preserve sorted, non-overlapping
-span invariant and not introduce empty sentences.
+The local rules (abbreviation, closing quote, ellipsis, exclamation) are
+BoundaryRule predicates over the join between the sentence built so far
+and the next span; merge_boundaries evaluates them in priority order in a
+single pass over the boundaries. Quoted-discourse merging and short-verse
+consolidation need paragraph and block context and run as their own passes
+afterwards. Rules must preserve sorted, non-overlapping span invariant and
+not introduce empty sentences.
 """
 
 from __future__ import annotations
 
 import re
+from array import array
+from dataclasses import dataclass
+from typing import Callable
 
+from .abbreviations import AbbreviationLexicon, read_lexicon
+from .text_modes import BlockIndex, as_block_index
 
-# Common abbreviations that should NOT trigger sentence breaks
-ABBREVIATIONS = {
-    "Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "Rev.", "Gen.", "Col.", "Sgt.",
-    "St.", "Jr.", "Sr.", "Ltd.", "Inc.", "Corp.", "Co.", "vs.", "etc.",
-    "Vol.", "No.", "Fig.", "Ch.", "Pt.", "Dept.", "Univ.",
-    "Jan.", "Feb.", "Mar.", "Apr.", "Jun.", "Jul.", "Aug.",
-    "Sep.", "Sept.", "Oct.", "Nov.", "Dec.",
-    "Ave.", "Blvd.", "Rd.", "Mt.", "Ft.",
-    "i.e.", "e.g.", "viz.", "cf.",
-}
 
-# Pre-compile for fast lookup
-_ABBREV_LOWER = {a.lower() for a in ABBREVIATIONS}
+# Common abbreviations that should NOT trigger sentence breaks, from the
+# packaged lexicon file (abbreviations.txt)
+ABBREVIATIONS = set(read_lexicon())
+ABBREVIATION_LEXICON = AbbreviationLexicon(ABBREVIATIONS)
 
 # Smart quote characters
 _OPEN_QUOTES = {"\u201c", "\u2018"}   # " '
 _CLOSE_QUOTES = {"\u201d", "\u2019"}  # " '
 
+# A span made only of closing punctuation/quotes
+_CLOSING_RE = re.compile(r'^[\s\'""\u201c\u201d\u2018\u2019)\]}>.,;:!?\-]+$')
+
+
+class Boundary:
+    """The join between the sentence built so far and the next span.
+
+    Offsets index text, so rules test characters and suffixes without
+    slicing either sentence out. prev_start is where the sentence built so
+    far starts and prev_end is just past its last non-whitespace character;
+    next_start/next_end bound the next span with surrounding whitespace
+    stripped (next_start == next_end for a whitespace-only span).
+    """
+
+    __slots__ = ("text", "prev_start", "prev_end", "next_start", "next_end")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.prev_start = self.prev_end = self.next_start = self.next_end = 0
+
+    def prev_endswith(self, suffix: str | tuple[str, ...]) -> bool:
+        return self.text.endswith(suffix, self.prev_start, self.prev_end)
+
+    def prev_tail(self, n: int) -> str:
+        """The last (at most) n characters of the previous sentence."""
+        return self.text[max(self.prev_start, self.prev_end - n):self.prev_end]
+
+    @property
+    def next_char(self) -> str:
+        """First non-whitespace character of the next span ('' if none)."""
+        if self.next_start < self.next_end:
+            return self.text[self.next_start]
+        return ""
+
+    @property
+    def next_text(self) -> str:
+        return self.text[self.next_start:self.next_end]
+
+
+@dataclass(frozen=True)
+class BoundaryRule:
+    """A named local merge rule: True merges the next span into the previous."""
+
+    name: str
+    should_merge: Callable[[Boundary], bool]
+
+
+def abbreviation_rule(lexicon: AbbreviationLexicon) -> BoundaryRule:
+    """Merge when the previous span ends with an entry of lexicon and the
+    next span starts lowercase."""
+    max_len = lexicon.max_len
+    ends_with_entry = lexicon.ends_with_entry
+
+    def should_merge(b: Boundary) -> bool:
+        # str.lower() maps character by character (bar final sigma), so
+        # lowering the last max_len characters gives the same suffix as
+        # lowering the whole sentence
+        return b.next_char.islower() and ends_with_entry(b.prev_tail(max_len).lower())
+
+    return BoundaryRule("abbreviation", should_merge)
+
+
+_ABBREVIATION_RULE = abbreviation_rule(ABBREVIATION_LEXICON)
+
+
+def _orphaned_closing_quote(b: Boundary) -> bool:
+    """Next span is at most 4 characters of closing punctuation/quotes."""
+    return b.next_end - b.next_start <= 4 and _CLOSING_RE.match(b.next_text) is not None
+
+
+def _ellipsis_continuation(b: Boundary) -> bool:
+    """Previous span ends with '...' or an ellipsis, next starts lowercase."""
+    return b.next_char.islower() and b.prev_endswith(("...", "\u2026"))
+
+
+def _exclamation_continuation(b: Boundary) -> bool:
+    """Previous span ends with '!', next starts lowercase."""
+    return b.next_char.islower() and b.prev_endswith("!")
+
+
+# Local rules in priority order. apply_patch_rules(rules=...) takes any
+# sequence of BoundaryRule, so extra rules join the same single pass.
+BOUNDARY_RULES: tuple[BoundaryRule, ...] = (
+    _ABBREVIATION_RULE,
+    BoundaryRule("closing_quote", _orphaned_closing_quote),
+    BoundaryRule("ellipsis", _ellipsis_continuation),
+    BoundaryRule("exclamation", _exclamation_continuation),
+)
+
 
 def apply_patch_rules(
     canonical_text: str,
     spans: list[tuple[int, int]],
     block_metadata: list[dict] | None = None,
+    rules: tuple[BoundaryRule, ...] = BOUNDARY_RULES,
+    counts: dict[str, int] | None = None,
 ) -> list[tuple[int, int]]:
     """Apply all patch rules to baseline spans.
 
@@ -41,79 +134,132 @@ def apply_patch_rules(
         canonical_text: The canonical chapter text.
         spans: Baseline sentence spans from segmenter.
         block_metadata: Optional list of block dicts with 'type', 'start', 'end'
-            from text mode classification. Used by quote-aware merge to skip
-            verse blocks.
+            from text mode classification, ideally the BlockIndex returned by
+            apply_text_modes. Used by quote-aware merge to skip verse blocks.
+        rules: Local boundary rules for merge_boundaries, in priority order.
+        counts: Optional dict to add the number of spans each rule merged
+            to, keyed by rule name ("quoted_discourse" and "short_verse"
+            for the two context passes).
 
     Returns:
         Patched spans (sorted, non-overlapping).
     """
-    spans = _merge_abbreviation_splits(canonical_text, spans)
-    spans = _merge_closing_quotes(canonical_text, spans)
-    spans = _merge_ellipsis_splits(canonical_text, spans)
-    spans = _merge_exclamation_continuations(canonical_text, spans)
-    spans = _merge_quoted_discourse(canonical_text, spans, block_metadata)
-    spans = _consolidate_short_verse_blocks(canonical_text, spans, block_metadata)
+    spans = merge_boundaries(canonical_text, spans, rules, counts)
+    if counts is None:
+        spans = _merge_quoted_discourse(canonical_text, spans, block_metadata)
+        return _consolidate_short_verse_blocks(canonical_text, spans, block_metadata)
+
+    for name, merge in (
+        ("quoted_discourse", _merge_quoted_discourse),
+        ("short_verse", _consolidate_short_verse_blocks),
+    ):
+        before = len(spans)
+        spans = merge(canonical_text, spans, block_metadata)
+        counts[name] = counts.get(name, 0) + before - len(spans)
     return spans
 
 
-def _merge_abbreviation_splits(
-    text: str, spans: list[tuple[int, int]]
+def _strip_bounds(text: str, start: int, end: int) -> tuple[int, int]:
+    """Bounds of text[start:end].strip() as offsets; (start, start) if blank."""
+    end = min(end, len(text))
+    if start < end and not text[start].isspace() and not text[end - 1].isspace():
+        return start, end
+    segment = text[start:end]
+    body = segment.strip()
+    if not body:
+        return start, start
+    lead = len(segment) - len(segment.lstrip())
+    return start + lead, start + lead + len(body)
+
+
+def merge_boundaries(
+    text: str,
+    spans: list[tuple[int, int]],
+    rules: tuple[BoundaryRule, ...] = BOUNDARY_RULES,
+    counts: dict[str, int] | None = None,
 ) -> list[tuple[int, int]]:
-    """Merge spans that were incorrectly split after abbreviations.
+    """Merge spans across every boundary where a local rule fires, in one pass.
 
-    If span N ends with a known abbreviation and span N+1 starts with
-    a lowercase letter, merge them.
+    Gives the same spans as running each rule as its own left-to-right pass
+    (_merge_pass), in order. At each boundary the rules are tried in
+    priority order and the first to fire merges. Pass k would have seen the
+    sentence built from the merges of rules 0..k only, so each rule is shown
+    a prev_start for its own level. Rules see the next baseline span, which
+    for the built-in rules is all a later pass could have looked at.
+
+    Spans with no visible text can make a later pass read past the next
+    span, so those inputs are merged pass by pass instead.
+
+    With counts, the number of merges made by each rule is added to
+    counts[rule.name].
     """
-    if len(spans) <= 1:
+    if counts is not None:
+        for rule in rules:
+            counts.setdefault(rule.name, 0)
+    if len(spans) <= 1 or not rules:
+        return spans
+
+    bounds = [_strip_bounds(text, s, e) for s, e in spans]
+    if any(vs == ve for vs, ve in bounds):
+        for rule in rules:
+            before = len(spans)
+            spans = _merge_pass(text, spans, rule.should_merge)
+            if counts is not None:
+                counts[rule.name] = counts.get(rule.name, 0) + before - len(spans)
         return spans
 
+    checks = [rule.should_merge for rule in rules]
+    levels = len(checks)
+    b = Boundary(text)
+    # starts[k]: start of the sentence built by the merges of rules 0..k
+    starts = [spans[0][0]] * levels
     merged = [spans[0]]
+    prev_end = bounds[0][1]
     for i in range(1, len(spans)):
-        prev_s, prev_e = merged[-1]
         curr_s, curr_e = spans[i]
-
-        prev_text = text[prev_s:prev_e].rstrip()
-        curr_text = text[curr_s:curr_e].lstrip()
-
-        # Check if previous span ends with abbreviation
-        should_merge = False
-        for abbrev in _ABBREV_LOWER:
-            if prev_text.lower().endswith(abbrev):
-                # Only merge if next sentence starts with lowercase
-                if curr_text and curr_text[0].islower():
-                    should_merge = True
+        b.prev_end = prev_end
+        b.next_start, b.next_end = bounds[i]
+
+        fired = levels
+        for k in range(levels):
+            b.prev_start = starts[k]
+            if checks[k](b):
+                fired = k
                 break
 
-        if should_merge:
-            # Merge: extend previous span to cover current
-            merged[-1] = (prev_s, curr_e)
+        if fired < levels:
+            merged[-1] = (merged[-1][0], curr_e)
+            if counts is not None:
+                name = rules[fired].name
+                counts[name] = counts.get(name, 0) + 1
         else:
             merged.append((curr_s, curr_e))
+        for k in range(fired):
+            starts[k] = curr_s
+        prev_end = b.next_end
 
     return merged
 
 
-def _merge_closing_quotes(
-    text: str, spans: list[tuple[int, int]]
+def _merge_pass(
+    text: str,
+    spans: list[tuple[int, int]],
+    should_merge: Callable[[Boundary], bool],
 ) -> list[tuple[int, int]]:
-    """Merge orphaned closing quotes/brackets with the previous sentence.
-
-    If a span is very short (< 5 chars) and consists mostly of closing
-    punctuation/quotes, merge it with the previous span.
-    """
+    """Run one local rule as its own left-to-right merge pass."""
     if len(spans) <= 1:
         return spans
 
-    closing_pattern = re.compile(r'^[\s\'""\u201c\u201d\u2018\u2019)\]}>.,;:!?\-]+$')
-
+    b = Boundary(text)
     merged = [spans[0]]
     for i in range(1, len(spans)):
+        prev_s, prev_e = merged[-1]
         curr_s, curr_e = spans[i]
-        curr_text = text[curr_s:curr_e]
+        b.prev_start = prev_s
+        b.prev_end = _strip_bounds(text, prev_s, prev_e)[1]
+        b.next_start, b.next_end = _strip_bounds(text, curr_s, curr_e)
 
-        if len(curr_text.strip()) <= 4 and closing_pattern.match(curr_text.strip()):
-            # Merge with previous
-            prev_s, _ = merged[-1]
+        if should_merge(b):
             merged[-1] = (prev_s, curr_e)
         else:
             merged.append((curr_s, curr_e))
@@ -121,32 +267,37 @@ def _merge_closing_quotes(
     return merged
 
 
-def _merge_ellipsis_splits(
+def _merge_abbreviation_splits(
     text: str, spans: list[tuple[int, int]]
 ) -> list[tuple[int, int]]:
-    """Merge spans split at ellipsis points (...) when they shouldn't be.
+    """Merge spans that were incorrectly split after abbreviations.
 
-    If a span ends with '...' and the next begins with a lowercase letter,
-    merge them as ellipsis usually indicates continuation.
+    If span N ends with a known abbreviation and span N+1 starts with
+    a lowercase letter, merge them.
     """
-    if len(spans) <= 1:
-        return spans
+    return _merge_pass(text, spans, _ABBREVIATION_RULE.should_merge)
 
-    merged = [spans[0]]
-    for i in range(1, len(spans)):
-        prev_s, prev_e = merged[-1]
-        curr_s, curr_e = spans[i]
 
-        prev_text = text[prev_s:prev_e].rstrip()
-        curr_text = text[curr_s:curr_e].lstrip()
+def _merge_closing_quotes(
+    text: str, spans: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Merge orphaned closing quotes/brackets with the previous sentence.
 
-        if (prev_text.endswith("...") or prev_text.endswith("\u2026")) and \
-           curr_text and curr_text[0].islower():
-            merged[-1] = (prev_s, curr_e)
-        else:
-            merged.append((curr_s, curr_e))
+    If a span is very short (< 5 chars) and consists mostly of closing
+    punctuation/quotes, merge it with the previous span.
+    """
+    return _merge_pass(text, spans, _orphaned_closing_quote)
 
-    return merged
+
+def _merge_ellipsis_splits(
+    text: str, spans: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Merge spans split at ellipsis points (...) when they shouldn't be.
+
+    If a span ends with '...' and the next begins with a lowercase letter,
+    merge them as ellipsis usually indicates continuation.
+    """
+    return _merge_pass(text, spans, _ellipsis_continuation)
 
 
 def _merge_exclamation_continuations(
@@ -158,54 +309,77 @@ def _merge_exclamation_continuations(
     the next span begins with a lowercase letter, merge them. Catches
     onomatopoeia and interjections like "thump!", "splash!", "Alas!".
     """
-    if len(spans) <= 1:
-        return spans
-
-    merged = [spans[0]]
-    for i in range(1, len(spans)):
-        prev_s, prev_e = merged[-1]
-        curr_s, curr_e = spans[i]
-
-        prev_text = text[prev_s:prev_e].rstrip()
-        curr_text = text[curr_s:curr_e].lstrip()
-
-        if prev_text.endswith("!") and curr_text and curr_text[0].islower():
-            merged[-1] = (prev_s, curr_e)
-        else:
-            merged.append((curr_s, curr_e))
-
-    return merged
+    return _merge_pass(text, spans, _exclamation_continuation)
 
 
 def _is_verse_span(start: int, end: int, block_metadata: list[dict] | None) -> bool:
     """Check if a span falls within a verse block."""
     if not block_metadata:
         return False
-    midpoint = (start + end) // 2
-    for meta in block_metadata:
-        if meta["start"] <= midpoint < meta["end"]:
-            return meta.get("type") == "verse"
-    return False
+    meta = as_block_index(block_metadata).find((start + end) // 2)
+    return meta is not None and meta.get("type") == "verse"
 
 
-def _local_quote_depth(text: str, span_start: int, span_end: int) -> int:
-    """Compute quote depth from the start of the current paragraph to span_end.
+class QuoteIndex:
+    """Per-chapter prefix sums for quote-aware rules: O(1) depth queries.
 
-    Counts open vs close smart double quotes within the current paragraph
-    (delimited by \\n\\n). Returns the net open count.
+    net[i] is the number of smart open double quotes minus close double
+    quotes in text[:i]; para_start[i] is the offset just past the last
+    paragraph break (\\n\\n) that ends at or before i, or 0. Both arrays
+    have len(text) + 1 entries and change only at quotes and breaks, so
+    they are filled run by run rather than character by character.
     """
-    # Find paragraph start: last \n\n before span_start
-    para_break = text.rfind("\n\n", 0, span_start)
-    para_start = para_break + 2 if para_break != -1 else 0
 
-    local = text[para_start:span_end]
-    return local.count("\u201c") - local.count("\u201d")
+    def __init__(self, text: str):
+        self.length = len(text)
+        self.net = _step_array(self.length, (
+            (m.end(), 1 if m.group() == "\u201c" else -1)
+            for m in _DOUBLE_QUOTE_RE.finditer(text)
+        ), relative=True)
+        self.para_start = _step_array(self.length, (
+            (m.start() + 2, m.start() + 2) for m in _PARA_BREAK_RE.finditer(text)
+        ))
+
+    def depth(self, span_start: int, span_end: int) -> int:
+        """Net open quotes from the start of span_start's paragraph to span_end.
+
+        Same as counting quotes in text[para_start:span_end]; offsets past
+        the end of the text count as its end.
+        """
+        para_start = self.para_start[min(span_start, self.length)]
+        return self.net[min(span_end, self.length)] - self.net[para_start]
+
+    def break_between(self, start: int, end: int) -> bool:
+        """True if text[start:end] contains a paragraph break."""
+        return self.para_start[min(end, self.length)] >= start + 2
+
+
+_DOUBLE_QUOTE_RE = re.compile("[\u201c\u201d]")
+_PARA_BREAK_RE = re.compile(r"\n(?=\n)")
+
+
+def _step_array(length: int, steps, relative: bool = False) -> array:
+    """array('i') of length + 1 values that change only at the given offsets.
+
+    steps yields (offset, value) in offset order; the value holds from that
+    offset on (or is added to the running value if relative).
+    """
+    values = array("i")
+    value = 0
+    filled = 0
+    for offset, step in steps:
+        values.extend(array("i", [value]) * (offset - filled))
+        value = value + step if relative else step
+        filled = offset
+    values.extend(array("i", [value]) * (length + 1 - filled))
+    return values
 
 
 def _merge_quoted_discourse(
     text: str,
     spans: list[tuple[int, int]],
     block_metadata: list[dict] | None = None,
+    quotes: QuoteIndex | None = None,
 ) -> list[tuple[int, int]]:
     """Merge spans that were split inside continuous quoted discourse.
 
@@ -216,7 +390,7 @@ def _merge_quoted_discourse(
     Algorithm:
     - For each pair of consecutive spans, compute the local double-quote
       depth (open minus close) from the current paragraph start to the
-      end of span N.
+      end of span N, from the chapter's QuoteIndex.
     - If depth > 0 (we're inside an open quote), merge with span N+1.
 
     Guards (do NOT merge):
@@ -225,6 +399,10 @@ def _merge_quoted_discourse(
     """
     if len(spans) <= 1:
         return spans
+    if block_metadata:
+        block_metadata = as_block_index(block_metadata)
+    if quotes is None:
+        quotes = QuoteIndex(text)
 
     merged = [spans[0]]
     for i in range(1, len(spans)):
@@ -232,8 +410,13 @@ def _merge_quoted_discourse(
         curr_s, curr_e = spans[i]
 
         # Guard: paragraph break between spans
-        gap = text[prev_e:curr_s]
-        if "\n\n" in gap:
+        if quotes.break_between(prev_e, curr_s):
+            merged.append((curr_s, curr_e))
+            continue
+
+        # Check local quote depth at end of previous span. This is O(1), so
+        # it goes before the verse lookups, which only matter inside a quote.
+        if quotes.depth(prev_s, prev_e) <= 0:
             merged.append((curr_s, curr_e))
             continue
 
@@ -243,14 +426,8 @@ def _merge_quoted_discourse(
             merged.append((curr_s, curr_e))
             continue
 
-        # Check local quote depth at end of previous span
-        depth = _local_quote_depth(text, prev_s, prev_e)
-
-        if depth > 0:
-            # Inside an open quote — merge
-            merged[-1] = (prev_s, curr_e)
-        else:
-            merged.append((curr_s, curr_e))
+        # Inside an open quote — merge
+        merged[-1] = (prev_s, curr_e)
 
     return merged
 
@@ -277,16 +454,13 @@ def _consolidate_short_verse_blocks(
         return spans
 
     # Identify short verse blocks
-    short_verse_ranges = []
-    for meta in block_metadata:
-        if meta.get("type") != "verse":
-            continue
-        block_text = text[meta["start"]:meta["end"]]
-        line_count = block_text.count("\n") + 1
-        if line_count <= _SHORT_VERSE_MAX_LINES:
-            short_verse_ranges.append((meta["start"], meta["end"]))
+    short_verse_blocks = BlockIndex([
+        meta for meta in block_metadata
+        if meta.get("type") == "verse"
+        and text.count("\n", meta["start"], meta["end"]) + 1 <= _SHORT_VERSE_MAX_LINES
+    ])
 
-    if not short_verse_ranges:
+    if not short_verse_blocks:
         return spans
 
     # Merge spans that fall within the same short verse block
@@ -297,11 +471,7 @@ def _consolidate_short_verse_blocks(
         mid = (s + e) // 2
 
         # Check if this span is in a short verse block
-        in_block = None
-        for block_start, block_end in short_verse_ranges:
-            if block_start <= mid < block_end:
-                in_block = (block_start, block_end)
-                break
+        in_block = short_verse_blocks.find(mid)
 
         if in_block is None:
             merged.append((s, e))
@@ -309,7 +479,7 @@ def _consolidate_short_verse_blocks(
             continue
 
         # Absorb all consecutive spans within this same block
-        block_start, block_end = in_block
+        block_start, block_end = in_block["start"], in_block["end"]
         group_start = s
         group_end = e
         i += 1
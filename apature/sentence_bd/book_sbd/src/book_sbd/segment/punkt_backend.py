@@ -4,29 +4,165 @@ Uses the pre-trained English Punkt model (punkt_tab) rather than
 custom training to avoid overfitting to the 19-book corpus.
 
 v1.1.0: Uses span_tokenize() directly instead of brittle str.find() mapping.
+
+The tokenizer is loaded lazily on first use. Its punkt_tab parameters are
+kept between runs as plain JSON in a local cache ($BOOK_SBD_CACHE_HOME,
+default ~/.cache/book_sbd); the cache is data only (never unpickled), so a
+writable cache directory cannot run code.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
-
-import nltk
+import tempfile
+from collections import defaultdict
+from importlib import metadata
 
 from .base import Segmenter
 
 
-# Ensure punkt_tab data is available
-try:
-    nltk.data.find("tokenizers/punkt_tab")
-except LookupError:
-    nltk.download("punkt_tab", quiet=True)
-
-# Load tokenizer once at module level
-_tokenizer = nltk.data.load("tokenizers/punkt_tab/english.pickle")
-
 # Pattern for splitting over-merged multi-paragraph spans
 _PARA_BREAK_RE = re.compile(r"\n\n+")
 
+# Loaded tokenizers by language. Populated on first use so importing this
+# module (and the CLI) does not import NLTK or parse the Punkt model.
+_tokenizers: dict = {}
+# Hash of each loaded tokenizer's parameters, by language
+_param_hashes: dict[str, str] = {}
+
+
+def _cache_dir() -> str:
+    """Directory for the pre-serialized tokenizer cache."""
+    root = os.environ.get("BOOK_SBD_CACHE_HOME")
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        root = os.path.join(xdg, "book_sbd")
+    return root
+
+
+def _nltk_version() -> str:
+    try:
+        return metadata.version("nltk")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _cache_path(language: str) -> str:
+    # Key on the NLTK version so an upgrade never reuses parameters it
+    # might read differently
+    return os.path.join(_cache_dir(), f"punkt_tab_{language}_nltk-{_nltk_version()}.json")
+
+
+def _model_dir(language: str):
+    """NLTK path pointer to the punkt_tab model, downloading it if missing."""
+    import nltk
+
+    resource = f"tokenizers/punkt_tab/{language}/"
+    try:
+        return nltk.data.find(resource)
+    except LookupError:
+        nltk.download("punkt_tab", quiet=True)
+        return nltk.data.find(resource)
+
+
+_MODEL_FILES = ("abbrev_types.txt", "collocations.tab", "sent_starters.txt", "ortho_context.tab")
+
+
+def _model_signature(model_dir) -> list | None:
+    """[name, size, mtime_ns] per punkt_tab file, or None if not a plain directory.
+
+    Stored with the cached parameters so a punkt_tab data update
+    invalidates them.
+    """
+    path = getattr(model_dir, "path", None)
+    if path is None or not os.path.isdir(path):
+        return None  # zipped nltk_data: no cheap signature, parse every time
+    signature = []
+    for name in _MODEL_FILES:
+        st = os.stat(os.path.join(path, name))
+        signature.append([name, st.st_size, st.st_mtime_ns])
+    return signature
+
+
+def _params_to_json(params) -> dict:
+    """PunktParameters as a JSON-serializable dict with a stable order."""
+    return {
+        "abbrev_types": sorted(params.abbrev_types),
+        "collocations": sorted([a, b] for a, b in params.collocations),
+        "sent_starters": sorted(params.sent_starters),
+        "ortho_context": dict(sorted(params.ortho_context.items())),
+    }
+
+
+def _params_from_json(data: dict):
+    from nltk.tokenize.punkt import PunktParameters
+
+    params = PunktParameters()
+    params.abbrev_types = set(data["abbrev_types"])
+    params.collocations = {(a, b) for a, b in data["collocations"]}
+    params.sent_starters = set(data["sent_starters"])
+    params.ortho_context = defaultdict(int, data["ortho_context"])
+    return params
+
+
+def _read_cache(path: str, signature: list):
+    """Cached parameters for the model with this signature, or None."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["signature"] != signature:
+            return None
+        return _params_from_json(cached["params"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(path: str, signature: list, params) -> None:
+    """Best-effort atomic write of the parameters as JSON."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "params": _params_to_json(params)}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # read-only home etc.: parse punkt_tab again next time
+
+
+def load_tokenizer(language: str = "english"):
+    """Return the Punkt tokenizer for language, loading it once per process.
+
+    Reads the parameters from the local JSON cache when it matches the
+    installed punkt_tab files (faster than parsing the tab files),
+    otherwise parses punkt_tab through NLTK and writes that cache for the
+    next process.
+    """
+    tokenizer = _tokenizers.get(language)
+    if tokenizer is not None:
+        return tokenizer
+
+    from nltk.tokenize.punkt import PunktSentenceTokenizer, load_punkt_params
+
+    model_dir = _model_dir(language)
+    signature = _model_signature(model_dir)
+    params = None
+    if signature is not None:
+        path = _cache_path(language)
+        params = _read_cache(path, signature)
+    if params is None:
+        params = load_punkt_params(model_dir)
+        if signature is not None:
+            _write_cache(path, signature, params)
+
+    tokenizer = PunktSentenceTokenizer(params)
+    _tokenizers[language] = tokenizer
+    return tokenizer
+
 
 class PunktSegmenter(Segmenter):
     """Sentence segmenter using NLTK's pre-trained Punkt model."""
@@ -42,19 +178,30 @@ class PunktSegmenter(Segmenter):
         """
         if not canonical_text.strip():
             return []
+        tokenizer = load_tokenizer(self._language)
 
-        # Get spans directly from Punkt tokenizer
-        raw_spans = list(_tokenizer.span_tokenize(canonical_text))
-
-        # Apply conservative split for over-merged multi-paragraph spans
+        # Apply conservative split for over-merged multi-paragraph spans.
+        # Most spans have no paragraph break, so check in place before slicing.
         spans = []
-        for start, end in raw_spans:
-            segment_text = canonical_text[start:end]
-            sub_spans = self._split_paragraphs(segment_text, start)
-            spans.extend(sub_spans)
+        for start, end in tokenizer.span_tokenize(canonical_text):
+            if canonical_text.find("\n\n", start, end) == -1:
+                spans.append((start, end))
+            else:
+                spans.extend(self._split_paragraphs(canonical_text[start:end], start))
 
         return spans
 
+    def fingerprint(self) -> dict:
+        """Language, NLTK version and a hash of the loaded Punkt parameters,
+        so an NLTK or punkt_tab data upgrade invalidates cached spans."""
+        param_hash = _param_hashes.get(self._language)
+        if param_hash is None:
+            params = load_tokenizer(self._language)._params
+            payload = json.dumps(_params_to_json(params), ensure_ascii=False)
+            param_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            _param_hashes[self._language] = param_hash
+        return {"language": self._language, "nltk": _nltk_version(), "params": param_hash}
+
     def _split_paragraphs(
         self, text: str, offset: int
     ) -> list[tuple[int, int]]:
@@ -0,0 +1,88 @@
+"""Rule-based sentence segmenter built on one compiled regex.
+
+A faster, less accurate alternative to Punkt. The regex finds boundary
+candidates in C: a run of terminal punctuation (. ! ? or an ellipsis),
+any closing quotes/brackets, then whitespace; or a paragraph break. Each
+candidate is kept only if the next sentence starts like one (uppercase
+letter or digit, possibly after opening quotes) and, for a single period,
+the word before it is not a known abbreviation or an initial. Abbreviations
+come from the same lexicon file as the patch rules.
+
+Spans follow the Segmenter contract: sorted, non-overlapping, trimmed of
+surrounding whitespace, and covering all non-whitespace text.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from .abbreviations import read_lexicon
+from .base import Segmenter
+
+
+# Boundary candidates: terminal punctuation + closers + whitespace, or a
+# paragraph break (which always ends a sentence)
+_CANDIDATE_RE = re.compile(
+    r"(?P<term>[.!?\u2026]+[\"'\u201d\u2019)\]]*)(?P<gap>\s+)"
+    r"|(?P<para>\s*\n[ \t]*\n\s*)"
+)
+_BLANK_LINE_RE = re.compile(r"\n[ \t]*\n")
+# Characters that may precede the first letter of a sentence
+_OPENERS = "\"'\u201c\u2018([_"
+
+
+class RegexSegmenter(Segmenter):
+    """Sentence segmenter using regex boundary candidates and a few filters."""
+
+    def __init__(self, abbreviations: Iterable[str] | None = None):
+        if abbreviations is None:
+            abbreviations = read_lexicon()
+        # Lowercased entries; part of the stage-cache fingerprint via vars()
+        self._abbreviations = frozenset(a.lower() for a in abbreviations)
+
+    def segment(self, canonical_text: str) -> list[tuple[int, int]]:
+        """Segment canonical text into sentence spans."""
+        text = canonical_text
+        start = len(text) - len(text.lstrip())
+        if start == len(text):
+            return []
+
+        spans = []
+        for m in _CANDIDATE_RE.finditer(text, start):
+            if m.group("para") is None:
+                if not self._is_boundary(text, m) and not _BLANK_LINE_RE.search(m.group("gap")):
+                    continue
+                end = m.end("term")
+            else:
+                end = m.start()
+            if end > start:
+                spans.append((start, end))
+            start = m.end()
+
+        end = len(text.rstrip())
+        if end > start:
+            spans.append((start, end))
+        return spans
+
+    def _is_boundary(self, text: str, m: re.Match) -> bool:
+        """Filter a terminal-punctuation candidate."""
+        # The next sentence must start with an uppercase letter or digit
+        pos = m.end()
+        while pos < len(text) and text[pos] in _OPENERS:
+            pos += 1
+        if pos == len(text) or not (text[pos].isupper() or text[pos].isdigit()):
+            return False
+
+        term_start = m.start("term")
+        if text[term_start] == "." and not text.startswith("..", term_start):
+            # Single period: reject known abbreviations and initials ("J. Smith")
+            word_start = term_start
+            while word_start > 0 and not text[word_start - 1].isspace():
+                word_start -= 1
+            word = text[word_start:term_start].lstrip(_OPENERS)
+            if (word + ".").lower() in self._abbreviations:
+                return False
+            if len(word) == 1 and word.isupper():
+                return False
+        return True
@@ -15,6 +15,7 @@ Two-pass approach:
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 
 # Separator pattern: lines consisting of 3+ asterisks with optional spaces
 _SEPARATOR_RE = re.compile(r"^\s*(?:\*\s*){3,}\s*$")
@@ -324,7 +325,36 @@ def classify_and_normalize(text: str) -> list[dict]:
     return results
 
 
-def apply_text_modes(canonical_text: str) -> tuple[str, list[dict]]:
+class BlockIndex(list):
+    """Block metadata dicts sorted by start, with O(log B) position lookup.
+
+    A plain list of {'type', 'start', 'end'} dicts as far as JSON, pickling
+    and iteration are concerned, so it can be cached and shipped to workers
+    unchanged. Blocks never overlap, so the block containing a position is
+    the last one starting at or before it. Build a new index rather than
+    mutating one in place.
+    """
+
+    def __init__(self, blocks=()):
+        super().__init__(sorted(blocks, key=lambda meta: meta["start"]))
+        self._starts = [meta["start"] for meta in self]
+
+    def find(self, pos: int) -> dict | None:
+        """Return the block with start <= pos < end, or None."""
+        i = bisect_right(self._starts, pos) - 1
+        if i >= 0 and pos < self[i]["end"]:
+            return self[i]
+        return None
+
+
+def as_block_index(block_metadata: list[dict] | None) -> BlockIndex:
+    """Return block_metadata as a BlockIndex, building one only if needed."""
+    if isinstance(block_metadata, BlockIndex):
+        return block_metadata
+    return BlockIndex(block_metadata or ())
+
+
+def apply_text_modes(canonical_text: str) -> tuple[str, BlockIndex]:
     """Apply text mode classification to canonical text.
 
     Returns:
@@ -332,12 +362,12 @@ def apply_text_modes(canonical_text: str) -> tuple[str, list[dict]]:
 
     processed_text: the full text reassembled with mode-appropriate normalization.
         Paragraph breaks (double newlines) are preserved between blocks.
-    block_metadata: list of dicts describing each block's type and span in
-        the processed text.
+    block_metadata: BlockIndex of dicts describing each block's type and span
+        in the processed text.
     """
     blocks = classify_and_normalize(canonical_text)
     if not blocks:
-        return "", []
+        return "", BlockIndex()
 
     parts = []
     metadata = []
@@ -359,17 +389,15 @@ def apply_text_modes(canonical_text: str) -> tuple[str, list[dict]]:
         })
 
     processed = "".join(parts)
-    return processed, metadata
+    return processed, BlockIndex(metadata)
 
 
 def get_sentence_type(sentence_start: int, sentence_end: int, block_metadata: list[dict]) -> str:
     """Determine sentence type based on which block it falls in.
 
     Uses the midpoint of the sentence span to find the containing block.
-    Falls back to 'prose' if no block contains the sentence.
+    Falls back to 'prose' if no block contains the sentence. Pass a
+    BlockIndex when typing many sentences; a plain list is indexed per call.
     """
-    midpoint = (sentence_start + sentence_end) // 2
-    for meta in block_metadata:
-        if meta["start"] <= midpoint < meta["end"]:
-            return meta["type"]
-    return "prose"
+    meta = as_block_index(block_metadata).find((sentence_start + sentence_end) // 2)
+    return meta["type"] if meta is not None else "prose"
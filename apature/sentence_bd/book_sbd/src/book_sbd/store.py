@@ -0,0 +1,269 @@
+"""Memory-mapped binary sentence store for random access.
+
+Each book is written at export time to {output_dir}/store/{slug}.sbd and
+read back through mmap, so fetching one sentence touches a few table
+entries and the bytes of that sentence, never the rest of the book.
+
+File layout (little-endian):
+
+  header     magic "SBDSTORE", version u32, chapter_count u32,
+             sentence_count u32, then u64 offsets of the chapter table,
+             sentence table, text blob and JSON metadata
+  chapters   chapter_count x (first_sentence u32, sentence_count u32,
+                              text_byte_start u64, text_byte_end u64)
+  sentences  sentence_count x (byte_start u32, byte_end u32,
+                               start u32, end u32, type u8, 3 pad bytes)
+             byte_* are relative to the chapter text in the blob; start/end
+             are the character offsets from the JSON export
+  blob       every chapter's processed text, UTF-8, concatenated
+  metadata   JSON: slug, meta, pipeline_version, chapter labels
+
+Tables are fixed width, so (chapter, sentence) -> entry is O(1).
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from typing import Iterator
+
+from . import __version__
+
+
+STORE_MAGIC = b"SBDSTORE"
+STORE_VERSION = 1
+SENTENCE_TYPES = ("prose", "verse")
+
+_HEADER = struct.Struct("<8sIIIQQQQ")
+_CHAPTER = struct.Struct("<IIQQ")
+_SENTENCE = struct.Struct("<IIIIB3x")
+
+
+def _byte_offsets(text: str, sentences: list[dict]) -> list[tuple[int, int]]:
+    """UTF-8 byte (start, end) for each sentence's character span.
+
+    Walks the text once when spans are in order, which they are for
+    pipeline output.
+    """
+    offsets = []
+    char_pos = 0
+    byte_pos = 0
+
+    def to_byte(char_index: int) -> int:
+        nonlocal char_pos, byte_pos
+        if char_index < char_pos:
+            char_pos, byte_pos = 0, 0
+        byte_pos += len(text[char_pos:char_index].encode("utf-8"))
+        char_pos = char_index
+        return byte_pos
+
+    for s in sentences:
+        start = to_byte(s["start"])
+        end = to_byte(s["end"])
+        offsets.append((start, end))
+    return offsets
+
+
+def export_store(book_data: dict, output_dir: str) -> str:
+    """Write {output_dir}/store/{slug}.sbd. Returns the file path.
+
+    The file is written next to its final name and renamed into place, so
+    readers holding the previous version mapped are never handed a
+    half-written file.
+    """
+    slug = book_data["slug"]
+    type_codes = {name: i for i, name in enumerate(SENTENCE_TYPES)}
+
+    chapter_rows = bytearray()
+    sentence_rows = bytearray()
+    blob = bytearray()
+    labels = []
+    sentence_count = 0
+    for ch in book_data["processed_chapters"]:
+        text = ch["canonical_text"]
+        sentences = ch["sentences"]
+        encoded = text.encode("utf-8")
+        chapter_rows += _CHAPTER.pack(
+            sentence_count, len(sentences), len(blob), len(blob) + len(encoded),
+        )
+        for s, (byte_start, byte_end) in zip(sentences, _byte_offsets(text, sentences)):
+            sentence_rows += _SENTENCE.pack(
+                byte_start, byte_end, s["start"], s["end"],
+                type_codes[s.get("type", "prose")],
+            )
+        blob += encoded
+        labels.append(ch.get("label"))
+        sentence_count += len(sentences)
+
+    metadata = json.dumps({
+        "slug": slug,
+        "meta": book_data["meta"],
+        "pipeline_version": __version__,
+        "labels": labels,
+    }, ensure_ascii=False).encode("utf-8")
+
+    chapter_offset = _HEADER.size
+    sentence_offset = chapter_offset + len(chapter_rows)
+    blob_offset = sentence_offset + len(sentence_rows)
+    meta_offset = blob_offset + len(blob)
+    header = _HEADER.pack(
+        STORE_MAGIC, STORE_VERSION, len(labels), sentence_count,
+        chapter_offset, sentence_offset, blob_offset, meta_offset,
+    )
+
+    out_dir = os.path.join(output_dir, "store")
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, f"{slug}.sbd")
+    # Same write-then-rename as export_book; not mkstemp, whose 0600 mode
+    # would carry over and keep readers under other accounts out.
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for part in (header, chapter_rows, sentence_rows, blob, metadata):
+                f.write(part)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return out_path
+
+
+class BookStore:
+    """Read-only mmap view of one book's .sbd file. Numbers are 1-based."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic, version, self.chapter_count, self.sentence_count,
+            self._chapter_offset, self._sentence_offset,
+            self._blob_offset, self._meta_offset,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path}: not a version {STORE_VERSION} sentence store")
+        self._metadata: dict | None = None
+
+    @property
+    def metadata(self) -> dict:
+        """slug, meta, pipeline_version and chapter labels (decoded on first use)."""
+        if self._metadata is None:
+            self._metadata = json.loads(self._mm[self._meta_offset:].decode("utf-8"))
+        return self._metadata
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> BookStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _chapter(self, chapter: int) -> tuple[int, int, int, int]:
+        if not 1 <= chapter <= self.chapter_count:
+            raise IndexError(f"{self.path}: no chapter {chapter} (1..{self.chapter_count})")
+        return _CHAPTER.unpack_from(
+            self._mm, self._chapter_offset + (chapter - 1) * _CHAPTER.size,
+        )
+
+    def chapter_length(self, chapter: int) -> int:
+        """Number of sentences in a chapter."""
+        return self._chapter(chapter)[1]
+
+    def _rows(self, chapter: int, first: int, stop: int):
+        """Yield (text_base, sentence row) for sentences first..stop-1 (0-based)."""
+        first_sentence, count, text_start, _text_end = self._chapter(chapter)
+        if not 0 <= first <= stop <= count:
+            raise IndexError(
+                f"{self.path}: chapter {chapter} has sentences 1..{count}"
+            )
+        base = self._blob_offset + text_start
+        offset = self._sentence_offset + (first_sentence + first) * _SENTENCE.size
+        for _ in range(stop - first):
+            yield base, _SENTENCE.unpack_from(self._mm, offset)
+            offset += _SENTENCE.size
+
+    def sentence(self, chapter: int, number: int) -> str:
+        """Text of one sentence."""
+        for base, (byte_start, byte_end, *_rest) in self._rows(chapter, number - 1, number):
+            return self._mm[base + byte_start:base + byte_end].decode("utf-8")
+        raise IndexError(f"{self.path}: no sentence {number} in chapter {chapter}")
+
+    def record(self, chapter: int, number: int) -> dict:
+        """One sentence as a v1.1.0-shaped dict."""
+        return next(self.records(chapter, number, number + 1))
+
+    def records(self, chapter: int, start: int = 1, stop: int | None = None) -> Iterator[dict]:
+        """Sentence dicts for numbers start..stop-1 of a chapter."""
+        if stop is None:
+            stop = self.chapter_length(chapter) + 1
+        number = start
+        for base, (byte_start, byte_end, char_start, char_end, type_code) in self._rows(
+            chapter, start - 1, stop - 1,
+        ):
+            yield {
+                "number": number,
+                "text": self._mm[base + byte_start:base + byte_end].decode("utf-8"),
+                "type": SENTENCE_TYPES[type_code],
+                "start": char_start,
+                "end": char_end,
+                "char_len": char_end - char_start,
+            }
+            number += 1
+
+    def sentences(self, chapter: int, start: int = 1, stop: int | None = None) -> list[str]:
+        """Texts of sentences start..stop-1 of a chapter."""
+        return [r["text"] for r in self.records(chapter, start, stop)]
+
+    def iter_chapter(self, chapter: int) -> Iterator[str]:
+        """Every sentence of one chapter, in order."""
+        for r in self.records(chapter):
+            yield r["text"]
+
+
+class SentenceStore:
+    """Random access to every book in an output directory's store/.
+
+    Books are mapped on first access and stay mapped until close().
+    """
+
+    def __init__(self, output_dir: str):
+        self.root = os.path.join(output_dir, "store")
+        self._books: dict[str, BookStore] = {}
+
+    def book(self, slug: str) -> BookStore:
+        store = self._books.get(slug)
+        if store is None:
+            store = BookStore(os.path.join(self.root, f"{slug}.sbd"))
+            self._books[slug] = store
+        return store
+
+    def slugs(self) -> list[str]:
+        return sorted(
+            name[:-len(".sbd")] for name in os.listdir(self.root) if name.endswith(".sbd")
+        )
+
+    def sentence(self, slug: str, chapter: int, number: int) -> str:
+        return self.book(slug).sentence(chapter, number)
+
+    def sentences(self, slug: str, chapter: int, start: int = 1, stop: int | None = None) -> list[str]:
+        return self.book(slug).sentences(chapter, start, stop)
+
+    def iter_chapter(self, slug: str, chapter: int) -> Iterator[str]:
+        return self.book(slug).iter_chapter(chapter)
+
+    def close(self) -> None:
+        for store in self._books.values():
+            store.close()
+        self._books.clear()
+
+    def __enter__(self) -> SentenceStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
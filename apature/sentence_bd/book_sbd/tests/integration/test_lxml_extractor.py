@@ -0,0 +1,48 @@
+"""Integration tests: the lxml text extractor over the 19-book corpus.
+
+Checks:
+- Every spine document converts to the same text as html_to_text
+- extract_chapters() gives identical chapter units with either extractor
+- The corpus stays on the lxml path (no silent fallback to html.parser)
+"""
+
+import sys, os, glob
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+from book_sbd.ingest.epub_parser import parse_epub
+from book_sbd.ingest.lxml_text import XhtmlText
+from book_sbd.ingest.structure import extract_chapters, html_to_text
+
+
+EPUB_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "epubs_unpacked", "epubs"
+))
+EPUBS = sorted(glob.glob(os.path.join(EPUB_DIR, "*.epub")))
+
+pytestmark = pytest.mark.skipif(not EPUBS, reason=f"no EPUBs in {EPUB_DIR}")
+
+
+def _slug(path):
+    return os.path.basename(path).replace(".epub", "")
+
+
+@pytest.mark.parametrize("epub_path", EPUBS, ids=_slug)
+def test_spine_documents_match(epub_path):
+    with parse_epub(epub_path) as epub_data:
+        for item in epub_data.spine_items:
+            doc = XhtmlText(item.content)
+            assert doc.supported, item.href
+            assert doc.text() == html_to_text(item.content), item.href
+
+
+@pytest.mark.parametrize("epub_path", EPUBS, ids=_slug)
+def test_chapters_match(epub_path):
+    slug = _slug(epub_path)
+    with parse_epub(epub_path) as epub_data:
+        stdlib = extract_chapters(epub_data, slug=slug, extractor="stdlib")
+        lxml = extract_chapters(epub_data, slug=slug, extractor="lxml")
+    assert [(c.number, c.label, c.text) for c in lxml] == [
+        (c.number, c.label, c.text) for c in stdlib
+    ]
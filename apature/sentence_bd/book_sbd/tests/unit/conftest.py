@@ -0,0 +1,70 @@
+"""Shared fixtures for the unit tests: a tiny two-chapter EPUB."""
+
+import zipfile
+
+import pytest
+
+
+def _xhtml(body):
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>x</title></head>'
+        f"<body>{body}</body></html>\n"
+    )
+
+
+def _write_epub(path):
+    """Write an EPUB with a cover, two nav-linked chapters and a license page."""
+    docs = {
+        "cover.xhtml": _xhtml("<p>Cover</p>"),
+        "ch1.xhtml": _xhtml("<h2>CHAPTER I</h2><p>It was a dark and stormy night, and so on.</p>"),
+        "ch2.xhtml": _xhtml("<h2>CHAPTER II</h2><p>The morning came, bright and cold and long.</p>"),
+        "license.xhtml": _xhtml("<p>*** END OF THE PROJECT GUTENBERG EBOOK ***</p>"),
+    }
+    ids = {name: f"d{i}" for i, name in enumerate(docs)}
+    opf = (
+        '<?xml version="1.0"?><package xmlns="http://www.idpf.org/2007/opf" version="2.0">'
+        '<manifest><item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>'
+        + "".join(f'<item id="{ids[n]}" href="{n}" media-type="application/xhtml+xml"/>' for n in docs)
+        + '</manifest><spine toc="ncx">'
+        + "".join(f'<itemref idref="{ids[n]}"/>' for n in docs)
+        + "</spine></package>"
+    )
+    nav = [("CHAPTER I", "ch1.xhtml"), ("CHAPTER II", "ch2.xhtml")]
+    ncx = (
+        '<?xml version="1.0"?><ncx xmlns="http://www.daisy.org/z3986/2005/ncx/"><navMap>'
+        + "".join(
+            f'<navPoint id="n{i}"><navLabel><text>{label}</text></navLabel>'
+            f'<content src="{href}"/></navPoint>'
+            for i, (label, href) in enumerate(nav)
+        )
+        + "</navMap></ncx>"
+    )
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("mimetype", "application/epub+zip")
+        z.writestr(
+            "META-INF/container.xml",
+            '<?xml version="1.0"?><container xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+            '<rootfiles><rootfile full-path="OEBPS/content.opf"/></rootfiles></container>',
+        )
+        z.writestr("OEBPS/content.opf", opf)
+        z.writestr("OEBPS/toc.ncx", ncx)
+        for name, content in docs.items():
+            z.writestr(f"OEBPS/{name}", content)
+
+
+@pytest.fixture
+def make_epub():
+    """Factory: make_epub(path) writes the sample EPUB to path."""
+    return _write_epub
+
+
+@pytest.fixture
+def sample_book(tmp_path):
+    """(epub_path, meta_path) of the sample book "lazy" in tmp_path."""
+    epub = str(tmp_path / "lazy.epub")
+    meta = str(tmp_path / "lazy_meta.json")
+    _write_epub(epub)
+    with open(meta, "w", encoding="utf-8") as f:
+        f.write('{"title": "Lazy"}')
+    return epub, meta
@@ -0,0 +1,52 @@
+"""Tests for the abbreviation lexicon and its reversed-character trie."""
+
+import sys, os, random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from book_sbd.segment.abbreviations import AbbreviationLexicon, read_lexicon
+from book_sbd.segment.patch_rules import (
+    ABBREVIATIONS,
+    BOUNDARY_RULES,
+    abbreviation_rule,
+    apply_patch_rules,
+)
+
+
+def test_packaged_lexicon_loads():
+    entries = read_lexicon()
+    assert "Mr." in entries and "i.e." in entries
+    assert not any(e.startswith("#") or not e.strip() for e in entries)
+    assert set(entries) == ABBREVIATIONS
+
+
+def test_read_lexicon_file(tmp_path):
+    path = tmp_path / "lexicon.txt"
+    path.write_text("# honorifics\nMme.\n\n  Mlle.  \n", encoding="utf-8")
+    assert read_lexicon(path) == ["Mme.", "Mlle."]
+    lexicon = AbbreviationLexicon.from_file(path)
+    assert len(lexicon) == 2 and "MME." in lexicon
+
+
+def test_trie_matches_endswith_over_large_lexicon():
+    rng = random.Random(18)
+    alphabet = "abcdemr. "
+    entries = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8))) + "." for _ in range(500)}
+    lexicon = AbbreviationLexicon(entries)
+    suffixes = tuple(e.lower() for e in entries)
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert lexicon.ends_with_entry(text) == text.endswith(suffixes), text
+
+
+def test_empty_lexicon_never_matches():
+    lexicon = AbbreviationLexicon([])
+    assert lexicon.max_len == 0
+    assert not lexicon.ends_with_entry("mr.")
+
+
+def test_custom_lexicon_rule():
+    text = "He met Mme. duval at noon. Then left."
+    spans = [(0, 11), (12, 26), (27, 37)]
+    assert apply_patch_rules(text, spans) == spans
+    rules = (abbreviation_rule(AbbreviationLexicon(ABBREVIATIONS | {"Mme."})),) + BOUNDARY_RULES[1:]
+    assert apply_patch_rules(text, spans, rules=rules) == [(0, 26), (27, 37)]
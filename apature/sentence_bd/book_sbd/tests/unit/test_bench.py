@@ -0,0 +1,85 @@
+"""Tests for the per-stage pipeline benchmark (book-sbd bench)."""
+
+import sys, os, copy
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.bench import (
+    PIPELINE_STAGES,
+    _timed_run,
+    compare_to_baseline,
+    measure_book,
+    measure_pipeline,
+)
+
+
+def test_timed_run_is_process_book(tmp_path, sample_book):
+    from book_sbd.cli import process_book
+    from book_sbd.segment.regex_backend import RegexSegmenter
+
+    epub, meta = sample_book
+    times, total, _book_data = _timed_run(epub, meta, RegexSegmenter(), "stdlib", str(tmp_path / "bench"))
+    assert list(times) == list(PIPELINE_STAGES)
+    assert all(seconds >= 0 for seconds in times.values())
+    assert times["segment"] > 0 and times["patch"] > 0
+    assert sum(times.values()) <= total
+
+    process_book(epub, meta, output_dir=str(tmp_path / "run"), backend="regex")
+    with open(tmp_path / "bench" / "lazy.json", "rb") as a, open(tmp_path / "run" / "lazy.json", "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_repeat_must_be_positive(tmp_path, sample_book, capsys):
+    from book_sbd.cli import main
+
+    epub, meta = sample_book
+    with pytest.raises(ValueError, match="repeat"):
+        measure_book((epub, meta, 0, "regex", "stdlib"))
+    with pytest.raises(SystemExit):
+        main(["bench", str(tmp_path), "--repeat", "0"])
+    assert "must be at least 1" in capsys.readouterr().err
+
+
+def test_measure_pipeline_reports_each_book(tmp_path, sample_book, make_epub):
+    epub, _meta = sample_book
+    make_epub(str(tmp_path / "nometa.epub"))
+    results = measure_pipeline([epub, str(tmp_path / "nometa.epub")], repeat=1, backend="regex")
+    assert list(results["books"]) == ["lazy"]
+    record = results["books"]["lazy"]
+    assert record["chapters"] == 2 and record["sentences"] > 0
+    assert record["total_s"] > 0 and record["chars_per_s"] > 0
+    assert set(record["stages_s"]) == set(PIPELINE_STAGES)
+    if record["peak_rss_kb"] is not None:
+        assert record["peak_rss_kb"] > 1024
+    assert results["totals"]["sentences"] == record["sentences"]
+    assert results["config"]["backend"] == "regex"
+
+
+def _results(segment_s, total_s, rss):
+    record = {
+        "stages_s": dict.fromkeys(PIPELINE_STAGES, 0.01) | {"segment": segment_s},
+        "total_s": total_s,
+        "peak_rss_kb": rss,
+    }
+    return {"books": {"a": copy.deepcopy(record)}, "totals": record}
+
+
+def test_compare_to_baseline_threshold():
+    baseline = _results(1.0, 2.0, 50_000)
+    assert compare_to_baseline(_results(1.05, 2.1, 50_000), baseline, threshold=0.10) == []
+
+    regressions = compare_to_baseline(_results(1.5, 2.1, 80_000), baseline, threshold=0.10)
+    assert regressions == [
+        "segment: 1500.0ms vs baseline 1000.0ms (+50.0%)",
+        "peak_rss: 78.1MB vs baseline 48.8MB (+60.0%)",
+        "a: segment: 1500.0ms vs baseline 1000.0ms (+50.0%)",
+        "a: peak_rss: 78.1MB vs baseline 48.8MB (+60.0%)",
+    ]
+    assert len(compare_to_baseline(_results(1.05, 2.1, 50_000), baseline, threshold=0.01)) == 4
+
+
+def test_compare_skips_books_missing_from_baseline():
+    baseline = _results(1.0, 2.0, None)
+    baseline["books"] = {}
+    assert compare_to_baseline(_results(1.0, 2.0, 60_000), baseline) == []
@@ -0,0 +1,204 @@
+"""Tests for the content-addressed stage cache."""
+
+import sys, os, time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from book_sbd.cache import StageCache, config_hash, parse_size
+from book_sbd.segment.base import Segmenter
+
+
+SHA = "ab" * 32
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = StageCache(str(tmp_path))
+    cache.put(SHA, "spans", "cfg", [[0, 5], [6, 10]])
+    assert cache.get(SHA, "spans", "cfg") == [[0, 5], [6, 10]]
+    assert cache.hits == 1
+
+
+def test_miss_on_other_config_or_stage(tmp_path):
+    cache = StageCache(str(tmp_path))
+    cache.put(SHA, "spans", "cfg", [1])
+    assert cache.get(SHA, "spans", "other") is None
+    assert cache.get(SHA, "canonical", "cfg") is None
+    assert cache.get("cd" * 32, "spans", "cfg") is None
+    assert cache.misses == 3
+
+
+def test_config_hash_stable_and_sensitive():
+    assert config_hash({"a": {1, 2}, "b": 3}) == config_hash({"b": 3, "a": {2, 1}})
+    assert config_hash({"a": 1}) != config_hash({"a": 2})
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = StageCache(str(tmp_path), max_bytes=None)
+    for i, stage in enumerate(["ingest", "canonical", "spans"]):
+        cache.put(SHA, stage, "cfg", "x" * 1000)
+        path = cache._path(cache.key(SHA, stage, "cfg"), stage)
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    # Touch the oldest entry so it becomes most recently used
+    cache.get(SHA, "ingest", "cfg")
+
+    total = cache.stats()["bytes"]
+    removed, _freed = cache.prune(total - 1)
+    assert removed == 1
+    assert cache.get(SHA, "canonical", "cfg") is None
+    assert cache.get(SHA, "ingest", "cfg") is not None
+
+
+def test_put_respects_max_bytes(tmp_path):
+    cache = StageCache(str(tmp_path), max_bytes=1500)
+    cache.put(SHA, "ingest", "cfg", "x" * 1000)
+    cache.put(SHA, "spans", "cfg", "y" * 1000)
+    assert cache.stats()["entries"] == 1
+
+
+def test_stats_per_stage(tmp_path):
+    cache = StageCache(str(tmp_path))
+    cache.put(SHA, "ingest", "cfg", [])
+    cache.put("cd" * 32, "ingest", "cfg", [])
+    cache.put(SHA, "spans", "cfg", [])
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["stages"]["ingest"]["entries"] == 2
+    assert stats["stages"]["spans"]["entries"] == 1
+
+
+def test_parse_size():
+    assert parse_size("1024") == 1024
+    assert parse_size("2K") == 2048
+    assert parse_size("500M") == 500 * 1024 ** 2
+    assert parse_size("1gb") == 1024 ** 3
+
+
+class _SegA(Segmenter):
+    def __init__(self, language="english"):
+        self._language = language
+
+    def segment(self, canonical_text):
+        return []
+
+
+def test_book_stages_without_cache_is_noop():
+    from book_sbd.cache import BookStages
+    stages = BookStages(None)
+    assert stages.get("ingest") is None
+    stages.put("ingest", [1])
+    assert stages.get("ingest") is None
+    assert stages.summary() == "ingest=run"
+
+
+def test_book_stages_tracks_status(tmp_path):
+    from book_sbd.cache import BookStages
+    fps = {"ingest": "i", "spans": "s"}
+    stages = BookStages(StageCache(str(tmp_path)), SHA, fps)
+    stages.put("ingest", [1])
+    rerun = BookStages(StageCache(str(tmp_path)), SHA, fps)
+    assert rerun.get("ingest") == [1]
+    assert rerun.get("spans") is None
+    assert rerun.summary() == "ingest=cached"
+
+
+def test_stage_fingerprints_only_invalidate_downstream():
+    from book_sbd.pipeline import CACHE_STAGES, stage_fingerprints
+    a = stage_fingerprints("dracula", _SegA())
+    b = stage_fingerprints("dracula", _SegA(language="german"))
+    assert list(a) == list(CACHE_STAGES)
+    assert a == stage_fingerprints("dracula", _SegA())
+    assert a["ingest"] == b["ingest"]
+    assert a["canonical"] == b["canonical"]
+    assert a["baseline"] != b["baseline"]
+    assert a["spans"] != b["spans"]
+
+
+def test_stage_fingerprints_cover_text_extractor():
+    from book_sbd.pipeline import stage_fingerprints
+    stdlib = stage_fingerprints("dracula", _SegA())
+    lxml = stage_fingerprints("dracula", _SegA(), extractor="lxml")
+    assert stdlib == stage_fingerprints("dracula", _SegA(), extractor="stdlib")
+    assert all(stdlib[stage] != lxml[stage] for stage in stdlib)
+
+
+class _ParaSegmenter(Segmenter):
+    def segment(self, text):
+        spans, pos = [], 0
+        for part in text.split("\n\n"):
+            if part.strip():
+                spans.append((pos, pos + len(part)))
+            pos += len(part) + 2
+        return spans
+
+
+def test_iter_chapter_spans_stores_stages_after_last_chapter(tmp_path):
+    from book_sbd.cache import BookStages
+    from book_sbd.ingest.structure import ChapterUnit
+    from book_sbd.pipeline import iter_chapter_spans
+
+    chapters = [ChapterUnit(number=i, label=None, text=f"One {i}.\n\nTwo {i}.") for i in (1, 2)]
+    fps = {"canonical": "c", "baseline": "b", "spans": "s"}
+    stages = BookStages(StageCache(str(tmp_path)), SHA, fps)
+    first = list(iter_chapter_spans(chapters, stages, _ParaSegmenter()))
+    assert [ch.number for ch, _t, _b, _s in first] == [1, 2]
+    assert stages.summary() == "canonical=run baseline=run spans=run"
+
+    rerun = BookStages(StageCache(str(tmp_path)), SHA, fps)
+    second = list(iter_chapter_spans(chapters, rerun, _ParaSegmenter()))
+    assert second == first
+    assert rerun.summary() == "canonical=cached spans=cached"
+
+
+class _BatchSegmenter(_ParaSegmenter):
+    def __init__(self):
+        self.batches = []
+
+    def segment(self, text):
+        raise AssertionError("segment_many should be used")
+
+    def segment_many(self, texts):
+        self.batches.append(list(texts))
+        return [_ParaSegmenter.segment(self, text) for text in self.batches[-1]]
+
+
+def test_iter_chapter_spans_segments_all_chapters_in_one_batch(tmp_path):
+    from book_sbd.cache import BookStages
+    from book_sbd.ingest.structure import ChapterUnit
+    from book_sbd.pipeline import iter_chapter_spans
+
+    chapters = [ChapterUnit(number=i, label=None, text=f"One {i}.\n\nTwo {i}.") for i in (1, 2, 3)]
+    segmenter = _BatchSegmenter()
+    got = list(iter_chapter_spans(chapters, BookStages(None), segmenter))
+    assert len(segmenter.batches) == 1
+    assert segmenter.batches[0] == [text for _ch, text, _b, _s in got]
+    assert got == list(iter_chapter_spans(chapters, BookStages(None), _ParaSegmenter()))
+
+
+def test_put_tracks_size_without_rescanning(tmp_path, monkeypatch):
+    cache = StageCache(str(tmp_path), max_bytes=10_000)
+    scans = []
+    entries = StageCache._entries
+    monkeypatch.setattr(StageCache, "_entries", lambda self: scans.append(1) or entries(self))
+    for i in range(20):
+        cache.put(f"{i:064x}", "spans", "cfg", "x" * 100)
+    cache.put(f"{0:064x}", "spans", "cfg", "x" * 200)  # rewrite replaces the old size
+    assert len(scans) == 1
+    assert cache._bytes == cache.stats()["bytes"]
+
+    for i in range(20, 80):
+        cache.put(f"{i:064x}", "spans", "cfg", "x" * 100)
+    assert cache.stats()["bytes"] <= 10_000
+    assert len(scans) < 20  # pruned to 90%, so not once per put
+
+
+def test_process_book_reads_each_stage_once(tmp_path, sample_book):
+    from book_sbd.cli import process_book
+
+    epub, meta = sample_book
+    cold = StageCache(str(tmp_path / "cache"))
+    process_book(epub, meta, backend="regex", cache=cold)
+    assert (cold.hits, cold.misses) == (0, 4)  # ingest, canonical, spans, baseline
+
+    warm = StageCache(str(tmp_path / "cache"))
+    process_book(epub, meta, backend="regex", cache=warm)
+    assert (warm.hits, warm.misses) == (3, 0)  # ingest, canonical, spans
@@ -1,9 +1,34 @@
 """Tests for canonicalization rules."""
 
-import sys, os
+import sys, os, random, re, unicodedata
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from book_sbd.canonicalize import canonicalize
+from book_sbd.canonicalize import canonicalize, is_canonical
+
+
+def _reference_canonicalize(text: str) -> str:
+    """The original line-by-line implementation, kept as the spec."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = text.replace("\ufeff", "")
+    text = unicodedata.normalize("NFC", text)
+    lines = text.split("\n")
+    processed = []
+    for line in lines:
+        line = re.sub(r"[ \t]+", " ", line)
+        line = line.rstrip()
+        processed.append(line)
+    text = "\n".join(processed)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+# Characters that exercise every rule: newline styles, BOM, tabs, runs of
+# spaces, non-ASCII whitespace rstrip() removes, and NFC compositions
+CANON_ALPHABET = [
+    "a", "b", ".", " ", "  ", "\t", "\n", "\n\n", "\r", "\r\n", "\ufeff",
+    "\xa0", "\u2003", "\u2028", "\x85", "\x0b", "\x1c", "\u3000",
+    "\u00e9", "e\u0301", "\u0301", "\u212b",
+]
 
 
 def test_normalize_newlines():
@@ -64,3 +89,23 @@ def test_preserve_paragraph_breaks():
     text = "Paragraph one.\n\nParagraph two."
     result = canonicalize(text)
     assert result == "Paragraph one.\n\nParagraph two."
+
+
+def test_matches_reference_implementation():
+    rng = random.Random(14)
+    for _ in range(20000):
+        text = "".join(rng.choice(CANON_ALPHABET) for _ in range(rng.randint(0, 16)))
+        assert canonicalize(text) == _reference_canonicalize(text), repr(text)
+
+
+def test_is_canonical():
+    assert is_canonical("Already\ncanonical\n\ntext.")
+    assert is_canonical("")
+    for text in [" lead", "trail\n", "a  b", "a\tb", "a\r\nb", "\ufeffa",
+                 "a\n\n\nb", "line \nnext", "line\xa0\nnext", "e\u0301"]:
+        assert not is_canonical(text), repr(text)
+
+
+def test_canonical_input_returned_unchanged():
+    text = "Paragraph one.\n\nParagraph two."
+    assert canonicalize(text) is text
@@ -0,0 +1,37 @@
+"""Property-based equivalence of canonicalize() with the reference implementation."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+
+from book_sbd.canonicalize import canonicalize, is_canonical
+
+from .test_canonicalize import CANON_ALPHABET, _reference_canonicalize
+
+# Mostly the rule-exercising pieces, plus arbitrary text
+_texts = st.one_of(
+    st.lists(st.sampled_from(CANON_ALPHABET), max_size=40).map("".join),
+    st.text(max_size=80),
+)
+
+
+@settings(max_examples=1000)
+@given(_texts)
+def test_equivalent_to_reference(text):
+    assert canonicalize(text) == _reference_canonicalize(text)
+
+
+@given(_texts)
+def test_output_is_canonical_and_idempotent(text):
+    result = canonicalize(text)
+    assert is_canonical(result)
+    assert canonicalize(result) == result
+
+
+@given(_texts)
+def test_is_canonical_agrees_with_reference(text):
+    assert is_canonical(text) == (_reference_canonicalize(text) == text)
@@ -0,0 +1,67 @@
+"""Startup guards: light CLI paths must not import NLTK or stage modules."""
+
+import sys, os, subprocess
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+
+def _loaded_modules(code):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    out = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys; print('\\n'.join(sys.modules))"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_cli_import_is_light():
+    mods = _loaded_modules("import book_sbd.cli")
+    assert "nltk" not in mods
+    assert "book_sbd.segment.punkt_backend" not in mods
+    assert "book_sbd.ingest.structure" not in mods
+
+
+_HEAVY_MODULES = (
+    "nltk",
+    "book_sbd.segment.punkt_backend",
+    "book_sbd.ingest.structure",
+    "book_sbd.ingest.epub_parser",
+    "book_sbd.ingest.boilerplate",
+    "book_sbd.export",
+)
+
+
+def test_parser_build_is_light():
+    # Building the parser (choices=...) must not pull in the stage modules
+    for argv in (["--help"], ["run", "--help"], ["batch", "--help"], ["eval", "--help"]):
+        mods = _loaded_modules(
+            "from book_sbd.cli import main\n"
+            "try:\n"
+            f"    main({argv!r})\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        for name in _HEAVY_MODULES:
+            assert name not in mods, (argv, name)
+
+
+def test_punkt_backend_import_does_not_load_nltk():
+    mods = _loaded_modules("import book_sbd.segment.punkt_backend")
+    assert "nltk" not in mods
+
+
+def test_help_exits_cleanly():
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    out = subprocess.run(
+        [sys.executable, "-m", "book_sbd.cli", "--help"],
+        capture_output=True, text=True, env=env,
+    )
+    assert out.returncode == 0
+    assert "book-sbd" in out.stdout
+
+
+def test_measure_startup_reports_each_command():
+    from book_sbd.bench import measure_startup
+    results = measure_startup({"help": ["--help"]}, repeat=1)
+    assert results["help"]["min_s"] > 0
@@ -0,0 +1,59 @@
+"""Tests for the Parquet sentence/chapter export."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from book_sbd.columnar import export_parquet, load_chapters, load_sentences, sentence_texts
+
+
+def _book(slug, n_chapters):
+    chapters = []
+    for c in range(1, n_chapters + 1):
+        parts = [(f"Chapter {c} starts.", "prose"), ("Then “it” ends.", "prose"),
+                 ("A verse line", "verse")]
+        text = " ".join(p for p, _t in parts)
+        sentences, pos = [], 0
+        for i, (part, sent_type) in enumerate(parts, start=1):
+            sentences.append({"number": i, "start": pos, "end": pos + len(part),
+                              "text": part, "type": sent_type})
+            pos += len(part) + 1
+        chapters.append({
+            "number": c,
+            "label": f"CH {c}" if c % 2 else None,
+            "canonical_text": text,
+            "sentences": sentences,
+        })
+    return {"slug": slug, "meta": {}, "processed_chapters": chapters}
+
+
+def test_schema_and_roundtrip(tmp_path):
+    books = [_book("alpha", 2), _book("beta", 3)]
+    for book in books:
+        export_parquet(book, str(tmp_path))
+
+    sentences = load_sentences(str(tmp_path))
+    assert sentences.num_rows == 15
+    for col in ("chapter", "number", "start", "end", "char_len"):
+        assert sentences.schema.field(col).type == pa.int32()
+    assert pa.types.is_dictionary(sentences.schema.field("type").type)
+    assert pa.types.is_dictionary(sentences.schema.field("slug").type)
+
+    chapters = load_chapters(str(tmp_path))
+    assert chapters.num_rows == 5
+    assert chapters.column("label").to_pylist()[:2] == ["CH 1", None]
+
+    expected = [s["text"] for b in books for ch in b["processed_chapters"] for s in ch["sentences"]]
+    assert sentence_texts(sentences, chapters) == expected
+
+
+def test_loads_only_requested_columns_and_slugs(tmp_path):
+    export_parquet(_book("alpha", 2), str(tmp_path))
+    export_parquet(_book("beta", 1), str(tmp_path))
+    table = load_sentences(str(tmp_path), columns=["char_len", "type"], slugs=["beta"])
+    assert table.column_names == ["char_len", "type"]
+    assert table.column("type").to_pylist() == ["prose", "prose", "verse"]
+    assert table.column("char_len").to_pylist() == [len("Chapter 1 starts."), len("Then “it” ends."), len("A verse line")]
@@ -0,0 +1,64 @@
+"""Tests for the compact offsets-only export and CompactBook reader."""
+
+import sys, os, io, json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.compact import CompactBook, export_compact, write_compact_json
+
+
+def _book():
+    chapters = []
+    for c, parts in enumerate([
+        [("Hello there.", "prose"), ("“Quoted,” she said.", "prose")],
+        [],
+        [("Roses are red\nviolets are blue", "verse")],
+    ], start=1):
+        text = " ".join(p for p, _t in parts)
+        sentences, pos = [], 0
+        for i, (part, sent_type) in enumerate(parts, start=1):
+            sentences.append({"number": i, "start": pos, "end": pos + len(part),
+                              "text": part, "type": sent_type})
+            pos += len(part) + 1
+        chapters.append({"number": c, "label": f"Ch {c}", "canonical_text": text,
+                         "sentences": sentences})
+    return {"slug": "tiny", "meta": {"title": "Tiny", "author": "Anon"},
+            "processed_chapters": chapters}
+
+
+def test_roundtrip(tmp_path):
+    book_data = _book()
+    path = export_compact(book_data, str(tmp_path))
+    assert path.endswith("tiny.compact.json")
+
+    book = CompactBook.load(path)
+    assert book.slug == "tiny" and book.meta["title"] == "Tiny"
+    assert book.stats == {"chapter_count": 3, "total_sentences": 3,
+                          "total_chars": sum(s["end"] - s["start"]
+                                             for ch in book_data["processed_chapters"]
+                                             for s in ch["sentences"])}
+    assert book.sentence(1, 2) == "“Quoted,” she said."
+    assert book.chapter(3).sentence_type(1) == "verse"
+    assert len(book.chapter(2)) == 0
+    assert list(book.chapter(1).sentences()) == ["Hello there.", "“Quoted,” she said."]
+
+    expected = [
+        {"number": s["number"], "text": s["text"], "type": s["type"],
+         "start": s["start"], "end": s["end"], "char_len": s["end"] - s["start"]}
+        for ch in book_data["processed_chapters"] for s in ch["sentences"]
+    ]
+    got = [{k: v for k, v in s.items() if k != "chapter"} for s in book.iter_sentences()]
+    assert got == expected
+
+
+def test_out_of_range_and_bad_schema():
+    buf = io.StringIO()
+    write_compact_json(_book(), buf)
+    book = CompactBook.from_dict(json.loads(buf.getvalue()))
+    with pytest.raises(IndexError):
+        book.sentence(1, 3)
+    with pytest.raises(IndexError):
+        book.chapter(4)
+    with pytest.raises(ValueError):
+        CompactBook.from_dict({"schema": "book-sbd/1.1.0"})
@@ -0,0 +1,77 @@
+"""Tests for lazy spine loading in parse_epub."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.ingest.epub_parser import parse_epub
+from book_sbd.ingest.structure import chapter_nav_entries, extract_chapters
+
+
+def test_only_referenced_documents_are_read(tmp_path, make_epub):
+    path = str(tmp_path / "lazy.epub")
+    make_epub(path)
+    with parse_epub(path) as epub_data:
+        assert [item.href for item in epub_data.spine_items] == [
+            "cover.xhtml", "ch1.xhtml", "ch2.xhtml", "license.xhtml",
+        ]
+        assert epub_data.archive.reads == 0
+        assert not any(item.loaded for item in epub_data.spine_items)
+
+        resolved = chapter_nav_entries(epub_data, "lazy")
+        assert [idx for _entry, idx in resolved] == [1, 2]
+        assert epub_data.archive.reads == 0
+
+        chapters = extract_chapters(epub_data, slug="lazy")
+        assert [ch.label for ch in chapters] == ["CHAPTER I", "CHAPTER II"]
+        assert [item.loaded for item in epub_data.spine_items] == [False, True, True, False]
+        assert epub_data.archive.reads == 2
+
+
+def test_loaded_content_survives_close(tmp_path, make_epub):
+    path = str(tmp_path / "lazy.epub")
+    make_epub(path)
+    epub_data = parse_epub(path)
+    first = epub_data.spine_items[1].content
+    epub_data.close()
+    assert epub_data.spine_items[1].content == first
+    with pytest.raises(ValueError):
+        epub_data.spine_items[0].content
+
+
+def _open_handles(path):
+    """File descriptors of this process open on path (Linux /proc only)."""
+    fd_dir = "/proc/self/fd"
+    if not os.path.isdir(fd_dir):
+        pytest.skip("needs /proc/self/fd")
+    handles = []
+    for fd in os.listdir(fd_dir):
+        try:
+            if os.readlink(os.path.join(fd_dir, fd)) == os.path.realpath(path):
+                handles.append(fd)
+        except OSError:
+            continue  # closed while listing
+    return handles
+
+
+def test_ingest_book_leaves_no_open_handle(sample_book):
+    from book_sbd.pipeline import ingest_book
+
+    path, meta = sample_book
+    book = ingest_book(path, meta)
+    assert len(book["chapters"]) == 2
+    assert _open_handles(path) == []
+
+
+def test_unclosed_epub_is_released_when_collected(tmp_path, make_epub):
+    import gc
+
+    path = str(tmp_path / "lazy.epub")
+    make_epub(path)
+    epub_data = parse_epub(path)
+    epub_data.spine_items[1].content
+    assert len(_open_handles(path)) == 1
+    del epub_data
+    gc.collect()
+    assert _open_handles(path) == []
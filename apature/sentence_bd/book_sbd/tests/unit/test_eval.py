@@ -0,0 +1,165 @@
+"""Tests for boundary matching and P/R/F1 evaluation."""
+
+import sys, os, json, random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from book_sbd.eval import (
+    combine_metrics,
+    evaluate_book,
+    evaluate_boundaries,
+    evaluate_boundaries_multi,
+)
+
+
+def _reference_tp(predicted, gold, tolerance):
+    """The original quadratic greedy matcher."""
+    tp, matched = 0, set()
+    for p in sorted(set(predicted)):
+        for g in sorted(set(gold)):
+            if g not in matched and abs(p - g) <= tolerance:
+                tp += 1
+                matched.add(g)
+                break
+    return tp
+
+
+def test_matches_reference_greedy():
+    rng = random.Random(21)
+    for _ in range(3000):
+        hi = rng.randint(1, 80)
+        pred = [rng.randint(0, hi) for _ in range(rng.randint(0, 25))]
+        gold = [rng.randint(0, hi) for _ in range(rng.randint(0, 25))]
+        tolerance = rng.randint(0, 6)
+        m = evaluate_boundaries(pred, gold, tolerance)
+        assert m.true_positives == _reference_tp(pred, gold, tolerance), (pred, gold, tolerance)
+        assert m.total_predicted == len(set(pred)) and m.total_gold == len(set(gold))
+        assert m.false_positives == m.total_predicted - m.true_positives
+        assert m.false_negatives == m.total_gold - m.true_positives
+
+
+def test_greedy_takes_lowest_gold_in_range():
+    # 5 takes gold 3 (not 6), leaving 6 for prediction 9 at tolerance 3
+    m = evaluate_boundaries([5, 9], [3, 6], tolerance=3)
+    assert m.true_positives == 2
+    assert evaluate_boundaries([5, 9], [3, 6], tolerance=2).true_positives == 1
+
+
+def test_multi_tolerance_sweep_matches_single_calls():
+    rng = random.Random(7)
+    pred = sorted(rng.sample(range(5000), 400))
+    gold = sorted(rng.sample(range(5000), 400))
+    sweep = evaluate_boundaries_multi(pred, gold, (5, 0, 3, 3, 1))
+    assert list(sweep) == [5, 0, 3, 1]
+    for tolerance, metrics in sweep.items():
+        assert metrics == evaluate_boundaries(pred, gold, tolerance)
+    assert sweep[0].true_positives <= sweep[1].true_positives <= sweep[5].true_positives
+
+
+def test_empty_inputs():
+    m = evaluate_boundaries([], [])
+    assert (m.precision, m.recall, m.f1) == (0.0, 0.0, 0.0)
+    assert evaluate_boundaries([1, 2], []).false_positives == 2
+    assert evaluate_boundaries([], [1, 2]).false_negatives == 2
+
+
+def test_large_inputs_are_linear():
+    pred = list(range(0, 2_000_000, 10))
+    gold = list(range(2, 2_000_000, 10))
+    m = evaluate_boundaries(pred, gold, tolerance=3)
+    assert m.true_positives == len(gold) and m.f1 == 1.0
+
+
+def test_evaluate_book_and_combine():
+    gold = {"slug": "x", "chapters": [
+        {"number": 1, "sentence_boundaries": [0, 20, 40]},
+        {"number": 2, "sentence_boundaries": [0, 30]},
+    ]}
+    pred = {1: [(0, 19), (21, 39), (60, 70)], 2: [(0, 30)]}
+    result = evaluate_book(pred, gold)
+    per_chapter = result["per_chapter"]
+    assert per_chapter[1].true_positives == 2 and per_chapter[2].true_positives == 1
+    total = combine_metrics(list(per_chapter.values()))
+    assert (total.true_positives, total.total_predicted, total.total_gold) == (3, 4, 5)
+    assert total.false_positives == 1 and total.false_negatives == 2
+
+
+def _gold_book(tmp_path, epub, meta):
+    """A gold file for the sample book, built from its own output."""
+    from book_sbd.cli import process_book
+
+    book_data = process_book(epub, meta, backend="regex")
+    chapters = [
+        {"number": ch["number"], "sentence_boundaries": [s["start"] for s in ch["sentences"]]}
+        for ch in book_data["processed_chapters"]
+    ]
+    chapters[0]["sentence_boundaries"].append(10_000)
+    gold = str(tmp_path / "gold" / "lazy.json")
+    os.makedirs(os.path.dirname(gold))
+    with open(gold, "w", encoding="utf-8") as f:
+        json.dump({"slug": "lazy", "chapters": chapters}, f)
+    return gold, epub, meta
+
+
+def test_eval_books_runs_pipeline_and_reuses_cache(tmp_path, sample_book):
+    from book_sbd.cache import StageCache
+    from book_sbd.parallel import eval_books
+
+    gold, epub, meta = _gold_book(tmp_path, *sample_book)
+    cache = StageCache(str(tmp_path / "cache"))
+    job = (gold, epub, meta, {"cache": cache, "backend": "regex"})
+    (first,) = eval_books([job], jobs=1, backend="regex")
+    assert first["slug"] == "lazy" and first["chars"] > 0 and first["seconds"] > 0
+    assert first["aggregate"]["false_negatives"] == 1
+    assert first["aggregate"]["precision"] == 1.0
+    assert [ch["number"] for ch in first["chapters"]] == [1, 2]
+    assert first["chapters"][0]["recall"] < 1.0 and first["chapters"][1]["f1"] == 1.0
+
+    misses = cache.misses
+    (second,) = eval_books([job], jobs=1, backend="regex")
+    assert cache.misses == misses and cache.hits > 0
+    assert second["chapters"] == first["chapters"]
+
+
+def test_cmd_eval_writes_metrics_json(tmp_path, sample_book, monkeypatch, capsys):
+    from book_sbd.cli import main
+
+    gold, epub, _meta = _gold_book(tmp_path, *sample_book)
+    out = str(tmp_path / "metrics.json")
+    monkeypatch.setattr(sys, "argv", [
+        "book-sbd", "eval", os.path.dirname(gold), "--epub-dir", os.path.dirname(epub),
+        "--backend", "regex", "--metrics-json", out,
+    ])
+    main()
+    assert "lazy" in capsys.readouterr().out
+    with open(out, encoding="utf-8") as f:
+        report = json.load(f)
+    summary = report["backends"]["regex"]
+    assert summary["aggregate"]["false_negatives"] == 1
+    assert summary["books"][0]["chapters"][1]["label"] == "CHAPTER II"
+
+
+def test_cmd_eval_records_the_tolerance_it_used(tmp_path, sample_book):
+    from book_sbd.cli import main
+
+    gold, epub, _meta = _gold_book(tmp_path, *sample_book)
+    with open(gold, encoding="utf-8") as f:
+        data = json.load(f)
+    data["chapters"][1]["sentence_boundaries"][-1] += 2  # off by 2 chars
+    with open(gold, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    reports = {}
+    for argv in ([], ["--tolerance", "1"]):
+        out = str(tmp_path / f"metrics{len(argv)}.json")
+        main([
+            "eval", os.path.dirname(gold), "--epub-dir", os.path.dirname(epub),
+            "--backend", "regex", "--metrics-json", out, *argv,
+        ])
+        with open(out, encoding="utf-8") as f:
+            reports[len(argv)] = json.load(f)
+    assert reports[0]["tolerance"] == 3 and reports[2]["tolerance"] == 1
+    false_negatives = {
+        key: report["backends"]["regex"]["books"][0]["chapters"][1]["false_negatives"]
+        for key, report in reports.items()
+    }
+    assert false_negatives == {0: 0, 2: 1}
@@ -0,0 +1,138 @@
+"""Streaming exporter must match the reference json.dumps encoding byte for byte."""
+
+import sys, os, io, json, tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd import __version__
+from book_sbd.export import export_book, write_book_json
+
+
+def _reference(book_data):
+    """The pre-streaming encoder: build the whole dict, dump it at once."""
+    meta = book_data["meta"]
+    chapters = []
+    for ch in book_data["processed_chapters"]:
+        sents = [{
+            "number": s["number"], "text": s["text"], "type": s.get("type", "prose"),
+            "start": s["start"], "end": s["end"], "char_len": s["end"] - s["start"],
+        } for s in ch["sentences"]]
+        chapters.append({
+            "label": ch.get("label"), "number": ch["number"],
+            "sentence_count": len(sents), "sentences": sents,
+        })
+    output = {
+        "author": meta.get("author", ""),
+        "chapters": chapters,
+        "format": meta.get("format", ""),
+        "gutenberg_id": meta.get("gutenberg_id", ""),
+        "pipeline_version": __version__,
+        "slug": book_data["slug"],
+        "source_url": meta.get("source_url", ""),
+        "stats": {
+            "chapter_count": len(chapters),
+            "total_chars": sum(s["char_len"] for c in chapters for s in c["sentences"]),
+            "total_sentences": sum(len(c["sentences"]) for c in chapters),
+        },
+        "title": meta.get("title", ""),
+    }
+    return json.dumps(output, sort_keys=False, ensure_ascii=False, indent=2) + "\n"
+
+
+def _book(chapters, meta=None):
+    return {
+        "slug": "stream-test",
+        "meta": meta if meta is not None else {
+            "title": "Les Misérables — “Vol. I”", "author": "Victor Hugo",
+            "gutenberg_id": "135", "source_url": "https://example.org/135",
+            "format": "epub",
+        },
+        "processed_chapters": chapters,
+    }
+
+
+def _sent(n, text, start, t=None):
+    s = {"number": n, "text": text, "start": start, "end": start + len(text)}
+    if t is not None:
+        s["type"] = t
+    return s
+
+
+def _stream(book_data):
+    buf = io.StringIO()
+    write_book_json(book_data, buf)
+    return buf.getvalue()
+
+
+def test_matches_reference():
+    book = _book([
+        {"number": 1, "label": "I", "sentences": [
+            _sent(1, "He said \"hi\"\\.", 0), _sent(2, "Tab\thereé.", 15, "prose"),
+        ]},
+        {"number": 2, "label": None, "sentences": [
+            _sent(1, "Line one\nline two", 0, "verse"),
+        ]},
+    ])
+    assert _stream(book) == _reference(book)
+
+
+def test_empty_chapter_and_empty_book():
+    book = _book([
+        {"number": 1, "label": "Empty", "sentences": []},
+        {"number": 2, "label": "II", "sentences": [_sent(1, "Only.", 0)]},
+    ])
+    assert _stream(book) == _reference(book)
+    empty = _book([], meta={})
+    assert _stream(empty) == _reference(empty)
+
+
+def test_returns_stats():
+    book = _book([{"number": 1, "label": "I", "sentences": [
+        _sent(1, "Abc.", 0), _sent(2, "De.", 5),
+    ]}])
+    stats = write_book_json(book, io.StringIO())
+    assert stats == {"chapter_count": 1, "total_chars": 7, "total_sentences": 2}
+
+
+def test_export_book_file_bytes():
+    book = _book([{"number": 1, "label": "I", "sentences": [_sent(1, "Bonjour…", 0)]}])
+    with tempfile.TemporaryDirectory() as d:
+        path = export_book(book, d)
+        with open(path, "rb") as f:
+            assert f.read() == _reference(book).encode("utf-8")
+
+
+def test_failed_export_keeps_previous_file():
+    good = _book([{"number": 1, "label": "I", "sentences": [_sent(1, "Fine.", 0)]}])
+    # A sentence missing "end" fails part way through the stream
+    bad = _book([{"number": 1, "label": "I", "sentences": [_sent(1, "Fine.", 0), {"number": 2}]}])
+    with tempfile.TemporaryDirectory() as d:
+        path = export_book(good, d)
+        with pytest.raises(KeyError):
+            export_book(bad, d)
+        with open(path, "rb") as f:
+            assert f.read() == _reference(good).encode("utf-8")
+        assert os.listdir(d) == [os.path.basename(path)]
+        if os.name == "posix":
+            umask = os.umask(0)
+            os.umask(umask)
+            assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_chapter_jsonl_records():
+    from book_sbd.export import write_chapter_jsonl
+    buf = io.StringIO()
+    sents = [_sent(1, "Hé.", 0), _sent(2, "Line\nverse", 4, "verse")]
+    assert write_chapter_jsonl(buf, "stream-test", 3, "III", sents) == 2
+    lines = buf.getvalue().splitlines()
+    assert len(lines) == 2
+    rec = json.loads(lines[1])
+    assert list(rec) == [
+        "slug", "chapter", "chapter_label", "number", "type",
+        "start", "end", "char_len", "text",
+    ]
+    assert rec["chapter"] == 3 and rec["chapter_label"] == "III"
+    assert rec["type"] == "verse" and rec["char_len"] == len("Line\nverse")
+    assert json.loads(lines[0])["type"] == "prose"
+    assert "Hé." in lines[0]
@@ -54,3 +54,29 @@ def test_looks_like_title_entry():
     assert _looks_like_title_entry("CHAPTER I") is False
     assert _looks_like_title_entry("Book I") is False
     assert _looks_like_title_entry("I. A SCANDAL IN BOHEMIA") is False
+
+
+def test_anchor_index_matches_regex_scan():
+    from book_sbd.ingest.structure import _AnchorIndex, _find_fragment_pos
+    html = (
+        "<html><body>"
+        "<p NAME='dup'>a</p><h2 id=\"Dup\">b</h2>"          # id beats name
+        "<div data-id=\"sub\">c</div>"                       # suffix match counts
+        "<a title='x id=\"inner\"' name='outer'>d</a>"       # overlapping attrs
+        "<h3 ID = 'spaced'>e</h3>"
+        "<p id=\"Kelvin\">f</p><p id=\"café\">g</p>"
+        "</body></html>"
+    )
+    index = _AnchorIndex(html)
+    fragments = ["dup", "DUP", "sub", "inner", "outer", "spaced", "kelvin",
+                 "café", "missing", "", "a\"b"]
+    for frag in fragments:
+        assert index.find(frag) == _find_fragment_pos(html, frag), frag
+
+
+def test_anchor_index_ascii_fast_path():
+    from book_sbd.ingest.structure import _AnchorIndex, _find_fragment_pos
+    html = "".join(f'<h2><a id="c{i}"></a>Chapter {i}</h2><p>Text {i}.</p>' for i in range(50))
+    index = _AnchorIndex(html)
+    for i in range(50):
+        assert index.find(f"c{i}") == _find_fragment_pos(html, f"c{i}") == html.index(f'<a id="c{i}"')
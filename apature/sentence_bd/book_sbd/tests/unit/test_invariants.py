@@ -1,8 +1,10 @@
 """Tests for invariant helpers."""
 
-import sys, os
+import sys, os, json, random
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
+import pytest
+
 from book_sbd.invariants import (
     check_chapter_numbers_contiguous,
     check_sentence_numbers_contiguous,
@@ -14,6 +16,7 @@ from book_sbd.invariants import (
     check_no_separator_sentences,
     check_coverage,
     validate_book,
+    validate_export,
 )
 
 
@@ -197,3 +200,72 @@ def test_coverage_fail_gap():
     errors = check_coverage(ch, text)
     assert len(errors) == 1
     assert "uncovered" in errors[0]
+
+
+def _reference_uncovered(sentences, text):
+    covered = set()
+    for s in sentences:
+        covered.update(range(s.get("start", 0), s.get("end", 0)))
+    return [i for i, c in enumerate(text) if not c.isspace() and i not in covered]
+
+
+def test_coverage_matches_per_character_reference():
+    rng = random.Random(23)
+    for _ in range(3000):
+        n = rng.randint(0, 40)
+        text = "".join(rng.choice("ab \n\t.\u00a0") for _ in range(n))
+        sentences = []
+        for i in range(rng.randint(0, 6)):
+            start = rng.randint(-3, n + 3)
+            sentences.append({"number": i + 1, "start": start, "end": start + rng.randint(-2, 10)})
+        uncovered = _reference_uncovered(sentences, text)
+        errors = check_coverage({"number": 1, "sentences": sentences}, text)
+        if not uncovered:
+            assert errors == []
+        else:
+            assert len(errors) == 1 and f" {len(uncovered)} uncovered" in errors[0]
+            assert f"pos {uncovered[0]}:" in errors[0]
+
+
+def test_coverage_ignores_whitespace_gaps_and_overlaps():
+    text = "  One.\n\nTwo three.  Four. "
+    ch = {"number": 1, "sentences": [
+        {"number": 1, "start": 2, "end": 6},
+        {"number": 2, "start": 8, "end": 18},
+        {"number": 3, "start": 12, "end": 18},
+        {"number": 4, "start": 20, "end": 25},
+    ]}
+    assert check_coverage(ch, text) == []
+    ch["sentences"].pop()
+    errors = check_coverage(ch, text)
+    assert "5 uncovered" in errors[0] and "pos 20: 'F'" in errors[0]
+
+
+def test_validate_export_uses_compact_text(tmp_path, sample_book, monkeypatch, capsys):
+    from book_sbd.cli import process_book
+
+    epub, meta = sample_book
+    out = str(tmp_path / "out")
+    process_book(epub, meta, output_dir=out, formats=("json", "compact"), backend="regex")
+    path = os.path.join(out, "lazy.json")
+    assert validate_export(path) == []
+
+    with open(path, encoding="utf-8") as f:
+        book = json.load(f)
+    book["chapters"][0]["sentences"][0]["end"] -= 2
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(book, f)
+    errors = validate_export(path)
+    assert any("text mismatch" in e for e in errors)
+    assert any("uncovered" in e for e in errors)
+
+    from book_sbd.cli import main
+    monkeypatch.setattr(sys, "argv", ["book-sbd", "validate", out, "--max-errors", "1"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    assert "0 of 1 books valid" in capsys.readouterr().out
+
+    # Without the compact export only the structural checks can run
+    os.remove(os.path.join(out, "lazy.compact.json"))
+    assert validate_export(path) == []
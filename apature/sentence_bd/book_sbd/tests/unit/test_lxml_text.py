@@ -0,0 +1,109 @@
+"""Equivalence tests for the lxml text extractor against html_to_text."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.ingest.lxml_text import XhtmlText, html_to_text_lxml
+from book_sbd.ingest.structure import TEXT_EXTRACTORS, html_to_text
+
+_PROLOG = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" '
+    '"http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">\n\n'
+)
+
+
+def _doc(body, prolog=_PROLOG, epilog="\n"):
+    return (
+        prolog + '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+        "<head><title>T</title><style>p { margin: 0 }</style></head>\n"
+        f"<body>{body}</body>\n</html>{epilog}"
+    )
+
+
+SUPPORTED = [
+    _doc("<p>Plain text.</p>"),
+    _doc("<h2 id=\"c1\">CHAPTER I</h2>\n<p>One &amp; two &lt;b&gt; &#8220;q&#x201D;</p>"),
+    _doc("<p>a<br/>b<br></br>c</p><hr/><div><p>nested</p>\n</div>"),
+    _doc("<p>x<!-- note -->y<?pi data?>z</p>"),
+    _doc("<p>&nbsp;lead&nbsp;&mdash;tail</p><p>a<!--c-->&nbsp;b</p>"),
+    _doc("<p>before</p><script>var a = 1;</script><p>after</p>"),
+    _doc("<P CLASS='x'>Upper</P><p title='a&gt;b'>attr</p>"),
+    _doc("<p>x</p>", prolog="", epilog=""),
+    _doc("<p>x</p>", epilog="\n<!-- trailer -->\n\n"),
+]
+
+UNSUPPORTED = [
+    _doc("<p>a\r\nb</p>"),                       # XML normalizes \r\n
+    _doc("<p><![CDATA[x < y]]></p>"),            # html.parser keeps CDATA markup
+    _doc("<p>x &#x80; y</p>"),                   # html.unescape remaps C1 controls
+    _doc("<svg:svg xmlns:svg='http://www.w3.org/2000/svg'/>"),
+    _doc("<p>not <b>well formed</p>"),
+    _doc("<!-- <p>commented</p> --><p>x</p>"),   # "<p" inside a comment
+    "<p>fragment & more",
+]
+
+
+@pytest.mark.parametrize("html", SUPPORTED)
+def test_whole_document_matches(html):
+    doc = XhtmlText(html)
+    assert doc.supported
+    assert doc.text() == html_to_text(html)
+    assert html_to_text_lxml(html) == html_to_text(html)
+
+
+@pytest.mark.parametrize("html", UNSUPPORTED)
+def test_unsupported_input_falls_back(html):
+    doc = XhtmlText(html)
+    assert not doc.supported
+    assert doc.text() == html_to_text(html)
+
+
+@pytest.mark.parametrize("html", SUPPORTED)
+def test_every_slice_between_markup_matches(html):
+    doc = XhtmlText(html)
+    bounds = [i for i, ch in enumerate(html) if ch == "<"] + [len(html)]
+    for i, start in enumerate(bounds):
+        for end in bounds[i:]:
+            assert doc.text(start, end) == html_to_text(html[start:end]), (start, end)
+
+
+def test_chapter_slices_of_shared_document():
+    body = "".join(
+        f'<h2><a id="c{i}"></a>CHAPTER {i}</h2>\n<p>Text of chapter {i} &amp; more.</p>\n'
+        for i in range(20)
+    )
+    html = _doc(body)
+    doc = XhtmlText(html)
+    starts = [html.index(f'<a id="c{i}"') for i in range(20)]
+    for start, end in zip(starts, starts[1:] + [len(html)]):
+        assert doc.text(start, end) == html_to_text(html[start:end])
+    assert doc.text(0, starts[0]) == html_to_text(html[:starts[0]])
+
+
+def test_extract_chapters_is_extractor_independent(tmp_path, make_epub):
+    from book_sbd.ingest.epub_parser import parse_epub
+    from book_sbd.ingest.structure import extract_chapters
+
+    path = str(tmp_path / "book.epub")
+    make_epub(path)
+    results = []
+    for extractor in TEXT_EXTRACTORS:
+        with parse_epub(path) as epub_data:
+            results.append([
+                (ch.number, ch.label, ch.text)
+                for ch in extract_chapters(epub_data, slug="book", extractor=extractor)
+            ])
+    assert results[0] and all(r == results[0] for r in results)
+
+
+def test_unknown_extractor_rejected(tmp_path, make_epub):
+    from book_sbd.ingest.epub_parser import parse_epub
+    from book_sbd.ingest.structure import extract_chapters
+
+    path = str(tmp_path / "book.epub")
+    make_epub(path)
+    with parse_epub(path) as epub_data, pytest.raises(ValueError):
+        extract_chapters(epub_data, extractor="regex")
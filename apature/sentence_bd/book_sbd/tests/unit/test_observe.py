@@ -0,0 +1,103 @@
+"""Tests for pipeline instrumentation events and the built-in sinks."""
+
+import sys, os, json, pickle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.cli import process_book
+from book_sbd.observe import JsonLinesObserver, MemoryObserver, Observer
+
+
+class _Recorder(Observer):
+    def __init__(self):
+        self.events = []
+
+    def event(self, name, **fields):
+        self.events.append((name, fields))
+
+
+def test_process_book_event_sequence(tmp_path, sample_book):
+    epub, meta = sample_book
+    recorder = _Recorder()
+    book_data = process_book(
+        epub, meta, output_dir=str(tmp_path / "out"), formats=("json", "jsonl"),
+        backend="regex", observer=recorder,
+    )
+    names = [name for name, _fields in recorder.events]
+    assert names == [
+        "book_start", "stage_start", "stage_end",
+        "stage_start", "stage_end", "stage_start", "chapter", "chapter",
+        "stage_end", "patch_rules", "stage_start", "stage_end", "book_end",
+    ]
+    assert all(fields["slug"] == "lazy" for _name, fields in recorder.events)
+    ends = {f["stage"]: f for name, f in recorder.events if name == "stage_end"}
+    assert list(ends) == ["setup", "ingest", "segment", "export"]
+    assert ends["ingest"]["chapters"] == 2
+    assert ends["segment"]["sentences"] == sum(len(ch["sentences"]) for ch in book_data["processed_chapters"])
+    out_files = os.listdir(tmp_path / "out")
+    assert ends["export"]["bytes_out"] == sum(os.path.getsize(tmp_path / "out" / f) for f in out_files)
+    assert recorder.events[0][1]["bytes_in"] == os.path.getsize(epub)
+
+
+def test_observer_does_not_change_output(tmp_path, sample_book):
+    epub, meta = sample_book
+    process_book(epub, meta, output_dir=str(tmp_path / "a"), backend="regex")
+    process_book(epub, meta, output_dir=str(tmp_path / "b"), backend="regex", observer=MemoryObserver())
+    with open(tmp_path / "a" / "lazy.json", "rb") as a, open(tmp_path / "b" / "lazy.json", "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_memory_observer_counts_cache_hits(tmp_path, sample_book):
+    from book_sbd.cache import StageCache
+
+    epub, meta = sample_book
+    observer = MemoryObserver()
+    for _ in range(2):
+        cache = StageCache(str(tmp_path / "cache"))
+        process_book(epub, meta, backend="regex", cache=cache, observer=observer)
+    summary = observer.summary()
+    assert summary["cache_misses"] == {"ingest": 1, "canonical": 1, "baseline": 1, "spans": 1}
+    assert summary["cache_hits"] == {"ingest": 1, "canonical": 1, "spans": 1}
+    assert summary["stage_calls"] == {"setup": 2, "ingest": 2, "segment": 2, "export": 2}
+    # Merges are only counted when spans are computed, not read from the cache
+    assert set(summary["rule_merges"]) >= {"abbreviation", "quoted_discourse"}
+    assert summary["books"] == 1 and summary["counters"]["chapters"] == 4
+    assert summary["slowest_books"][0][0] == "lazy"
+
+
+def test_chapter_jobs_report_the_same_rule_merges(sample_book):
+    epub, meta = sample_book
+    merges = []
+    for chapter_jobs in (1, 2):
+        recorder = _Recorder()
+        process_book(epub, meta, backend="regex", chapter_jobs=chapter_jobs, observer=recorder)
+        merges.append([f["merges"] for name, f in recorder.events if name == "patch_rules"])
+    assert merges[0] and merges[1] == merges[0]
+
+
+def test_json_lines_log_replays_into_memory_observer(tmp_path, sample_book):
+    epub, meta = sample_book
+    log = str(tmp_path / "events.jsonl")
+    sink = pickle.loads(pickle.dumps(JsonLinesObserver(log)))
+    live = MemoryObserver()
+
+    class _Both(Observer):
+        def event(self, name, **fields):
+            sink.event(name, **fields)
+            live.event(name, **fields)
+
+    process_book(epub, meta, backend="regex", observer=_Both())
+    sink.close()
+    with open(log, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[0]["event"] == "book_start" and "time" in records[0]
+    assert MemoryObserver.from_jsonl(log).summary() == live.summary()
+
+
+def test_observer_without_event_fails_at_construction():
+    class _Incomplete(Observer):
+        pass
+
+    with pytest.raises(TypeError):
+        _Incomplete()
@@ -0,0 +1,104 @@
+"""Tests for process-pool helpers."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.parallel import imap_ordered, resolve_jobs
+
+
+def _square(x):
+    return x * x
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(None) == 1
+    assert resolve_jobs(1) == 1
+    assert resolve_jobs(4) == 4
+    assert resolve_jobs(0) >= 1
+    with pytest.raises(ValueError):
+        resolve_jobs(-3)
+
+
+def test_cli_rejects_negative_jobs(capsys):
+    from book_sbd.cli import main
+
+    for argv in (
+        ["batch", "epubs", "--jobs", "-3"],
+        ["run", "book.epub", "--chapter-jobs", "-1"],
+        ["validate", "output", "--jobs", "-5"],
+        ["eval", "gold", "--jobs", "-2"],
+    ):
+        with pytest.raises(SystemExit):
+            main(argv)
+        assert "must be 0 or more" in capsys.readouterr().err
+
+
+def test_imap_ordered_serial():
+    assert list(imap_ordered(_square, range(5), jobs=1)) == [0, 1, 4, 9, 16]
+
+
+def test_imap_ordered_parallel_preserves_order():
+    items = list(range(40))
+    serial = list(imap_ordered(_square, items, jobs=1))
+    parallel = list(imap_ordered(_square, items, jobs=4))
+    assert parallel == serial
+
+
+class _LineSegmenter:
+    """Picklable stand-in segmenter: one span per non-empty paragraph."""
+
+    def segment(self, text):
+        spans = []
+        pos = 0
+        for part in text.split("\n\n"):
+            if part.strip():
+                spans.append((pos, pos + len(part)))
+            pos += len(part) + 2
+        return spans
+
+
+def test_process_chapters_shared_matches_serial():
+    from book_sbd.pipeline import process_chapter
+    from book_sbd.parallel import process_chapters_shared
+
+    texts = [
+        f"Chapter {i} opens here.\r\n\r\nIt goes on “quietly” — café.  End."
+        for i in range(12)
+    ]
+    segmenter = _LineSegmenter()
+    serial = [process_chapter(t, segmenter) for t in texts]
+    parallel = process_chapters_shared(texts, segmenter, jobs=3)
+    assert parallel == serial
+
+
+def test_process_chapters_shared_sums_rule_counts():
+    from book_sbd.pipeline import process_chapter
+    from book_sbd.parallel import process_chapters_shared
+    from book_sbd.segment.regex_backend import RegexSegmenter
+
+    texts = [
+        f"Part {i}. “Oh dear! Oh dear! I shall be late!” she said. Then Mr. Smith ran."
+        for i in range(6)
+    ]
+    segmenter = RegexSegmenter()
+    serial_counts = {}
+    serial = [process_chapter(t, segmenter, serial_counts) for t in texts]
+    parallel_counts = {}
+    assert process_chapters_shared(texts, segmenter, jobs=3, rule_counts=parallel_counts) == serial
+    assert parallel_counts == serial_counts
+    assert sum(serial_counts.values()) > 0
+
+
+def test_book_pools_reject_in_memory_observers():
+    import pytest
+    from book_sbd.observe import JsonLinesObserver, MemoryObserver
+    from book_sbd.parallel import _check_observers
+
+    jobs = [("a.epub", "a_meta.json", {"observer": MemoryObserver()})]
+    _check_observers(jobs, 1)
+    with pytest.raises(ValueError, match="MemoryObserver"):
+        _check_observers(jobs, 2)
+    _check_observers([("a.epub", "a_meta.json", {"observer": JsonLinesObserver("x")})], 2)
+    _check_observers([("a.epub", "a_meta.json", {})], 2)
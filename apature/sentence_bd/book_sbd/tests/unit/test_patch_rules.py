@@ -1,10 +1,16 @@
 """Tests for patch rules: positive fix, negative control, edge case per rule."""
 
-import sys, os
+import sys, os, random, re
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
 from book_sbd.segment.patch_rules import (
+    _merge_pass,
+    ABBREVIATIONS,
+    BOUNDARY_RULES,
+    BoundaryRule,
+    QuoteIndex,
     apply_patch_rules,
+    merge_boundaries,
     _merge_abbreviation_splits,
     _merge_closing_quotes,
     _merge_ellipsis_splits,
@@ -153,6 +159,111 @@ class TestApplyAll:
         assert result == spans
 
 
+def _reference_local_passes(text, spans):
+    """The local rules as four separate passes, as they were written before
+    merge_boundaries fused them; kept to pin down identical output."""
+    abbrevs = {a.lower() for a in ABBREVIATIONS}
+    closing = re.compile(r'^[\s\'""\u201c\u201d\u2018\u2019)\]}>.,;:!?\-]+$')
+
+    def abbreviation(prev, curr):
+        prev = prev.rstrip().lower()
+        curr = curr.lstrip()
+        return bool(curr) and curr[0].islower() and any(prev.endswith(a) for a in abbrevs)
+
+    def closing_quote(prev, curr):
+        return len(curr.strip()) <= 4 and bool(closing.match(curr.strip()))
+
+    def ellipsis(prev, curr):
+        prev, curr = prev.rstrip(), curr.lstrip()
+        return (prev.endswith("...") or prev.endswith("\u2026")) and bool(curr) and curr[0].islower()
+
+    def exclamation(prev, curr):
+        prev, curr = prev.rstrip(), curr.lstrip()
+        return prev.endswith("!") and bool(curr) and curr[0].islower()
+
+    for rule in (abbreviation, closing_quote, ellipsis, exclamation):
+        if len(spans) <= 1:
+            return spans
+        merged = [spans[0]]
+        for curr_s, curr_e in spans[1:]:
+            prev_s, prev_e = merged[-1]
+            if rule(text[prev_s:prev_e], text[curr_s:curr_e]):
+                merged[-1] = (prev_s, curr_e)
+            else:
+                merged.append((curr_s, curr_e))
+        spans = merged
+    return spans
+
+
+_TOKENS = [
+    "Mr.", "mr.", "M", "r.", ".", "...", "\u2026", "!", "?", "\u201d", "\u201c",
+    '"', ")", "and", "The", "so", " ", "\n", "i.e.", "e.", "Dept.", "Oh", "\t",
+]
+
+
+class TestBoundaryEngine:
+    """merge_boundaries: one pass, same spans as the separate rule passes."""
+
+    def test_matches_separate_passes(self):
+        rng = random.Random(16)
+        for _ in range(5000):
+            text = "".join(
+                rng.choice(_TOKENS) + rng.choice(["", " "]) for _ in range(rng.randint(1, 25))
+            )
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(2, 10))))
+            spans = [(a + (rng.random() < 0.3), b) for a, b in zip(cuts, cuts[1:])]
+            spans = [(a, b) for a, b in spans if a < b]
+            assert merge_boundaries(text, spans) == _reference_local_passes(text, spans), (text, spans)
+
+    def test_later_rule_sees_only_its_own_merges(self):
+        # The closing-quote merge of "." must not let the abbreviation rule,
+        # which runs first, see "Mr." at the next boundary
+        text = "Ask Mr. and so"
+        spans = [(0, 6), (6, 7), (8, 14)]
+        assert merge_boundaries(text, spans) == [(0, 7), (8, 14)]
+
+    def test_whitespace_only_span(self):
+        text = "Wait... \n and then"
+        spans = [(0, 7), (7, 10), (11, 19)]
+        assert merge_boundaries(text, spans) == _reference_local_passes(text, spans)
+
+    def test_counts_match_separate_passes(self):
+        rng = random.Random(25)
+        for _ in range(2000):
+            text = "".join(
+                rng.choice(_TOKENS) + rng.choice(["", " "]) for _ in range(rng.randint(1, 25))
+            )
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(2, 10))))
+            spans = [(a, b) for a, b in zip(cuts, cuts[1:]) if a < b]
+            counts = {}
+            assert merge_boundaries(text, spans, counts=counts) == merge_boundaries(text, spans)
+            expected, passed = {}, spans
+            for rule in BOUNDARY_RULES:
+                merged = _merge_pass(text, passed, rule.should_merge)
+                expected[rule.name] = len(passed) - len(merged)
+                passed = merged
+            assert counts == expected, (text, spans)
+
+    def test_apply_patch_rules_counts_every_merge(self):
+        text = "\u201cOh dear! Oh dear! I shall be late!\u201d she said... and ran. Mr. smith!"
+        spans = [(0, 9), (10, 18), (19, 36), (37, 48), (49, 57), (58, 61), (62, 68)]
+        counts = {"ellipsis": 5}
+        patched = apply_patch_rules(text, spans, counts=counts)
+        assert patched == apply_patch_rules(text, spans)
+        assert set(counts) == {rule.name for rule in BOUNDARY_RULES} | {"quoted_discourse", "short_verse"}
+        assert patched == [(0, 36), (37, 57), (58, 68)]
+        assert counts["ellipsis"] == 6 and counts["abbreviation"] == 1
+        assert counts["quoted_discourse"] == 2
+        assert sum(counts.values()) - 5 == len(spans) - len(patched)
+
+    def test_custom_rule_joins_the_pass(self):
+        text = "See p. 4 for details. Then stop."
+        spans = [(0, 6), (7, 21), (22, 32)]
+        page_ref = BoundaryRule("page", lambda b: b.prev_endswith(" p.") and b.next_char.isdigit())
+        assert apply_patch_rules(text, spans) == spans
+        assert apply_patch_rules(text, spans, rules=BOUNDARY_RULES + (page_ref,)) == [(0, 21), (22, 32)]
+
+
 class TestQuotedDiscourseRule:
     """Merge splits inside continuous quoted speech/thought."""
 
@@ -273,3 +384,31 @@ class TestShortVerseConsolidation:
         block_meta = [{"type": "verse", "start": 0, "end": 20}]
         result = _consolidate_short_verse_blocks(text, spans, block_meta)
         assert len(result) == 1
+
+
+class TestQuoteIndex:
+    """Prefix-sum quote depth matches counting quotes in the paragraph."""
+
+    def test_depth_and_breaks_match_direct_counts(self):
+        rng = random.Random(17)
+        for _ in range(300):
+            text = "".join(rng.choice(["\u201c", "\u201d", "a", " ", "\n", "\n\n"]) for _ in range(40))
+            quotes = QuoteIndex(text)
+            for _ in range(20):
+                start = rng.randint(0, len(text) + 2)
+                end = rng.randint(start, len(text) + 4)
+                para_break = text.rfind("\n\n", 0, start)
+                local = text[para_break + 2 if para_break != -1 else 0:end]
+                assert quotes.depth(start, end) == local.count("\u201c") - local.count("\u201d")
+                assert quotes.break_between(start, end) == ("\n\n" in text[start:end])
+
+    def test_long_dialogue_paragraph(self):
+        text = "He said, \u201c" + " ".join("Oh dear! Not again!" for _ in range(500)) + "\u201d Then he left."
+        spans, start = [], 0
+        for end in [i + 1 for i, ch in enumerate(text) if ch == "!"] + [len(text)]:
+            while text[start] == " ":
+                start += 1
+            spans.append((start, end))
+            start = end
+        assert len(spans) == 1001
+        assert _merge_quoted_discourse(text, spans) == [(0, len(text))]
@@ -0,0 +1,72 @@
+"""Tests for Punkt tokenizer loading and its on-disk parameter cache."""
+
+import sys, os, json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+pytest.importorskip("nltk")
+
+from book_sbd.segment import punkt_backend
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("BOOK_SBD_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(punkt_backend, "_tokenizers", {})
+    return tmp_path
+
+
+def _params(tokenizer):
+    return punkt_backend._params_to_json(tokenizer._params)
+
+
+def test_cache_is_plain_json_and_reloads_same_params(cache_home):
+    fresh = punkt_backend.load_tokenizer()
+    path = punkt_backend._cache_path("english")
+    assert path.startswith(str(cache_home)) and path.endswith(".json")
+    with open(path, "r", encoding="utf-8") as f:
+        cached = json.load(f)
+    assert cached["params"] == _params(fresh)
+    assert not [name for name in os.listdir(cache_home) if name.endswith(".pickle")]
+
+    punkt_backend._tokenizers.clear()
+    reloaded = punkt_backend.load_tokenizer()
+    assert reloaded is not fresh
+    assert _params(reloaded) == _params(fresh)
+    text = "Mr. Smith left. He came back at 3 p.m. on Monday."
+    assert list(reloaded.span_tokenize(text)) == list(fresh.span_tokenize(text))
+
+
+def test_stale_or_corrupt_cache_is_rebuilt(cache_home):
+    expected = _params(punkt_backend.load_tokenizer())
+    path = punkt_backend._cache_path("english")
+    for content in ("not json", json.dumps({"signature": [], "params": {"abbrev_types": ["x"]}})):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        punkt_backend._tokenizers.clear()
+        assert _params(punkt_backend.load_tokenizer()) == expected
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f)["params"] == expected
+
+
+def test_fingerprint_covers_model_params_and_nltk_version(cache_home, monkeypatch):
+    from book_sbd.pipeline import stage_fingerprints
+
+    monkeypatch.setattr(punkt_backend, "_param_hashes", {})
+    segmenter = punkt_backend.PunktSegmenter()
+    before = stage_fingerprints("dracula", segmenter)
+    assert segmenter.fingerprint()["language"] == "english"
+
+    # Same code and settings, different punkt_tab data: the baseline (and
+    # everything downstream) must be recomputed
+    punkt_backend._param_hashes.clear()
+    punkt_backend.load_tokenizer()._params.abbrev_types.add("zz")
+    after = stage_fingerprints("dracula", segmenter)
+    assert after["canonical"] == before["canonical"]
+    assert after["baseline"] != before["baseline"]
+    assert after["spans"] != before["spans"]
+
+    punkt_backend._param_hashes.clear()
+    monkeypatch.setattr(punkt_backend, "_nltk_version", lambda: "0.0")
+    assert stage_fingerprints("dracula", segmenter)["baseline"] != after["baseline"]
@@ -0,0 +1,121 @@
+"""Tests for the regex segmenter backend and backend selection."""
+
+import sys, os, random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.segment.base import SEGMENTER_BACKENDS, get_segmenter
+from book_sbd.segment.regex_backend import RegexSegmenter
+
+from .test_cli_startup import _loaded_modules
+
+
+_TOKENS = [
+    "Mr.", "Dr.", "J.", "word", "Word", "it", "The", "42", "end.", "Stop!",
+    "why?", "wait...", "so…", "“Hello.”", "“Yes!”", "(see",
+    "p.", "e.g.", " ", "\n", "\n\n", "\n \n", "\t",
+]
+
+
+def _sentences(text):
+    return [text[s:e] for s, e in RegexSegmenter().segment(text)]
+
+
+def _assert_contract(text, spans):
+    prev_end = 0
+    for start, end in spans:
+        assert prev_end <= start < end <= len(text)
+        assert text[start:end] == text[start:end].strip()
+        assert not text[prev_end:start].strip()
+        prev_end = end
+    assert not text[prev_end:].strip()
+
+
+def test_span_contract_on_random_text():
+    rng = random.Random(19)
+    segmenter = RegexSegmenter()
+    for _ in range(2000):
+        text = " ".join(rng.choice(_TOKENS) for _ in range(rng.randint(0, 25)))
+        _assert_contract(text, segmenter.segment(text))
+
+
+def test_splits_on_terminal_punctuation():
+    assert _sentences("  It rained. Then it stopped! Did it? Yes… Fine.  ") == [
+        "It rained.", "Then it stopped!", "Did it?", "Yes…", "Fine.",
+    ]
+
+
+def test_closing_quotes_stay_with_sentence():
+    assert _sentences("“Run!” he said. “Now.” She ran.") == [
+        "“Run!” he said.", "“Now.”", "She ran.",
+    ]
+
+
+def test_abbreviations_and_initials_do_not_split():
+    assert _sentences("Mr. Smith met J. R. Hartley, i.e. Dr. Watson, at noon. They left.") == [
+        "Mr. Smith met J. R. Hartley, i.e. Dr. Watson, at noon.", "They left.",
+    ]
+    assert _sentences("He left at noon. Mr. Smith stayed.") == [
+        "He left at noon.", "Mr. Smith stayed.",
+    ]
+
+
+def test_custom_abbreviations():
+    text = "Ask Mme. Duval. She knows."
+    assert len(RegexSegmenter().segment(text)) == 3
+    assert len(RegexSegmenter(abbreviations=["MME."]).segment(text)) == 2
+
+
+def test_lowercase_continuation_does_not_split():
+    assert _sentences("Wait... then go. Alas! said he.") == ["Wait... then go.", "Alas! said he."]
+
+
+def test_paragraph_break_always_splits():
+    assert _sentences("A heading\n\nbody text here\n \n  More text.") == [
+        "A heading", "body text here", "More text.",
+    ]
+    assert _sentences("One line\nand the next.") == ["One line\nand the next."]
+
+
+def test_empty_and_blank_text():
+    assert RegexSegmenter().segment("") == []
+    assert RegexSegmenter().segment(" \n\n\t ") == []
+
+
+def test_segment_many_matches_segment():
+    texts = ["", "One. Two.", "Mr. Smith left.\n\nHe came back!", " \n "]
+    segmenter = RegexSegmenter()
+    assert segmenter.segment_many(texts) == [segmenter.segment(t) for t in texts]
+    assert segmenter.segment_many(iter(texts)) == segmenter.segment_many(texts)
+
+
+def test_punkt_segment_many_matches_segment():
+    pytest.importorskip("nltk")
+    segmenter = get_segmenter("punkt")
+    texts = ["", "It rained. Then it stopped.", "A heading\n\nBody text. More\n\n\nend", "  \n\n "]
+    assert segmenter.segment_many(texts) == [segmenter.segment(t) for t in texts]
+    assert segmenter.segment(texts[2]) == [(0, 9), (11, 21), (22, 26), (29, 32)]
+
+
+def test_get_segmenter():
+    assert SEGMENTER_BACKENDS == ("punkt", "regex")
+    assert isinstance(get_segmenter("regex"), RegexSegmenter)
+    assert get_segmenter("regex", abbreviations=["x."])._abbreviations == {"x."}
+    with pytest.raises(ValueError, match="unknown segmenter backend"):
+        get_segmenter("spacy")
+
+
+def test_regex_backend_does_not_load_nltk():
+    mods = _loaded_modules("from book_sbd.segment.base import get_segmenter; get_segmenter('regex')")
+    assert "nltk" not in mods
+    assert "book_sbd.segment.punkt_backend" not in mods
+
+
+def test_backends_have_distinct_fingerprints():
+    from book_sbd.pipeline import stage_fingerprints
+    punkt = stage_fingerprints("dracula", get_segmenter("punkt"))
+    regex = stage_fingerprints("dracula", get_segmenter("regex"))
+    assert punkt["canonical"] == regex["canonical"]
+    assert punkt["baseline"] != regex["baseline"]
+    assert stage_fingerprints("dracula", RegexSegmenter(["x."]))["baseline"] != regex["baseline"]
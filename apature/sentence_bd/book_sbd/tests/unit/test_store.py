@@ -0,0 +1,71 @@
+"""Tests for the mmap sentence store."""
+
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+import pytest
+
+from book_sbd.store import BookStore, SentenceStore, export_store
+
+
+def _book(slug):
+    chapters = []
+    for c, parts in enumerate([
+        [("Café — “naïve” résumé.", "prose"), ("Second 🙂 one.", "prose"), ("Third.", "prose")],
+        [],
+        [("Roses are red\nviolets are blue", "verse")],
+    ], start=1):
+        text = "  ".join(p for p, _t in parts)
+        sentences, pos = [], 0
+        for i, (part, sent_type) in enumerate(parts, start=1):
+            sentences.append({"number": i, "text": part, "type": sent_type,
+                              "start": pos, "end": pos + len(part), "char_len": len(part)})
+            pos += len(part) + 2
+        chapters.append({"number": c, "label": None if c == 2 else f"Ch {c}",
+                         "canonical_text": text, "sentences": sentences})
+    return {"slug": slug, "meta": {"title": "T"}, "processed_chapters": chapters}
+
+
+def test_lookup_ranges_and_iteration(tmp_path):
+    book = _book("mixed")
+    export_store(book, str(tmp_path))
+    with SentenceStore(str(tmp_path)) as store:
+        assert store.slugs() == ["mixed"]
+        assert store.sentence("mixed", 1, 2) == "Second 🙂 one."
+        assert store.sentences("mixed", 1, 2, 4) == ["Second 🙂 one.", "Third."]
+        assert list(store.iter_chapter("mixed", 2)) == []
+        assert list(store.iter_chapter("mixed", 3)) == ["Roses are red\nviolets are blue"]
+
+        mixed = store.book("mixed")
+        assert mixed.chapter_count == 3 and mixed.sentence_count == 4
+        assert mixed.metadata["labels"] == ["Ch 1", None, "Ch 3"]
+        for ch in book["processed_chapters"]:
+            assert list(mixed.records(ch["number"])) == ch["sentences"]
+
+
+def test_out_of_range(tmp_path):
+    export_store(_book("mixed"), str(tmp_path))
+    with BookStore(os.path.join(str(tmp_path), "store", "mixed.sbd")) as store:
+        with pytest.raises(IndexError):
+            store.sentence(1, 4)
+        with pytest.raises(IndexError):
+            store.sentence(4, 1)
+        with pytest.raises(IndexError):
+            store.sentence(2, 1)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.sbd"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        BookStore(str(path))
+
+
+def test_store_file_mode_matches_json_export(tmp_path):
+    from book_sbd.export import export_book
+
+    book = _book("mixed")
+    json_path = export_book(book, str(tmp_path))
+    store_path = export_store(book, str(tmp_path))
+    assert os.stat(store_path).st_mode & 0o777 == os.stat(json_path).st_mode & 0o777
+    assert os.listdir(os.path.dirname(store_path)) == ["mixed.sbd"]
@@ -0,0 +1,75 @@
+"""Tests for text mode block metadata and its interval index."""
+
+import sys, os, json, pickle, random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from book_sbd.segment.text_modes import (
+    BlockIndex,
+    apply_text_modes,
+    as_block_index,
+    get_sentence_type,
+)
+
+
+def _linear_find(blocks, pos):
+    for meta in blocks:
+        if meta["start"] <= pos < meta["end"]:
+            return meta
+    return None
+
+
+def _random_blocks(rng, count):
+    blocks, pos = [], 0
+    for _ in range(count):
+        pos += rng.randint(0, 3)
+        end = pos + rng.randint(1, 20)
+        blocks.append({"type": rng.choice(["prose", "verse"]), "start": pos, "end": end})
+        pos = end
+    return blocks
+
+
+def test_find_matches_linear_scan():
+    rng = random.Random(15)
+    for count in (0, 1, 2, 5, 50):
+        blocks = _random_blocks(rng, count)
+        index = BlockIndex(blocks)
+        limit = blocks[-1]["end"] + 3 if blocks else 3
+        for pos in range(-1, limit):
+            assert index.find(pos) == _linear_find(blocks, pos), (count, pos)
+
+
+def test_unsorted_input_is_sorted():
+    blocks = [{"type": "verse", "start": 10, "end": 20}, {"type": "prose", "start": 0, "end": 8}]
+    index = BlockIndex(blocks)
+    assert [meta["start"] for meta in index] == [0, 10]
+    assert index.find(9) is None
+    assert index.find(15)["type"] == "verse"
+
+
+def test_index_round_trips_as_plain_list():
+    _text, index = apply_text_modes("First para.\n\nOne\nTwo\nThree\nFour")
+    assert isinstance(index, BlockIndex)
+    assert json.loads(json.dumps(index)) == list(index)
+    restored = pickle.loads(pickle.dumps(index))
+    assert isinstance(restored, BlockIndex) and restored == index
+    assert restored.find(20) == index.find(20)
+
+
+def test_as_block_index_reuses_index():
+    index = BlockIndex([{"type": "prose", "start": 0, "end": 5}])
+    assert as_block_index(index) is index
+    assert as_block_index(None) == []
+    assert as_block_index(list(index)).find(2) == index.find(2)
+
+
+def test_get_sentence_type_accepts_list_or_index():
+    text, index = apply_text_modes(
+        "A prose opening sentence that runs on for a while.\n\n"
+        "Twinkle, twinkle, little bat!\nHow I wonder what you’re at!\n"
+        "Up above the world you fly,\nLike a tea-tray in the sky."
+    )
+    verse_start = text.index("Twinkle")
+    for blocks in (index, list(index)):
+        assert get_sentence_type(0, 10, blocks) == "prose"
+        assert get_sentence_type(verse_start, len(text), blocks) == "verse"
+        assert get_sentence_type(len(text) + 5, len(text) + 9, blocks) == "prose"